@@ -5,7 +5,6 @@ Audio detection engine with feature extraction and classification.
 import json
 import logging
 import pickle
-import struct
 import threading
 import time
 import wave
@@ -37,30 +36,87 @@ except ImportError:
 
 _DEFAULT_TRAINING_DIR = Path.home() / "GolfSwings" / "training_data"
 
+# Positions in the feature vector returned by AudioFeatureExtractor.extract()
+IDX_RMS = 0
+IDX_PEAK = 1
+IDX_CREST = 2
+IDX_ZCR = 3
+IDX_CENTROID = 4
+IDX_ROLLOFF = 5
+IDX_E_0_500 = 6
+IDX_E_500_2K = 7
+IDX_E_2K_6K = 8
+IDX_E_6K_PLUS = 9
+IDX_IMPACT = 10
+IDX_RISE = 11
+NUM_FEATURES = 12
+
 
 # ============================================================================
 # Audio Feature Extraction
 # ============================================================================
 
 class AudioFeatureExtractor:
-    """Extracts 12 features from audio chunks using numpy FFT."""
+    """Extracts 12 features from audio chunks using numpy FFT.
+
+    Features are returned as a float32 vector in FEATURE_KEYS order; use
+    as_dict() where named values are needed (metadata JSON, signals).
+    """
+
+    FEATURE_KEYS = (
+        "rms", "peak", "crest_factor", "zcr",
+        "spectral_centroid", "spectral_rolloff",
+        "energy_0_500", "energy_500_2k", "energy_2k_6k", "energy_6k_plus",
+        "impact_ratio", "rise_time",
+    )
+
+    # Value for a key absent from a dict; a missing rise_time means "no
+    # attack", which must not read as the fastest possible rise
+    MISSING_DEFAULTS = {"rise_time": 9999.0}
 
     def __init__(self, sample_rate: int = 44100):
         self.sample_rate = sample_rate
 
-    def extract(self, samples: np.ndarray) -> Dict[str, float]:
+    @classmethod
+    def as_dict(cls, features: np.ndarray) -> Dict[str, float]:
+        """Convert a feature vector to a {name: value} dict."""
+        return dict(zip(cls.FEATURE_KEYS, features.tolist()))
+
+    @classmethod
+    def from_dict(cls, features: Dict[str, float]) -> np.ndarray:
+        """Build a feature vector from a {name: value} dict.
+
+        Missing keys are 0, except rise_time, which defaults to 9999.
+        """
+        return np.array([features.get(k, cls.MISSING_DEFAULTS.get(k, 0.0)) for k in cls.FEATURE_KEYS],
+                        dtype=np.float32)
+
+    def extract(self, samples: np.ndarray) -> np.ndarray:
         """Extract features from a numpy array of audio samples (float, normalized -1 to 1)."""
+        out = self.extract_time(samples)
+        if len(samples) > 0:
+            self.extract_spectral(samples, out)
+        return out
+
+    def extract_time(self, samples: np.ndarray) -> np.ndarray:
+        """Compute the cheap time-domain features (rms, peak, crest, zcr, rise time).
+
+        Returns a full feature vector with the spectral slots left at zero;
+        pass it to extract_spectral() to complete it.
+        """
+        out = np.zeros(NUM_FEATURES, dtype=np.float32)
         if len(samples) == 0:
-            return self._empty_features()
+            return out
 
-        samples_f = samples.astype(np.float64)
+        samples_f = np.asarray(samples, dtype=np.float64)
         n = len(samples_f)
 
         # 1. RMS
         rms = np.sqrt(np.mean(samples_f ** 2))
 
         # 2. Peak amplitude
-        peak = np.max(np.abs(samples_f))
+        abs_samples = np.abs(samples_f)
+        peak = np.max(abs_samples)
 
         # 3. Crest factor (peak/RMS) - key for impulsive sounds
         crest_factor = min(peak / rms, 100.0) if rms > 1e-10 else 0.0
@@ -69,6 +125,25 @@ class AudioFeatureExtractor:
         sign_changes = np.diff(np.sign(samples_f))
         zcr = np.sum(sign_changes != 0) / n
 
+        # 12. Rise time (samples from 10% to 90% of peak)
+        threshold_10 = peak * 0.1
+        threshold_90 = peak * 0.9
+        idx_10 = np.argmax(abs_samples >= threshold_10) if np.any(abs_samples >= threshold_10) else 0
+        idx_90 = np.argmax(abs_samples >= threshold_90) if np.any(abs_samples >= threshold_90) else n
+        rise_time = max(0, idx_90 - idx_10)
+
+        out[IDX_RMS] = rms
+        out[IDX_PEAK] = peak
+        out[IDX_CREST] = crest_factor
+        out[IDX_ZCR] = zcr
+        out[IDX_RISE] = rise_time
+        return out
+
+    def extract_spectral(self, samples: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Fill the FFT-based feature slots of out in place and return it."""
+        samples_f = np.asarray(samples, dtype=np.float64)
+        n = len(samples_f)
+
         # FFT for spectral features
         fft_vals = np.fft.rfft(samples_f)
         magnitudes = np.abs(fft_vals)
@@ -105,36 +180,14 @@ class AudioFeatureExtractor:
         # 11. Impact band ratio (2-6kHz / total)
         impact_ratio = e_2k_6k / total_energy
 
-        # 12. Rise time (samples from 10% to 90% of peak)
-        abs_samples = np.abs(samples_f)
-        threshold_10 = peak * 0.1
-        threshold_90 = peak * 0.9
-        idx_10 = np.argmax(abs_samples >= threshold_10) if np.any(abs_samples >= threshold_10) else 0
-        idx_90 = np.argmax(abs_samples >= threshold_90) if np.any(abs_samples >= threshold_90) else n
-        rise_time = max(0, idx_90 - idx_10)
-
-        return {
-            "rms": rms,
-            "peak": peak,
-            "crest_factor": crest_factor,
-            "zcr": zcr,
-            "spectral_centroid": spectral_centroid,
-            "spectral_rolloff": spectral_rolloff,
-            "energy_0_500": e_0_500 / total_energy,
-            "energy_500_2k": e_500_2k / total_energy,
-            "energy_2k_6k": e_2k_6k / total_energy,
-            "energy_6k_plus": e_6k_plus / total_energy,
-            "impact_ratio": impact_ratio,
-            "rise_time": rise_time,
-        }
-
-    def _empty_features(self) -> Dict[str, float]:
-        return {k: 0.0 for k in [
-            "rms", "peak", "crest_factor", "zcr",
-            "spectral_centroid", "spectral_rolloff",
-            "energy_0_500", "energy_500_2k", "energy_2k_6k", "energy_6k_plus",
-            "impact_ratio", "rise_time",
-        ]}
+        out[IDX_CENTROID] = spectral_centroid
+        out[IDX_ROLLOFF] = spectral_rolloff
+        out[IDX_E_0_500] = e_0_500 / total_energy
+        out[IDX_E_500_2K] = e_500_2k / total_energy
+        out[IDX_E_2K_6K] = e_2k_6k / total_energy
+        out[IDX_E_6K_PLUS] = e_6k_plus / total_energy
+        out[IDX_IMPACT] = impact_ratio
+        return out
 
 
 # ============================================================================
@@ -149,12 +202,36 @@ class AudioClassifier:
     2. Learned - RandomForest after 10+ labeled samples
     """
 
-    FEATURE_KEYS = [
-        "rms", "peak", "crest_factor", "zcr",
-        "spectral_centroid", "spectral_rolloff",
-        "energy_0_500", "energy_500_2k", "energy_2k_6k", "energy_6k_plus",
-        "impact_ratio", "rise_time",
-    ]
+    FEATURE_KEYS = AudioFeatureExtractor.FEATURE_KEYS
+
+    # Heuristic rules as (feature, lower, upper, points): a rule scores when
+    # lower < value < upper. Tiered rules are written as cumulative steps,
+    # e.g. crest factor >3/>4/>6 scores 0.05/0.15/0.25.
+    _HEURISTIC_RULES = (
+        # Crest factor: impulsive sounds have high crest factor (>4 is typical for impacts)
+        (IDX_CREST, 3.0, np.inf, 0.05),
+        (IDX_CREST, 4.0, np.inf, 0.10),
+        (IDX_CREST, 6.0, np.inf, 0.10),
+        # Impact band ratio (2-6kHz): golf ball hit concentrates energy here
+        (IDX_IMPACT, 0.08, np.inf, 0.05),
+        (IDX_IMPACT, 0.15, np.inf, 0.10),
+        (IDX_IMPACT, 0.3, np.inf, 0.10),
+        # Rise time: impacts have very fast rise (<50 samples at 44.1kHz ~ <1.1ms)
+        (IDX_RISE, -np.inf, 150, 0.05),
+        (IDX_RISE, -np.inf, 80, 0.05),
+        (IDX_RISE, -np.inf, 30, 0.10),
+        # ZCR: moderate for impacts
+        (IDX_ZCR, 0.05, 0.35, 0.10),
+        # Spectral centroid: golf impacts typically 1.5-5kHz
+        (IDX_CENTROID, 800, 7000, 0.05),
+        (IDX_CENTROID, 1500, 5000, 0.10),
+        # Low-frequency dominance penalty (voices, wind)
+        (IDX_E_0_500, 0.7, np.inf, -0.15),
+    )
+    _H_IDX = np.array([r[0] for r in _HEURISTIC_RULES], dtype=np.intp)
+    _H_LO = np.array([r[1] for r in _HEURISTIC_RULES], dtype=np.float64)
+    _H_HI = np.array([r[2] for r in _HEURISTIC_RULES], dtype=np.float64)
+    _H_PTS = np.array([r[3] for r in _HEURISTIC_RULES], dtype=np.float64)
 
     def __init__(self, training_dir: Path = None):
         self._model_lock = threading.Lock()
@@ -177,64 +254,22 @@ class AudioClassifier:
             except Exception as e:
                 logger.warning("Failed to load audio classifier: %s", e)
 
-    def classify(self, features: Dict[str, float]) -> float:
+    def classify(self, features: np.ndarray) -> float:
         """Return confidence 0.0 - 1.0 that this is a golf shot."""
         with self._model_lock:
             if self.mode == "learned" and self.model is not None:
                 return self._classify_learned(features)
         return self._classify_heuristic(features)
 
-    def _classify_heuristic(self, f: Dict[str, float]) -> float:
+    def _classify_heuristic(self, f: np.ndarray) -> float:
         """Score using hand-tuned rules. Threshold at 0.45."""
-        score = 0.0
-
-        # Crest factor: impulsive sounds have high crest factor (>4 is typical for impacts)
-        cf = f.get("crest_factor", 0)
-        if cf > 6:
-            score += 0.25
-        elif cf > 4:
-            score += 0.15
-        elif cf > 3:
-            score += 0.05
-
-        # Impact band ratio (2-6kHz): golf ball hit concentrates energy here
-        ir = f.get("impact_ratio", 0)
-        if ir > 0.3:
-            score += 0.25
-        elif ir > 0.15:
-            score += 0.15
-        elif ir > 0.08:
-            score += 0.05
-
-        # Rise time: impacts have very fast rise (<50 samples at 44.1kHz ~ <1.1ms)
-        rt = f.get("rise_time", 9999)
-        if rt < 30:
-            score += 0.20
-        elif rt < 80:
-            score += 0.10
-        elif rt < 150:
-            score += 0.05
-
-        # ZCR: moderate for impacts
-        zcr = f.get("zcr", 0)
-        if 0.05 < zcr < 0.35:
-            score += 0.10
-
-        # Spectral centroid: golf impacts typically 1.5-5kHz
-        sc = f.get("spectral_centroid", 0)
-        if 1500 < sc < 5000:
-            score += 0.15
-        elif 800 < sc < 7000:
-            score += 0.05
-
-        # Low-frequency dominance penalty (voices, wind)
-        if f.get("energy_0_500", 0) > 0.7:
-            score -= 0.15
-
+        v = f[self._H_IDX]
+        hits = (v > self._H_LO) & (v < self._H_HI)
+        score = float(self._H_PTS @ hits)
         return max(0.0, min(1.0, score))
 
-    def _classify_learned(self, features: Dict[str, float]) -> float:
-        X = np.array([[features.get(k, 0.0) for k in self.FEATURE_KEYS]])
+    def _classify_learned(self, features: np.ndarray) -> float:
+        X = features.reshape(1, -1)
         X_scaled = self.scaler.transform(X)
         proba = self.model.predict_proba(X_scaled)
         # Return probability of class 1 (shot)
@@ -283,8 +318,9 @@ class AudioClassifier:
             logger.info("Not enough training samples (%d/10). Staying in heuristic mode.", len(X_list))
             return False
 
-        X = np.array(X_list)
-        y = np.array(y_list)
+        # float32 halves the training matrix and keeps sklearn on its float32 path
+        X = np.asarray(X_list, dtype=np.float32)
+        y = np.asarray(y_list, dtype=np.int8)
 
         # Need both classes
         if len(set(y)) < 2:
@@ -294,7 +330,7 @@ class AudioClassifier:
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
 
-        model = RandomForestClassifier(n_estimators=50, random_state=42, max_depth=8)
+        model = RandomForestClassifier(n_estimators=50, random_state=42, max_depth=8, n_jobs=1)
         model.fit(X_scaled, y)
 
         # Save
@@ -324,7 +360,7 @@ class AudioClassifier:
 class AudioDetector(QThread):
     """Thread for detecting audio triggers with feature-based classification."""
 
-    trigger_detected = pyqtSignal(float, dict)  # confidence, features
+    trigger_detected = pyqtSignal(float, dict)  # confidence, features (by name)
     level_update = pyqtSignal(float)
 
     def __init__(self, config: AppConfig):
@@ -340,11 +376,22 @@ class AudioDetector(QThread):
         # Accumulate chunks for classification window (~93ms at 44.1kHz/1024)
         self._chunk_accumulator: List[np.ndarray] = []
         self._chunks_needed = 4
+        # Windows below this crest factor are never impacts; skip the FFT
+        self._min_crest_factor = 2.5
 
         # Rolling audio buffer (~1s) for saving snippets
         buffer_chunks = int(config.audio_sample_rate / config.audio_chunk_size)
         self._audio_ring = deque(maxlen=buffer_chunks)
 
+        # Preallocated int16 ring filled by the PortAudio callback. The
+        # callback is the only writer of _ring_written; run() is the only
+        # reader, so no lock is needed on the hot path.
+        self._ring_i16 = np.empty(config.audio_chunk_size * 16, dtype=np.int16)
+        self._ring_written = 0
+        self._data_ready = threading.Event()
+        self._cooldown_until = 0.0
+        self._cooldown_duration = 3.0
+
     def set_threshold(self, value: float):
         with self._lock:
             self.threshold = value
@@ -353,11 +400,36 @@ class AudioDetector(QThread):
         with self._lock:
             self.config.audio_device_index = index
 
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback — copy the block into the ring and wake run()."""
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        size = len(self._ring_i16)
+        pos = self._ring_written % size
+        n = min(len(samples), size)
+        first = min(n, size - pos)
+        self._ring_i16[pos:pos + first] = samples[:first]
+        if first < n:
+            self._ring_i16[:n - first] = samples[first:n]
+        self._ring_written += n
+        self._data_ready.set()
+        return (None, pyaudio.paContinue)
+
+    def _read_ring(self, pos: int, n: int) -> np.ndarray:
+        """Copy n samples starting at absolute position pos out of the ring."""
+        size = len(self._ring_i16)
+        start = pos % size
+        end = start + n
+        if end <= size:
+            return self._ring_i16[start:end].copy()
+        return np.concatenate((self._ring_i16[start:], self._ring_i16[:end - size]))
+
     def run(self):
         if not AUDIO_AVAILABLE:
             return
 
         self.running = True
+        self._ring_written = 0
+        self._data_ready.clear()
         p = pyaudio.PyAudio()
 
         try:
@@ -367,6 +439,8 @@ class AudioDetector(QThread):
                 "rate": self.config.audio_sample_rate,
                 "input": True,
                 "frames_per_buffer": self.config.audio_chunk_size,
+                "stream_callback": self._audio_callback,
+                "start": False,
             }
             with self._lock:
                 dev_idx = self.config.audio_device_index
@@ -374,87 +448,120 @@ class AudioDetector(QThread):
                 kwargs["input_device_index"] = dev_idx
 
             stream = p.open(**kwargs)
+            stream.start_stream()
         except Exception as e:
             logger.error("Audio error: %s", e)
             p.terminate()
             return
 
-        cooldown_time = 0
-        cooldown_duration = 3.0
+        chunk = self.config.audio_chunk_size
+        ring_size = len(self._ring_i16)
+        read_pos = 0
 
         try:
             while self.running:
-                try:
-                    data = stream.read(self.config.audio_chunk_size, exception_on_overflow=False)
-                    samples_int = struct.unpack(f"{len(data) // 2}h", data)
-                    samples = np.array(samples_int, dtype=np.float32) / 32768.0
-
-                    # RMS for level meter
-                    rms = np.sqrt(np.mean(samples ** 2))
-                    level = min(1.0, rms * 10)
-                    self.level_update.emit(level)
-
-                    # Store in ring buffer
-                    self._audio_ring.append(data)
-
-                    # RMS gate - skip classification if too quiet
-                    with self._lock:
-                        thresh = self.threshold
-                    if level < thresh * 0.5:
-                        self._chunk_accumulator.clear()
-                        continue
+                if not self._data_ready.wait(0.1):
+                    continue
+                self._data_ready.clear()
+
+                while self.running and self._ring_written - read_pos >= chunk:
+                    written = self._ring_written
+                    if written - read_pos > ring_size - chunk:
+                        # Fell behind the callback — skip to the newest chunk
+                        logger.debug("Audio ring overrun, dropping %d samples", written - chunk - read_pos)
+                        read_pos = written - chunk
+                    try:
+                        self._process_chunk(self._read_ring(read_pos, chunk))
+                    except Exception as e:
+                        logger.error("Audio processing error: %s", e)
+                    read_pos += chunk
+        finally:
+            stream.stop_stream()
+            stream.close()
+            p.terminate()
 
-                    # Accumulate chunks
-                    self._chunk_accumulator.append(samples)
+    def _process_chunk(self, chunk_i16: np.ndarray):
+        """Level-meter, gate and classify one chunk drawn from the ring."""
+        samples = chunk_i16.astype(np.float32) / 32768.0
 
-                    if len(self._chunk_accumulator) >= self._chunks_needed:
-                        combined = np.concatenate(self._chunk_accumulator)
-                        self._chunk_accumulator.clear()
+        # RMS for level meter
+        rms = np.sqrt(np.mean(samples ** 2))
+        level = min(1.0, rms * 10)
+        self.level_update.emit(level)
 
-                        features = self.extractor.extract(combined)
-                        confidence = self.classifier.classify(features)
+        # Store in ring buffer
+        self._audio_ring.append(chunk_i16)
 
-                        current_time = time.time()
-                        if confidence >= 0.45 and level >= thresh and current_time > cooldown_time:
-                            logger.info("Audio trigger: confidence=%.2f, rms=%.4f", confidence, rms)
-                            self.trigger_detected.emit(confidence, features)
-                            self._save_trigger_snippet(features, confidence)
-                            cooldown_time = current_time + cooldown_duration
+        # RMS gate - skip classification if too quiet
+        with self._lock:
+            thresh = self.threshold
+        if level < thresh * 0.5:
+            self._chunk_accumulator.clear()
+            return
 
-                except Exception as e:
-                    logger.error("Audio read error: %s", e)
-        finally:
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
+        # Accumulate chunks
+        self._chunk_accumulator.append(samples)
+
+        if len(self._chunk_accumulator) >= self._chunks_needed:
+            combined = np.concatenate(self._chunk_accumulator).astype(np.float64)
+            self._chunk_accumulator.clear()
+
+            # A trigger needs level >= thresh on this chunk, so quieter windows
+            # and non-impulsive ones (wind, voices) skip the FFT and classifier
+            if level < thresh:
+                return
+            features = self.extractor.extract_time(combined)
+            if features[IDX_CREST] < self._min_crest_factor:
+                return
+            self.extractor.extract_spectral(combined, features)
+            confidence = self.classifier.classify(features)
+
+            # Monotonic so a wall clock step cannot stretch or skip the cooldown
+            current_time = time.monotonic()
+            if confidence >= 0.45 and level >= thresh and current_time > self._cooldown_until:
+                logger.info("Audio trigger: confidence=%.2f, rms=%.4f", confidence, rms)
+                named = self.extractor.as_dict(features)
+                self.trigger_detected.emit(confidence, named)
+                self._save_trigger_snippet(named, confidence)
+                self._cooldown_until = current_time + self._cooldown_duration
+
+    def _save_trigger_snippet(self, features: Dict[str, float], confidence: float):
+        """Save audio snippet and metadata around trigger for training.
+
+        The ring is snapshotted here; disk I/O runs on a daemon thread so the
+        detection loop never blocks on it.
+        """
+        chunks = list(self._audio_ring)
+        meta = {
+            "timestamp": int(time.time() * 1000),
+            "confidence": confidence,
+            "features": features,
+            "label": 1,  # default: shot
+            "threshold": self.threshold,
+        }
+        threading.Thread(
+            target=self._write_trigger_snippet, args=(chunks, meta), daemon=True
+        ).start()
 
-    def _save_trigger_snippet(self, features: Dict, confidence: float):
-        """Save audio snippet and metadata around trigger for training."""
+    def _write_trigger_snippet(self, chunks: List[np.ndarray], meta: Dict):
         try:
             training_dir = self.config.training_data_dir
             training_dir.mkdir(parents=True, exist_ok=True)
-            timestamp = int(time.time() * 1000)
-            base_name = f"trigger_{timestamp}"
+            base_name = f"trigger_{meta['timestamp']}"
 
-            # Save WAV (default label: shot)
+            # Save WAV (default label: shot). Chunks are written as-is;
+            # wave patches the frame count into the header on close.
             wav_path = training_dir / f"{base_name}_shot.wav"
-            audio_data = b"".join(self._audio_ring)
-            if audio_data:
+            if chunks:
                 with wave.open(str(wav_path), "wb") as wf:
                     wf.setnchannels(1)
                     wf.setsampwidth(2)
                     wf.setframerate(self.config.audio_sample_rate)
-                    wf.writeframes(audio_data)
+                    for chunk in chunks:
+                        wf.writeframesraw(chunk)
 
             # Save metadata
             meta_path = training_dir / f"{base_name}_meta.json"
-            meta = {
-                "timestamp": timestamp,
-                "confidence": confidence,
-                "features": {k: float(v) for k, v in features.items()},
-                "label": 1,  # default: shot
-                "threshold": self.threshold,
-            }
             with open(meta_path, "w") as f:
                 json.dump(meta, f, indent=2)
 
@@ -514,10 +621,7 @@ class MicPreview(QThread):
                     break
                 try:
                     data = stream.read(self.chunk_size, exception_on_overflow=False)
-                    samples = np.array(
-                        struct.unpack(f"{len(data) // 2}h", data),
-                        dtype=np.float32,
-                    ) / 32768.0
+                    samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
                     rms = np.sqrt(np.mean(samples ** 2))
                     self.level_update.emit(min(1.0, rms * 10))
                 except Exception:
@@ -532,14 +636,32 @@ class MicPreview(QThread):
         self.running = False
 
 
+# Shared PortAudio instance for device enumeration. Initializing PortAudio
+# can take tens of ms (WASAPI), so it is created once and only rebuilt when
+# the user explicitly rescans.
+_pa_instance = None
+_pa_lock = threading.Lock()
+
+
+def _get_pa():
+    """Return the shared PyAudio instance, creating it on first use.
+
+    Caller must hold _pa_lock.
+    """
+    global _pa_instance
+    if _pa_instance is None:
+        _pa_instance = pyaudio.PyAudio()
+    return _pa_instance
+
+
 def enumerate_audio_devices() -> List[Dict]:
     """Return list of available audio input devices."""
     devices = []
     if not AUDIO_AVAILABLE:
         return devices
     try:
-        p = pyaudio.PyAudio()
-        try:
+        with _pa_lock:
+            p = _get_pa()
             for i in range(p.get_device_count()):
                 info = p.get_device_info_by_index(i)
                 if info.get("maxInputChannels", 0) > 0:
@@ -551,13 +673,25 @@ def enumerate_audio_devices() -> List[Dict]:
                         "sample_rate": int(info.get("defaultSampleRate", 44100)),
                         "is_virtual": _is_virtual_phone_mic(name),
                     })
-        finally:
-            p.terminate()
     except Exception as e:
         logger.warning("Failed to enumerate audio devices: %s", e)
     return devices
 
 
+def refresh_audio_devices() -> List[Dict]:
+    """Re-initialize PortAudio so hot-plugged devices appear, then enumerate."""
+    global _pa_instance
+    if AUDIO_AVAILABLE:
+        with _pa_lock:
+            if _pa_instance is not None:
+                try:
+                    _pa_instance.terminate()
+                except Exception as e:
+                    logger.debug("PortAudio terminate failed: %s", e)
+                _pa_instance = None
+    return enumerate_audio_devices()
+
+
 # Known virtual microphone device name patterns from phone camera apps
 _VIRTUAL_MIC_KEYWORDS = [
     "droidcam",
@@ -7,13 +7,18 @@ opencv-python from pip lacks FFMPEG HTTP streaming support.
 """
 
 import logging
+import errno
 import os
+import select
 import socket
+import sys
 import time
 import threading
 import urllib.request
 import urllib.error
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable
 
 import cv2
 import numpy as np
@@ -22,10 +27,23 @@ from PyQt6.QtCore import QThread, pyqtSignal
 # Tell FFMPEG to use TCP for RTSP (more reliable, less packet loss than UDP)
 os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", "rtsp_transport;tcp")
 
-from config import AppConfig, CameraPreset
+from config import AppConfig, CameraPreset, MODEL_DIR
 
 logger = logging.getLogger(__name__)
 
+# Make sure the SIMD HAL paths and OpenCV's internal thread pool are on
+# (HOG, resize and warpAffine all parallelize). One core is left for the
+# GUI. Thread counts only take effect on builds with TBB/OpenMP or the
+# default pthreads backend.
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(2, (os.cpu_count() or 2) - 1))
+
+# Route transforms through OpenCV's transparent API when an OpenCL device
+# exists (typically the integrated GPU).
+_OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+if _OPENCL_AVAILABLE:
+    cv2.ocl.setUseOpenCL(True)
+
 
 # ============================================================================
 # Fallback MJPEG HTTP Reader
@@ -44,7 +62,8 @@ class MJPEGCapture:
         self._stream = None
         self._opened = False
         self._busy = False
-        self._buffer = b""
+        self._buffer = bytearray()
+        self._jpeg = b""
         self._open()
 
     @property
@@ -87,17 +106,32 @@ class MJPEGCapture:
 
         Returns (success, frame) like cv2.VideoCapture.read().
         """
+        while self.grab():
+            ret, frame = self.retrieve()
+            if ret:
+                return True, frame
+            # Corrupt JPEG, try next frame
+            logger.debug("MJPEGCapture: corrupt JPEG frame (%d bytes), skipping", len(self._jpeg))
+        return False, None
+
+    def grab(self) -> bool:
+        """Pull the next complete JPEG off the stream without decoding it."""
         if not self._opened or self._stream is None:
-            return False, None
+            return False
 
         try:
-            # Read chunks until we find a complete JPEG (SOI + EOI markers)
+            # Read chunks until we find a complete JPEG (SOI + EOI markers).
+            # The buffer is a bytearray grown in place and only the new
+            # bytes are scanned for EOI, so a frame costs linear time under
+            # the GIL instead of re-copying and re-searching the buffer on
+            # every chunk.
             total_read = 0
+            scanned = 0  # leading bytes already searched for EOI by this grab
             while True:
                 chunk = self._stream.read(4096)
                 if not chunk:
                     logger.debug("MJPEGCapture: stream returned empty (read %d bytes total)", total_read)
-                    return False, None
+                    return False
                 total_read += len(chunk)
                 self._buffer += chunk
 
@@ -110,39 +144,45 @@ class MJPEGCapture:
                 soi = self._buffer.find(b"\xff\xd8")
                 if soi == -1:
                     # No JPEG start yet, trim buffer
-                    self._buffer = self._buffer[-2:]
+                    del self._buffer[:-2]
                     continue
 
-                eoi = self._buffer.find(b"\xff\xd9", soi + 2)
+                # Back up one byte in case a marker straddles two chunks
+                eoi = self._buffer.find(b"\xff\xd9", max(soi + 2, scanned - 1))
                 if eoi == -1:
                     # Have start but no end yet, keep reading
                     # Limit buffer to 5MB to prevent memory runaway
                     if len(self._buffer) > 5 * 1024 * 1024:
                         logger.debug("MJPEGCapture: buffer overflow (5MB), no complete frame found")
-                        self._buffer = b""
+                        self._buffer.clear()
+                    scanned = len(self._buffer)
                     continue
 
-                # Extract the complete JPEG
-                jpeg_data = self._buffer[soi:eoi + 2]
-                self._buffer = self._buffer[eoi + 2:]
-
-                # Decode JPEG to numpy array
-                arr = np.frombuffer(jpeg_data, dtype=np.uint8)
-                frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-                if frame is not None:
-                    return True, frame
-
-                # Corrupt JPEG, try next frame
-                logger.debug("MJPEGCapture: corrupt JPEG frame (%d bytes), skipping", len(jpeg_data))
+                # Keep the complete JPEG for retrieve()
+                self._jpeg = self._buffer[soi:eoi + 2]
+                del self._buffer[:eoi + 2]
+                return True
 
         except (urllib.error.URLError, OSError, ConnectionError) as e:
             logger.debug("MJPEGCapture: stream read error: %s", e)
             self._opened = False
-            return False, None
+            return False
         except Exception as e:
             logger.debug("MJPEGCapture: unexpected error: %s", e)
             self._opened = False
+            return False
+
+    def retrieve(self):
+        """Decode the JPEG taken by the last grab().
+
+        Returns (success, frame) like cv2.VideoCapture.retrieve(), but always
+        into a new array: cv2.imdecode can't decode into a given buffer.
+        """
+        if not self._jpeg:
             return False, None
+        arr = np.frombuffer(self._jpeg, dtype=np.uint8)
+        frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+        return frame is not None, frame
 
     def set(self, prop_id, value):
         """No-op for compatibility with cv2.VideoCapture.set()."""
@@ -156,7 +196,8 @@ class MJPEGCapture:
                 pass
             self._stream = None
         self._opened = False
-        self._buffer = b""
+        self._buffer = bytearray()
+        self._jpeg = b""
 
 
 # ============================================================================
@@ -164,9 +205,23 @@ class MJPEGCapture:
 # ============================================================================
 
 class CameraCapture(QThread):
-    """Thread for capturing video from a USB or network camera."""
+    """Thread for capturing video from a USB or network camera.
+
+    Transformed frames are written into a small ring of preallocated
+    buffers and frame_ready carries only the slot index; receivers fetch
+    the pixels with frame_at(). A slot is rewritten FRAME_RING_SIZE frames
+    later, so anything kept longer than that must be copied.
+
+    Only one frame is in flight to the display at a time: until the
+    receiver calls mark_frame_consumed(), newly captured frames are not
+    announced rather than queued behind a busy GUI thread. Every frame
+    still reaches the frame sink (see set_frame_sink()), which feeds the
+    pre-trigger buffer and recordings on this thread.
+    """
+
+    FRAME_RING_SIZE = 4
 
-    frame_ready = pyqtSignal(object, np.ndarray, float)  # camera_id (int or str), frame, timestamp
+    frame_ready = pyqtSignal(object, int, float)  # camera_id (int or str), ring slot, timestamp
     fps_update = pyqtSignal(object, float)  # camera_id, measured fps
     connection_state = pyqtSignal(object, str)  # camera_id, "connecting"|"connected"|"disconnected"
 
@@ -184,6 +239,17 @@ class CameraCapture(QThread):
         self._flip_h = self.preset.flip_h
         self._flip_v = self.preset.flip_v
 
+        self._use_opencl = _OPENCL_AVAILABLE
+        self._scratch: Optional[np.ndarray] = None
+        self._plan_cache: Dict[tuple, tuple] = {}
+
+        self._frame_ring: List[Optional[np.ndarray]] = [None] * self.FRAME_RING_SIZE
+        self._ring_index = 0
+        self._pending = threading.Event()
+        self.dropped_frames = 0  # frames the display skipped, not lost ones
+        self._frame_sink: Optional[Callable[[np.ndarray, float], None]] = None
+        self._sink_lock = threading.Lock()
+
     # --- Transform setters (thread-safe) ---
 
     def set_zoom(self, zoom: float):
@@ -202,6 +268,89 @@ class CameraCapture(QThread):
         with self._lock:
             self._flip_v = flip
 
+    def frame_at(self, slot: int) -> Optional[np.ndarray]:
+        """Return the frame buffer for a slot announced by frame_ready."""
+        return self._frame_ring[slot]
+
+    def mark_frame_consumed(self):
+        """Called by the frame_ready receiver once it is done with a frame."""
+        self._pending.clear()
+
+    def set_frame_sink(self, sink: Optional[Callable[[np.ndarray, float], None]]):
+        """Have sink(frame, timestamp) called on this thread for every
+        captured frame, including those the display skips.
+
+        The frame is a ring slot and must be copied to be kept. Once this
+        returns the previous sink is no longer running.
+        """
+        with self._sink_lock:
+            self._frame_sink = sink
+
+    def _process_grabbed(self, timestamp: float):
+        """Decode the grabbed frame if the sink or the display wants it.
+
+        Frames the display can't take yet are still fed to the sink; with no
+        sink they are grabbed to keep the stream moving but never retrieved.
+        """
+        display = not self._consumer_busy()
+        if not display and self._frame_sink is None:
+            return
+        transforms = self._transform_state()
+        ret, frame = self._retrieve_frame(transforms)
+        if not ret or frame is None:
+            return
+        # Unannounced slots are free to reuse, so a frame the display skips
+        # is simply overwritten by the next one
+        frame = self._apply_transforms(frame, into_ring=True, transforms=transforms)
+        with self._sink_lock:
+            sink = self._frame_sink
+            if sink is not None:
+                try:
+                    sink(frame, timestamp)
+                except Exception as e:
+                    logger.error("Camera %s: frame sink failed: %s", self.camera_id, e)
+        if display:
+            self._publish_frame(frame, timestamp)
+
+    def _consumer_busy(self) -> bool:
+        """True while the last announced frame hasn't been consumed."""
+        if self._pending.is_set():
+            self.dropped_frames += 1
+            return True
+        return False
+
+    def _slot_buffer(self, shape: tuple, dtype=np.uint8) -> np.ndarray:
+        """Buffer of the next ring slot, reallocated if the shape changed."""
+        slot = self._ring_index
+        buf = self._frame_ring[slot]
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self._frame_ring[slot] = np.empty(shape, dtype)
+        return buf
+
+    def _retrieve_frame(self, transforms: tuple) -> tuple:
+        """cap.retrieve() of the grabbed frame, decoding straight into the
+        next ring slot when no transform will replace the frame.
+
+        transforms is this frame's _transform_state(), the same tuple later
+        passed to _apply_transforms, so the two agree on whether the frame
+        already sits in the slot a transform would write to.
+        """
+        buf = self._frame_ring[self._ring_index]
+        if buf is not None and not isinstance(self.cap, MJPEGCapture) and self._is_identity(transforms):
+            return self.cap.retrieve(buf)
+        return self.cap.retrieve()
+
+    def _publish_frame(self, frame: np.ndarray, timestamp: float):
+        """Announce frame through the next ring slot, copying it in unless
+        it was produced there already."""
+        self._pending.set()
+        slot = self._ring_index
+        buf = self._slot_buffer(frame.shape, frame.dtype)
+        if frame is not buf:
+            np.copyto(buf, frame)
+        self._ring_index = (slot + 1) % self.FRAME_RING_SIZE
+        self.frame_ready.emit(self.camera_id, slot, timestamp)
+
     def run(self):
         self.running = True
         is_network = isinstance(self.camera_id, str)
@@ -215,7 +364,7 @@ class CameraCapture(QThread):
             # a new one.  Only applies to known DroidCam port.
             if ":4747/" in str(self.camera_id):
                 time.sleep(1.0)
-            self.cap = self._open_network_camera(self.camera_id)
+            self.cap = self._open_network_camera(self._stream_url())
         else:
             self.cap = self._open_usb_camera(self.camera_id)
 
@@ -251,36 +400,36 @@ class CameraCapture(QThread):
         if ret:
             logger.info("Camera %s: first frame OK (%dx%d)", self.camera_id, frame.shape[1], frame.shape[0])
             frame = self._apply_transforms(frame)
-            self.frame_ready.emit(self.camera_id, frame, time.time())
+            self._publish_frame(frame, time.time())
         else:
             logger.warning("Camera %s: first frame read FAILED", self.camera_id)
 
-        frame_interval = 1.0 / self.fps
+        frame_interval_ns = int(1e9 / self.fps)
+        next_deadline_ns = time.monotonic_ns()
         consecutive_failures = 0
         total_frames = 1 if ret else 0
 
         # FPS tracking
-        fps_interval_start = time.time()
+        fps_interval_start = time.monotonic()
         fps_frame_count = 0
         fps_log_interval = 5.0  # log FPS every 5 seconds
         self._current_fps = 0.0
 
         try:
             while self.running:
-                start_time = time.time()
-
-                # read() blocks until a frame arrives (network) or is captured (USB).
+                # grab() blocks until a frame arrives (network) or is captured (USB).
                 # With CAP_PROP_BUFFERSIZE=1 on network cameras, OpenCV only keeps
                 # the latest frame so we always get near-live video.
-                ret, frame = self.cap.read()
+                ret = self.cap.grab()
+                # Wall clock on purpose: triggers and clips are stamped with
+                # time.time() on the GUI side.
                 timestamp = time.time()
 
-                if ret and frame is not None:
+                if ret:
                     consecutive_failures = 0
                     total_frames += 1
                     fps_frame_count += 1
-                    frame = self._apply_transforms(frame)
-                    self.frame_ready.emit(self.camera_id, frame, timestamp)
+                    self._process_grabbed(timestamp)
                 else:
                     consecutive_failures += 1
                     if consecutive_failures == 1:
@@ -299,28 +448,34 @@ class CameraCapture(QThread):
                         consecutive_failures = 0
                         total_frames = 0
                         fps_frame_count = 0
-                        fps_interval_start = time.time()
+                        fps_interval_start = time.monotonic()
                     elif is_network:
                         # Small sleep on failure to avoid tight-looping
                         time.sleep(0.05)
 
                 # FPS calculation and logging
-                now = time.time()
+                now = time.monotonic()
                 elapsed_since_fps_log = now - fps_interval_start
                 if elapsed_since_fps_log >= fps_log_interval:
                     self._current_fps = fps_frame_count / elapsed_since_fps_log
-                    logger.info("Camera %s: %.1f FPS (frames: %d)", self.camera_id, self._current_fps, total_frames)
+                    logger.info("Camera %s: %.1f FPS (frames: %d, display skipped: %d)", self.camera_id,
+                                self._current_fps, total_frames, self.dropped_frames)
                     self.fps_update.emit(self.camera_id, self._current_fps)
                     fps_frame_count = 0
                     fps_interval_start = now
 
-                # Throttle USB cameras to target FPS; network streams are
-                # naturally paced by read() blocking on the next frame
+                # Pace USB cameras against a fixed monotonic schedule; network
+                # streams are naturally paced by read() blocking on the next
+                # frame, so they are always drained immediately.
                 if not is_network:
-                    elapsed = time.time() - start_time
-                    sleep_time = frame_interval - elapsed
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+                    next_deadline_ns += frame_interval_ns
+                    wait_ns = next_deadline_ns - time.monotonic_ns()
+                    if wait_ns > 0:
+                        time.sleep(wait_ns / 1e9)
+                    elif wait_ns < -frame_interval_ns:
+                        # Fell more than a frame behind: resync instead of
+                        # bursting to catch up.
+                        next_deadline_ns = time.monotonic_ns()
         except Exception as e:
             logger.exception("Camera %s thread crashed: %s", self.camera_id, e)
         finally:
@@ -362,6 +517,12 @@ class CameraCapture(QThread):
         logger.error("Camera %s: no working backend found", camera_id)
         return None
 
+    def _stream_url(self) -> str:
+        """URL to open for this network camera, with the preset's stream
+        resolution; reconnects use it too so they keep the resolution and
+        backend memo key of the first connection."""
+        return with_stream_resolution(self.camera_id, self.preset.network_resolution)
+
     def _open_network_camera(self, url):
         """Try to open a network camera (MJPEG, RTSP, or any URL OpenCV supports).
 
@@ -378,7 +539,8 @@ class CameraCapture(QThread):
 
         # FFMPEG first — avoids AVFoundation probing HTTP URLs which can
         # deadlock or timeout when a USB camera already holds the session.
-        for backend_name, backend in [("FFMPEG", cv2.CAP_FFMPEG), ("default", cv2.CAP_ANY)]:
+        # A backend that already worked for this URL goes ahead of it.
+        for backend_name, backend in _opencv_backends(url):
             logger.debug("Network camera %s: trying %s backend...", url, backend_name)
             cap = cv2.VideoCapture(url, backend)
             ret = False
@@ -390,6 +552,7 @@ class CameraCapture(QThread):
                     ret, _ = cap.read()
                     if ret:
                         logger.info("Network camera opened (%s backend): %s", backend_name, url)
+                        _remember_backend(url, backend_name)
                         return cap
                     logger.debug("Network camera %s: %s opened but read() returned False", url, backend_name)
                 else:
@@ -412,10 +575,14 @@ class CameraCapture(QThread):
                 ret, frame = cap.read()
                 if ret and frame is not None:
                     logger.info("Network camera opened (MJPEGCapture fallback): %s", url)
+                    _remember_backend(url, "mjpeg")
                     return cap
                 logger.debug("Network camera %s: MJPEGCapture opened but read() failed", url)
             cap.release()
 
+        # A remembered "mjpeg" skipped the OpenCV probes above; forget it so
+        # the next attempt tries every backend again
+        _forget_backend(url)
         logger.error("Network camera %s: could not open with any backend", url)
         return None
 
@@ -430,52 +597,135 @@ class CameraCapture(QThread):
             time.sleep(backoff)
             if not self.running:
                 return
-            self.cap = self._open_network_camera(self.camera_id)
+            self.cap = self._open_network_camera(self._stream_url())
             if self.cap is not None and self.cap.isOpened():
                 logger.info("Reconnected to %s", self.camera_id)
                 return
             backoff = min(backoff * 2, 30.0)
 
-    def _apply_transforms(self, frame: np.ndarray) -> np.ndarray:
-        """Apply zoom, rotation, and flip transforms."""
+    def _transform_state(self) -> tuple:
+        """Snapshot of (zoom, rotation, flip_h, flip_v) under the lock."""
         with self._lock:
-            zoom = self._zoom
-            rotation = self._rotation
-            flip_h = self._flip_h
-            flip_v = self._flip_v
+            return self._zoom, self._rotation, self._flip_h, self._flip_v
+
+    @staticmethod
+    def _is_identity(transforms: tuple) -> bool:
+        zoom, rotation, flip_h, flip_v = transforms
+        return zoom <= 1.0 and rotation == 0 and not (flip_h or flip_v)
 
-        # Zoom (center crop)
+    @staticmethod
+    def _transform_plan(w: int, h: int, zoom: float, rotation: int,
+                        flip_h: bool, flip_v: bool) -> tuple:
+        """Reduce the transform settings for a w x h frame to at most one
+        resampling pass.
+
+        Zoom (center crop), free rotation and flips are all affine, so they
+        fold into one warpAffine matrix. Right-angle rotations reduce to an
+        optional transpose plus flips, which also fold in.
+
+        Returns (M, flip_code, transpose): a 2x3 matrix or None, a cv2.flip
+        code or None (only when M is None), and whether to transpose last.
+        """
+        M = None
         if zoom > 1.0:
-            h, w = frame.shape[:2]
             crop_w = int(w / zoom)
             crop_h = int(h / zoom)
             x1 = (w - crop_w) // 2
             y1 = (h - crop_h) // 2
-            frame = frame[y1:y1 + crop_h, x1:x1 + crop_w]
-            frame = cv2.resize(frame, (w, h), interpolation=cv2.INTER_LINEAR)
-
-        # Rotation
+            sx = w / crop_w
+            sy = h / crop_h
+            # Pixel-centre aligned, matching cv2.resize of the crop
+            M = np.array([
+                [sx, 0.0, sx * (0.5 - x1) - 0.5],
+                [0.0, sy, sy * (0.5 - y1) - 0.5],
+                [0.0, 0.0, 1.0],
+            ])
+
+        transpose = False
         if rotation == 90:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
+            # rotate CW == transpose then flip horizontally
+            transpose, flip_h = True, not flip_h
         elif rotation == 180:
-            frame = cv2.rotate(frame, cv2.ROTATE_180)
+            flip_h, flip_v = not flip_h, not flip_v
         elif rotation == 270:
-            frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+            transpose, flip_v = True, not flip_v
         elif rotation != 0:
-            h, w = frame.shape[:2]
             center = (w // 2, h // 2)
-            M = cv2.getRotationMatrix2D(center, -rotation, 1.0)
-            frame = cv2.warpAffine(frame, M, (w, h))
-
-        # Flip
-        if flip_h and flip_v:
-            frame = cv2.flip(frame, -1)
-        elif flip_h:
-            frame = cv2.flip(frame, 1)
-        elif flip_v:
-            frame = cv2.flip(frame, 0)
-
-        return frame
+            R = np.vstack([cv2.getRotationMatrix2D(center, -rotation, 1.0), (0.0, 0.0, 1.0)])
+            M = R if M is None else R @ M
+
+        # Flips after a transpose swap axes when applied before it
+        if transpose:
+            flip_h, flip_v = flip_v, flip_h
+
+        flip_code = None
+        if M is not None:
+            if flip_h or flip_v:
+                F = np.array([
+                    [-1.0 if flip_h else 1.0, 0.0, w - 1.0 if flip_h else 0.0],
+                    [0.0, -1.0 if flip_v else 1.0, h - 1.0 if flip_v else 0.0],
+                    [0.0, 0.0, 1.0],
+                ])
+                M = F @ M
+            M = M[:2].copy()
+        elif flip_h or flip_v:
+            flip_code = -1 if flip_h and flip_v else (1 if flip_h else 0)
+        return M, flip_code, transpose
+
+    def _apply_transforms(self, frame: np.ndarray, into_ring: bool = False,
+                          transforms: Optional[tuple] = None) -> np.ndarray:
+        """Apply zoom, rotation, and flip transforms.
+
+        With into_ring the last pass writes straight into the next frame
+        ring slot, so _publish_frame has nothing left to copy. transforms
+        is a _transform_state() snapshot; it is read here when not given.
+        """
+        if transforms is None:
+            transforms = self._transform_state()
+        if self._is_identity(transforms):
+            return frame
+        zoom, rotation, flip_h, flip_v = transforms
+
+        h, w = frame.shape[:2]
+        shape, dtype = frame.shape, frame.dtype
+        # Settings and frame size rarely change, so the plan (with its
+        # trig-built matrix) is looked up rather than rebuilt per frame.
+        key = (w, h, zoom, rotation, flip_h, flip_v)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            if len(self._plan_cache) >= 16:
+                self._plan_cache.clear()
+            plan = self._plan_cache[key] = self._transform_plan(*key)
+        M, flip_code, transpose = plan
+
+        # With OpenCL the same calls dispatch to the GPU on a UMat; the
+        # result is downloaded once at the end.
+        use_ocl = self._use_opencl
+        if use_ocl:
+            frame = cv2.UMat(frame)
+
+        dst = None
+        if into_ring and not use_ocl:
+            dst = self._slot_buffer((w, h) + shape[2:] if transpose else shape, dtype)
+        pass_dst = dst
+        if transpose:
+            # The warp/flip result only feeds the transpose; keep reusing
+            # one scratch buffer for it instead of allocating per frame.
+            pass_dst = None
+            if not use_ocl and (M is not None or flip_code is not None):
+                if self._scratch is None or self._scratch.shape != shape or self._scratch.dtype != dtype:
+                    self._scratch = np.empty(shape, dtype)
+                pass_dst = self._scratch
+
+        if M is not None:
+            frame = cv2.warpAffine(frame, M, (w, h), dst=pass_dst, flags=cv2.INTER_LINEAR)
+        elif flip_code is not None:
+            frame = cv2.flip(frame, flip_code, dst=pass_dst)
+
+        if transpose:
+            frame = cv2.transpose(frame, dst=dst)
+
+        return frame.get() if use_ocl else frame
 
     def stop(self):
         self.running = False
@@ -488,31 +738,147 @@ class CameraCapture(QThread):
 # Person Detector
 # ============================================================================
 
+def _hysteresis(detected, c_present, c_absent, present, thr_present, thr_absent):
+    """Advance the presence state machine by one detection result.
+
+    Returns (c_present, c_absent, present, changed).
+    """
+    if detected:
+        c_present += 1
+        c_absent = 0
+    else:
+        c_absent += 1
+        c_present = 0
+    old = present
+    if not present and c_present >= thr_present:
+        present = True
+    elif present and c_absent >= thr_absent:
+        present = False
+    return c_present, c_absent, present, present != old
+
+
 class PersonDetector:
-    """Detects people using OpenCV HOG+SVM descriptor.
+    """Detects people with a MobileNet-SSD network, or HOG+SVM as fallback.
+
+    The SSD model is not bundled; drop MobileNetSSD_deploy.prototxt and
+    MobileNetSSD_deploy.caffemodel (an int8-quantized caffemodel works
+    too) into ~/GolfSwings/models to use it.
 
     Rate-limited to check every ~500ms. Uses hysteresis:
     - 3 consecutive detections to confirm presence (~1.5s)
     - 6 consecutive absences to confirm departure (~3s)
     """
 
-    def __init__(self):
-        self.hog = cv2.HOGDescriptor()
-        self.hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+    SSD_PROTOTXT = "MobileNetSSD_deploy.prototxt"
+    SSD_WEIGHTS = "MobileNetSSD_deploy.caffemodel"
+    SSD_INPUT_SIZE = (300, 300)
+    SSD_PERSON_CLASS = 15  # VOC class index
+    SSD_MIN_CONFIDENCE = 0.5
+    HOG_PYRAMID_SCALE = 1.2
+    HOG_WINDOW = (64, 128)
+    # As in detectMultiScale's final grouping, a person needs overlapping
+    # hits (more than HOG_GROUP_THRESHOLD); a lone spurious window is ignored
+    HOG_GROUP_THRESHOLD = 1
+    HOG_GROUP_EPS = 0.2
+
+    def __init__(self, model_dir: Optional[Path] = None):
+        self.net = self._load_ssd(Path(model_dir) if model_dir else MODEL_DIR)
+        self.hog = None
+        if self.net is None:
+            self.hog = cv2.HOGDescriptor()
+            self.hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
 
         self._detect_size = (320, 240)
+        self._levels = self._pyramid_levels(self._detect_size, self.HOG_PYRAMID_SCALE)
         self._person_present = False
         self._consecutive_present = 0
         self._consecutive_absent = 0
         self._presence_threshold = 3
         self._absence_threshold = 6
-        self._last_check_time = 0.0
+        self._last_check_time = float("-inf")
         self._check_interval = 0.5  # seconds
 
+    @classmethod
+    def _load_ssd(cls, model_dir: Path):
+        proto = model_dir / cls.SSD_PROTOTXT
+        weights = model_dir / cls.SSD_WEIGHTS
+        if not (proto.exists() and weights.exists()):
+            return None
+        try:
+            net = cv2.dnn.readNetFromCaffe(str(proto), str(weights))
+            net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+            net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+            logger.info("Person detection using MobileNet-SSD from %s", model_dir)
+            return net
+        except cv2.error as e:
+            logger.warning("Could not load person detection model, using HOG: %s", e)
+            return None
+
+    @staticmethod
+    def _pyramid_levels(size: tuple, scale: float) -> List[tuple]:
+        """Image sizes from size down to the 64x128 HOG window."""
+        w, h = size
+        levels = []
+        while w >= 64 and h >= 128:
+            levels.append((w, h))
+            w, h = int(w / scale), int(h / scale)
+        return levels
+
+    @property
+    def backend(self) -> str:
+        return "ssd" if self.net is not None else "hog"
+
+    def downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Shrink frame to the detection size; the result is a new array.
+
+        Lets callers hand a small private copy to a worker instead of a
+        full-resolution one. Both backends resize to their input size
+        anyway, so detection sees the same pixels.
+        """
+        return cv2.resize(frame, self._detect_size, interpolation=cv2.INTER_AREA)
+
+    def _detect(self, frame: np.ndarray) -> bool:
+        if self.net is not None:
+            blob = cv2.dnn.blobFromImage(
+                frame, 1 / 127.5, self.SSD_INPUT_SIZE, (127.5, 127.5, 127.5), swapRB=False
+            )
+            self.net.setInput(blob)
+            dets = self.net.forward()[0, 0]
+            hits = (dets[:, 1] == self.SSD_PERSON_CLASS) & (dets[:, 2] > self.SSD_MIN_CONFIDENCE)
+            return bool(hits.any())
+
+        small = frame
+        if small.shape[1::-1] != self._detect_size:
+            small = self.downscale(small)
+        if small.ndim == 3:
+            # HOG on one channel reads a third of the bytes per level
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        win_w, win_h = self.HOG_WINDOW
+        rects = []
+        for size in self._levels:
+            img = small if size == self._detect_size else cv2.resize(
+                small, size, interpolation=cv2.INTER_AREA
+            )
+            found, _ = self.hog.detect(img, winStride=(8, 8), padding=(4, 4))
+            if not len(found):
+                continue
+            # Hits in detection-size coordinates, so levels group together
+            scale = self._detect_size[0] / size[0]
+            rects.extend([int(x * scale), int(y * scale), int(win_w * scale), int(win_h * scale)]
+                         for x, y in np.asarray(found).reshape(-1, 2))
+            grouped, _ = cv2.groupRectangles(rects, self.HOG_GROUP_THRESHOLD, self.HOG_GROUP_EPS)
+            if len(grouped):
+                return True
+        return False
+
     @property
     def person_present(self) -> bool:
         return self._person_present
 
+    def due(self) -> bool:
+        """True if the next check() would run rather than be rate-limited."""
+        return time.monotonic() - self._last_check_time >= self._check_interval
+
     def check(self, frame: np.ndarray) -> Optional[bool]:
         """Check frame for person presence.
 
@@ -521,44 +887,74 @@ class PersonDetector:
             True if person just became present,
             False if person just left,
         """
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_check_time < self._check_interval:
             return None
         self._last_check_time = now
 
-        small = cv2.resize(frame, self._detect_size)
-        rects, _ = self.hog.detectMultiScale(
-            small, winStride=(8, 8), padding=(4, 4), scale=1.05
+        detected = self._detect(frame)
+
+        (self._consecutive_present, self._consecutive_absent,
+         self._person_present, changed) = _hysteresis(
+            detected, self._consecutive_present, self._consecutive_absent,
+            self._person_present, self._presence_threshold, self._absence_threshold,
         )
-        detected = len(rects) > 0
+        return self._person_present if changed else None
 
-        if detected:
-            self._consecutive_present += 1
-            self._consecutive_absent = 0
-        else:
-            self._consecutive_absent += 1
-            self._consecutive_present = 0
 
-        old_state = self._person_present
+# ============================================================================
+# Network Camera Scanner
+# ============================================================================
 
-        if not self._person_present and self._consecutive_present >= self._presence_threshold:
-            self._person_present = True
-        elif self._person_present and self._consecutive_absent >= self._absence_threshold:
-            self._person_present = False
+# Backend that last delivered frames for a network URL ("FFMPEG",
+# "default" or "mjpeg"), so reopening it skips probes known to fail.
+_BACKEND_MEMO_SIZE = 64
+_backend_memo: Dict[str, str] = {}
+_backend_memo_lock = threading.Lock()
 
-        if self._person_present != old_state:
-            return self._person_present
 
-        return None
+def _remember_backend(url: str, name: str):
+    with _backend_memo_lock:
+        _backend_memo.pop(url, None)
+        _backend_memo[url] = name
+        if len(_backend_memo) > _BACKEND_MEMO_SIZE:
+            _backend_memo.pop(next(iter(_backend_memo)))
 
 
-# ============================================================================
-# Network Camera Scanner
-# ============================================================================
+def _forget_backend(url: str):
+    """Drop url's remembered backend once it stops delivering frames."""
+    with _backend_memo_lock:
+        _backend_memo.pop(url, None)
+
+
+def _opencv_backends(url: str) -> list:
+    """OpenCV backends to try for url, last known good one first."""
+    backends = [("FFMPEG", cv2.CAP_FFMPEG), ("default", cv2.CAP_ANY)]
+    with _backend_memo_lock:
+        known = _backend_memo.get(url)
+    if known == "mjpeg":
+        return []
+    backends.sort(key=lambda b: b[0] != known)
+    return backends
+
+
+def droidcam_url(ip: str, width: Optional[int] = None, height: Optional[int] = None) -> str:
+    """Build the correct DroidCam MJPEG stream URL for OpenCV.
+
+    DroidCam scales the stream server-side when a WxH query is given,
+    which saves JPEG decode work on this end.
+    """
+    url = f"http://{ip}:4747/mjpegfeed"
+    if width and height:
+        url += f"?{width}x{height}"
+    return url
 
-def droidcam_url(ip: str) -> str:
-    """Build the correct DroidCam MJPEG stream URL for OpenCV."""
-    return f"http://{ip}:4747/mjpegfeed"
+
+def with_stream_resolution(url: str, resolution: str) -> str:
+    """Append a DroidCam WxH query to url if it is a bare DroidCam stream."""
+    if resolution and ":4747/" in url and "?" not in url:
+        return f"{url}?{resolution}"
+    return url
 
 
 def test_droidcam_connection(ip: str) -> tuple:
@@ -620,7 +1016,7 @@ def test_network_camera(url: str) -> tuple:
         logger.info("Camera at %s: reachable, testing video...", try_url)
 
         # Try OpenCV backends (FFMPEG first to avoid AVFoundation conflicts on macOS)
-        for backend_name, backend in [("FFMPEG", cv2.CAP_FFMPEG), ("default", cv2.CAP_ANY)]:
+        for backend_name, backend in _opencv_backends(try_url):
             logger.info("Testing camera at %s (%s backend)", try_url, backend_name)
             try:
                 cap = cv2.VideoCapture(try_url, backend)
@@ -629,6 +1025,7 @@ def test_network_camera(url: str) -> tuple:
                         cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, 5000)
                         ret, frame = cap.read()
                         if ret and frame is not None:
+                            _remember_backend(try_url, backend_name)
                             h, w = frame.shape[:2]
                             suffix = f" (via {try_url})" if try_url != url else ""
                             return True, f"Connected! Receiving {w}x{h} video{suffix}"
@@ -651,6 +1048,7 @@ def test_network_camera(url: str) -> tuple:
                 if cap.isOpened():
                     ret, frame = cap.read()
                     if ret and frame is not None:
+                        _remember_backend(try_url, "mjpeg")
                         h, w = frame.shape[:2]
                         suffix = f" (via {try_url})" if try_url != url else ""
                         cap.release()
@@ -659,13 +1057,88 @@ def test_network_camera(url: str) -> tuple:
             except Exception as e:
                 logger.debug("MJPEGCapture test failed for %s: %s", try_url, e)
 
+        _forget_backend(try_url)
+
     return False, f"Could not connect to {url}"
 
 
+def usb_backends(preferred: Optional[int] = None) -> list:
+    """OpenCV backends to try for USB cameras, in order of preference.
+
+    A preferred backend (one that worked for this index before) goes first.
+    """
+    if sys.platform == "win32":
+        backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY]
+    else:
+        backends = [cv2.CAP_ANY]
+    if preferred is not None:
+        backends = [preferred] + [b for b in backends if b != preferred]
+    return backends
+
+
+def probe_usb_camera(index: int, preferred: Optional[int] = None) -> Optional[int]:
+    """Return the first backend that opens USB camera index and delivers a
+    frame, or None.
+
+    Backends are tried one after another: most drivers only let one
+    handle hold a device at a time. grab() is enough to prove a frame
+    arrives; decoding it with read() would only cost time.
+    """
+    for backend in usb_backends(preferred):
+        cap = cv2.VideoCapture(index, backend)
+        try:
+            if cap.isOpened():
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                if cap.grab():
+                    return backend
+        finally:
+            cap.release()
+    return None
+
+
+class UsbCameraScanner(QThread):
+    """Probes USB camera indices in parallel for working devices.
+
+    A failed open can take seconds on Windows, so indices are probed
+    concurrently and a full scan costs about one open. backend_cache maps
+    index -> backend that worked last time; that backend is tried first.
+    """
+
+    MAX_INDEX = 10
+    MAX_WORKERS = 8
+
+    scan_complete = pyqtSignal(dict)  # {index: working backend}
+
+    def __init__(self, skip_ids=(), backend_cache: Optional[Dict[int, int]] = None, parent=None):
+        super().__init__(parent)
+        self._skip_ids = set(skip_ids)
+        self._backend_cache = dict(backend_cache or {})
+
+    def run(self):
+        found = {}
+        try:
+            indices = [i for i in range(self.MAX_INDEX) if i not in self._skip_ids]
+            if indices:
+                with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(indices))) as ex:
+                    results = list(ex.map(
+                        lambda i: probe_usb_camera(i, self._backend_cache.get(i)), indices
+                    ))
+                found = {i: backend for i, backend in zip(indices, results) if backend is not None}
+        except Exception as e:
+            logger.exception("USB camera scan crashed: %s", e)
+        logger.info("USB camera scan found %s", sorted(found))
+        self.scan_complete.emit(found)
+
+
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY,
+                        getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+
 class DroidCamScanner(QThread):
     """Scans local subnet for DroidCam instances (port 4747)."""
 
     DROIDCAM_PORT = 4747
+    SCAN_TIMEOUT = 1.0  # seconds for the whole subnet
 
     scan_progress = pyqtSignal(int, int)  # current, total
     camera_found = pyqtSignal(str, str)  # url, description
@@ -684,19 +1157,13 @@ class DroidCamScanner(QThread):
                 self.scan_complete.emit(found)
                 return
 
-            total = 254
-            for i in range(1, 255):
-                if not self._running:
-                    break
-                self.scan_progress.emit(i, total)
-                ip = f"{subnet}.{i}"
-
-                if self._check_port(ip, self.DROIDCAM_PORT):
-                    url = droidcam_url(ip)
-                    desc = f"DroidCam ({ip})"
-                    logger.info("Found DroidCam: %s", url)
-                    found.append((url, desc))
-                    self.camera_found.emit(url, desc)
+            ips = [f"{subnet}.{i}" for i in range(1, 255)]
+            for ip in self._scan_hosts(ips, self.DROIDCAM_PORT):
+                url = droidcam_url(ip)
+                desc = f"DroidCam ({ip})"
+                logger.info("Found DroidCam: %s", url)
+                found.append((url, desc))
+                self.camera_found.emit(url, desc)
         except Exception as e:
             logger.exception("DroidCam scanner thread crashed: %s", e)
 
@@ -716,6 +1183,53 @@ class DroidCamScanner(QThread):
         except Exception:
             return None
 
+    def _scan_hosts(self, ips: List[str], port: int) -> List[str]:
+        """Connect to every ip at once with non-blocking sockets.
+
+        All handshakes are started up front and a single select() loop
+        collects the results, so the whole subnet costs one timeout.
+        """
+        total = len(ips)
+        pending: Dict[socket.socket, str] = {}
+        reachable = []
+        try:
+            for ip in ips:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                s.setblocking(False)
+                err = s.connect_ex((ip, port))
+                if err == 0:
+                    reachable.append(ip)
+                    s.close()
+                elif err in _CONNECT_IN_PROGRESS:
+                    pending[s] = ip
+                else:
+                    s.close()
+
+            done = total - len(pending)
+            self.scan_progress.emit(done, total)
+            deadline = time.monotonic() + self.SCAN_TIMEOUT
+            while pending and self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                socks = list(pending)
+                _, writable, failed = select.select([], socks, socks, remaining)
+                # Windows reports refused connects via the error set only.
+                failed = set(failed)
+                for s in set(writable) | failed:
+                    ip = pending.pop(s)
+                    if s not in failed and s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        reachable.append(ip)
+                    s.close()
+                done = total - len(pending)
+                self.scan_progress.emit(done, total)
+        finally:
+            for s in pending:
+                s.close()
+        if pending and self._running:
+            self.scan_progress.emit(total, total)
+        return reachable
+
     @staticmethod
     def _check_port(ip: str, port: int, timeout: float = 0.2) -> bool:
         try:
@@ -2,9 +2,13 @@
 Side-by-side comparison view for ReplaySwing.
 """
 
+import itertools
 import logging
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -13,40 +17,342 @@ from PyQt6.QtWidgets import (
     QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QSlider, QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
 logger = logging.getLogger(__name__)
 
 
+def fit_size(w: int, h: int, box: Tuple[int, int]) -> Tuple[int, int]:
+    """Largest size with w:h aspect that fits in box, never upscaling."""
+    scale = min(box[0] / w, box[1] / h, 1.0)
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+
+class ClipFrameSource:
+    """Seekable reader that decodes single frames of one clip to RGB.
+
+    The VideoCapture stays open for the life of the source. read(i, dst)
+    grab()s past the frames in between when i is a short step forward,
+    decoding only the target with retrieve(), and seeks with
+    CAP_PROP_POS_FRAMES otherwise. Frames are downscaled (INTER_AREA) to
+    fit the box given to set_fit() and converted to RGB straight into dst.
+
+    Not thread-safe; ClipDecoder calls it from its worker thread only.
+    """
+
+    MAX_GRAB_AHEAD = 15  # frames skipped with grab() before a seek is cheaper
+
+    def __init__(self, path: Path, fit: Optional[Tuple[int, int]] = None):
+        self.path = path
+        self._cap = cv2.VideoCapture(str(path))
+        opened = self._cap.isOpened()
+        self._count = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT)) if opened else 0
+        self._src_size = (int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                          int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))) if opened else (0, 0)
+        self.size = self._src_size  # (w, h) of the frames read() produces
+        self._next = 0  # index of the frame the next grab() returns
+        self._bgr: Optional[np.ndarray] = None
+        self._small: Optional[np.ndarray] = None
+        if fit:
+            self.set_fit(fit)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def set_fit(self, fit: Tuple[int, int]) -> bool:
+        """Decode to fit fit=(w, h) from now on, never upscaling.
+
+        Returns True if the output size changed.
+        """
+        if not all(self._src_size):
+            return False
+        size = fit_size(*self._src_size, fit)
+        if size == self.size:
+            return False
+        self.size = size
+        self._small = None
+        return True
+
+    def read(self, index: int, dst: np.ndarray) -> bool:
+        """Decode frame index as RGB into dst, shaped (h, w, 3) for size.
+
+        Returns False past the end or on a decode error.
+        """
+        if not 0 <= index < self._count:
+            return False
+        if not self._next <= index <= self._next + self.MAX_GRAB_AHEAD:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+            self._next = index
+        while self._next <= index:
+            if not self._cap.grab():
+                # Frame count metadata is only an estimate for some containers
+                self._count = min(self._count, self._next)
+                return False
+            self._next += 1
+        ret, bgr = self._cap.retrieve(self._bgr)
+        if not ret:
+            return False
+        self._bgr = bgr
+
+        if self.size != (bgr.shape[1], bgr.shape[0]):
+            bgr = self._small = cv2.resize(bgr, self.size, dst=self._small,
+                                           interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=dst)
+        return True
+
+    def release(self):
+        self._cap.release()
+        self._count = 0
+
+
+# Identifies decoded frame contents across decoders and pool slot reuse
+_frame_serials = itertools.count()
+
+
+class ClipDecoder(QThread):
+    """Decodes frames of one clip on demand, off the GUI thread.
+
+    Viewers say which frame they want with request(viewer, index) and read
+    it with frame(index) once frame_decoded(index) fires. Wanted frames are
+    decoded first, then up to READ_AHEAD frames past each, so sequential
+    playback finds its next frames ready.
+
+    Frames land in one preallocated (POOL_SIZE, H, W, 3) RGB block, each
+    slot with a zero-copy QImage built once. Slots are reused least recently
+    used first, never while a viewer wants their frame, so memory stays at
+    POOL_SIZE frames of decode size whatever the clip length.
+
+    One decoder serves every viewer of a file; get it from acquire_decoder()
+    and hand it back with release_decoder().
+    """
+
+    POOL_SIZE = 32
+    READ_AHEAD = 6
+
+    frame_decoded = pyqtSignal(int)
+
+    def __init__(self, path: Path, fit: Tuple[int, int]):
+        super().__init__()
+        self.path = path
+        self.users = 0  # maintained by acquire_decoder / release_decoder
+        self._source = ClipFrameSource(path, fit)
+        self._fit = fit
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._refit = False
+        self._wanted: Dict[object, int] = {}  # viewer -> frame index
+        self._pool: Optional[np.ndarray] = None
+        self._images: List[QImage] = []
+        self._free: List[int] = []
+        self._entries: OrderedDict = OrderedDict()  # index -> (serial, slot), LRU first
+        self._failed: set = set()
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def request(self, viewer, index: int):
+        with self._cond:
+            if self._wanted.get(viewer) != index:
+                self._wanted[viewer] = index
+                self._cond.notify()
+
+    def forget(self, viewer):
+        with self._cond:
+            self._wanted.pop(viewer, None)
+
+    def frame(self, index: int) -> Optional[Tuple[int, np.ndarray, QImage]]:
+        """(serial, rgb, qimage) of a decoded frame, or None if not ready.
+
+        The slot is only guaranteed while a viewer still wants index.
+        """
+        with self._cond:
+            entry = self._entries.get(index)
+            if entry is None:
+                return None
+            self._entries.move_to_end(index)
+            serial, slot = entry
+            return serial, self._pool[slot], self._images[slot]
+
+    def grow_fit(self, fit: Tuple[int, int]):
+        """Decode to fit at least fit=(w, h) from now on."""
+        with self._cond:
+            grown = (max(fit[0], self._fit[0]), max(fit[1], self._fit[1]))
+            if grown != self._fit:
+                self._fit = grown
+                self._refit = True
+                self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self.wait()
+
+    def _missing(self, index: int) -> bool:
+        return (0 <= index < len(self._source) and index not in self._entries
+                and index not in self._failed)
+
+    def _take_slot(self, keep: set) -> Optional[int]:
+        if self._free:
+            return self._free.pop()
+        for index in self._entries:
+            if index not in keep:
+                return self._entries.pop(index)[1]
+        return None
+
+    def _next_job(self) -> Optional[Tuple[int, int]]:
+        """(index, slot) to decode next, or None while there's nothing to do."""
+        wanted = set(self._wanted.values())
+        for index in wanted:
+            if self._missing(index):
+                slot = self._take_slot(wanted)
+                return None if slot is None else (index, slot)
+        ahead = wanted | {w + step for w in wanted for step in range(1, self.READ_AHEAD + 1)}
+        for step in range(1, self.READ_AHEAD + 1):
+            for w in wanted:
+                if self._missing(w + step):
+                    slot = self._take_slot(ahead)
+                    return None if slot is None else (w + step, slot)
+        return None
+
+    def _apply_fit(self):
+        """Drop the pool after a fit change; the next job reallocates it."""
+        self._refit = False
+        if self._source.set_fit(self._fit):
+            self._pool = None
+            self._images = []
+            self._entries.clear()
+            self._failed.clear()
+
+    def _allocate_pool(self):
+        w, h = self._source.size
+        self._pool = np.empty((self.POOL_SIZE, h, w, 3), np.uint8)
+        self._images = [QImage(s.data, w, h, s.strides[0], QImage.Format.Format_RGB888)
+                        for s in self._pool]
+        self._free = list(range(self.POOL_SIZE))
+
+    def run(self):
+        try:
+            while True:
+                with self._cond:
+                    while True:
+                        if self._stopping:
+                            return
+                        if self._refit:
+                            self._apply_fit()
+                        if self._pool is None and all(self._source.size):
+                            self._allocate_pool()
+                        job = self._next_job() if self._pool is not None else None
+                        if job is not None:
+                            break
+                        self._cond.wait()
+                    index, slot = job
+
+                # Decoding runs unlocked: the slot is in no entry until it's
+                # done, and only this thread replaces the pool
+                try:
+                    ok = self._source.read(index, self._pool[slot])
+                except Exception as e:
+                    logger.warning("Failed to decode frame %d of %s: %s", index, self.path, e)
+                    ok = False
+
+                with self._cond:
+                    if ok:
+                        self._entries[index] = (next(_frame_serials), slot)
+                    else:
+                        self._free.append(slot)
+                        self._failed.add(index)
+                if ok:
+                    self.frame_decoded.emit(index)
+        finally:
+            self._source.release()
+
+
+# Decoders in use, one per file, so showing the same clip and angle on both
+# sides (or in two windows) decodes and stores its frames once
+_DECODERS: Dict[Path, ClipDecoder] = {}
+
+
+def acquire_decoder(path: Path, fit: Tuple[int, int]) -> ClipDecoder:
+    """Running decoder for path, started on first use; pair with release_decoder()."""
+    decoder = _DECODERS.get(path)
+    if decoder is None:
+        decoder = _DECODERS[path] = ClipDecoder(path, fit)
+        decoder.start()
+    else:
+        decoder.grow_fit(fit)
+    decoder.users += 1
+    return decoder
+
+
+def release_decoder(decoder: ClipDecoder):
+    """Drop one use of decoder, stopping it when nothing uses it any more."""
+    decoder.users -= 1
+    if decoder.users <= 0:
+        _DECODERS.pop(decoder.path, None)
+        decoder.stop()
+
+
 class ComparisonVideoPlayer(QLabel):
-    """Lightweight video display for comparison view."""
+    """Lightweight video display for comparison view.
+
+    Scaled pixmaps are kept in an LRU keyed by frame serial and widget
+    size, so pausing or scrubbing over recent frames skips the smooth
+    rescale. Players given the same pixmap_cache share it, so a frame shown
+    on both sides is scaled once.
+    Emits resized() so the owner can re-decode frames at a larger size.
+    """
 
-    def __init__(self, parent=None):
+    PIXMAP_CACHE_SIZE = 16
+
+    resized = pyqtSignal()
+
+    def __init__(self, parent=None, pixmap_cache: Optional[OrderedDict] = None):
         super().__init__(parent)
         self.setMinimumSize(400, 225)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setStyleSheet("background-color: #1a1a1a; border-radius: 4px;")
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-    def display_frame(self, frame: np.ndarray):
-        if frame is None:
-            return
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bpl = ch * w
-        q_img = QImage(rgb.tobytes(), w, h, bpl, QImage.Format.Format_RGB888)
-        scaled = q_img.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.setPixmap(QPixmap.fromImage(scaled))
+        # (serial, w, h) -> QPixmap
+        self._cache: OrderedDict = pixmap_cache if pixmap_cache is not None else OrderedDict()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
+    def display_frame(self, serial: int, rgb: np.ndarray, image: QImage):
+        """Show a frame from ClipDecoder.frame(); rgb backs image and must
+        stay referenced while it is scaled."""
+        size = self.size()
+        key = (serial, size.width(), size.height())
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+        else:
+            scaled = image.scaled(
+                size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            pixmap = QPixmap.fromImage(scaled)
+            self._cache[key] = pixmap
+            if len(self._cache) > self.PIXMAP_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        self.setPixmap(pixmap)
 
 
 class ComparisonWindow(QDialog):
     """Side-by-side comparison of two clips with synchronized playback."""
 
+    # Frames are decoded to fit at least this box, so the first layout pass
+    # (before the dialog is shown) doesn't decode thumbnails.
+    MIN_DECODE_BOX = (960, 540)
+
+    # Playback runs off the monotonic clock; the timer only polls it
+    PLAYBACK_FPS = 30.0
+    PLAY_TICK_MS = 8
+
     def __init__(self, clips: List[Dict], session_folder: Path, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Swing Comparison")
@@ -79,13 +385,19 @@ class ComparisonWindow(QDialog):
         self.clips = clips
         self.session_folder = session_folder
 
-        self.left_frames: List[np.ndarray] = []
-        self.right_frames: List[np.ndarray] = []
+        # side -> decoder of the clip shown there, possibly shared
+        self._decoders: Dict[str, ClipDecoder] = {}
+        self._pixmap_cache: OrderedDict = OrderedDict()  # shared by both players
         self.left_offset = 0
         self.right_offset = 0
         self.position = 0
+        # max(len(left), len(right), 1), kept current by _update_slider_range
+        self._max_len = 1
+        self._frame_label_state: Tuple[int, int] = (-1, -1)
         self.is_playing = False
         self.speed = 1.0
+        # Box each side's frames are decoded to fit (see _decode_box)
+        self._decoded_box: Dict[str, Tuple[int, int]] = {}
 
         self._setup_ui()
         self._setup_timer()
@@ -111,7 +423,7 @@ class ComparisonWindow(QDialog):
         self.left_angle_combo.currentIndexChanged.connect(lambda: self._load_clip("left"))
         left_panel.addWidget(self.left_angle_combo)
 
-        self.left_player = ComparisonVideoPlayer()
+        self.left_player = ComparisonVideoPlayer(pixmap_cache=self._pixmap_cache)
         left_panel.addWidget(self.left_player, stretch=1)
 
         self.left_offset_label = QLabel("Offset: 0 frames")
@@ -151,7 +463,7 @@ class ComparisonWindow(QDialog):
         self.right_angle_combo.currentIndexChanged.connect(lambda: self._load_clip("right"))
         right_panel.addWidget(self.right_angle_combo)
 
-        self.right_player = ComparisonVideoPlayer()
+        self.right_player = ComparisonVideoPlayer(pixmap_cache=self._pixmap_cache)
         right_panel.addWidget(self.right_player, stretch=1)
 
         self.right_offset_label = QLabel("Offset: 0 frames")
@@ -212,7 +524,37 @@ class ComparisonWindow(QDialog):
 
     def _setup_timer(self):
         self.play_timer = QTimer()
+        self.play_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.play_timer.timeout.connect(self._tick)
+        self._play_t0 = 0.0
+        self._play_pos0 = 0
+
+        # Re-decode at a larger size once resizing settles
+        self._redecode_timer = QTimer()
+        self._redecode_timer.setSingleShot(True)
+        self._redecode_timer.setInterval(250)
+        self._redecode_timer.timeout.connect(self._redecode_if_outgrown)
+        self.left_player.resized.connect(self._redecode_timer.start)
+        self.right_player.resized.connect(self._redecode_timer.start)
+
+    def _decode_box(self, side: str) -> Tuple[int, int]:
+        player = self._player(side)
+        return (max(player.width(), self.MIN_DECODE_BOX[0]),
+                max(player.height(), self.MIN_DECODE_BOX[1]))
+
+    def _redecode_if_outgrown(self):
+        for side in ("left", "right"):
+            box = self._decoded_box.get(side)
+            if box is None:
+                continue
+            want = self._decode_box(side)
+            if want[0] > box[0] * 1.25 or want[1] > box[1] * 1.25:
+                self._decoded_box[side] = want
+                # Frames arrive through frame_decoded once re-decoded
+                self._decoders[side].grow_fit(want)
+
+    def _player(self, side: str) -> ComparisonVideoPlayer:
+        return self.left_player if side == "left" else self.right_player
 
     def _load_clip(self, side: str):
         combo = self.left_combo if side == "left" else self.right_combo
@@ -223,26 +565,27 @@ class ComparisonWindow(QDialog):
 
         clip = self.clips[idx]
 
-        # Populate angle selector (block signals to avoid recursive load)
-        current_angle = angle_combo.currentData()
-        angle_combo.blockSignals(True)
-        angle_combo.clear()
-        angle_combo.addItem("Primary", None)
+        # Populate angle selector, leaving it alone when the new clip has the
+        # same cameras (block signals to avoid recursive load)
+        desired = [("Primary", None)]
         if "camera_files" in clip:
             labels = clip.get("camera_labels", {})
-            for cam_id, filename in clip["camera_files"].items():
-                label = labels.get(cam_id, f"Camera {cam_id}")
+            for cam_id in clip["camera_files"]:
+                desired.append((labels.get(cam_id, f"Camera {cam_id}"), cam_id))
+        current = [(angle_combo.itemText(i), angle_combo.itemData(i)) for i in range(angle_combo.count())]
+        if desired != current:
+            current_angle = angle_combo.currentData()
+            angle_combo.blockSignals(True)
+            angle_combo.clear()
+            for label, cam_id in desired:
                 angle_combo.addItem(label, cam_id)
-        angle_combo.blockSignals(False)
 
-        # Restore previous angle selection if still valid
-        if current_angle is not None:
-            for i in range(angle_combo.count()):
-                if angle_combo.itemData(i) == current_angle:
-                    angle_combo.blockSignals(True)
+            # Restore previous angle selection if still valid
+            if current_angle is not None:
+                i = angle_combo.findData(current_angle)
+                if i >= 0:
                     angle_combo.setCurrentIndex(i)
-                    angle_combo.blockSignals(False)
-                    break
+            angle_combo.blockSignals(False)
 
         # Determine which file to load based on selected angle
         cam_id = angle_combo.currentData()
@@ -255,27 +598,33 @@ class ComparisonWindow(QDialog):
         if not path.exists():
             return
 
-        frames = []
-        cap = cv2.VideoCapture(str(path))
-        try:
-            if not cap.isOpened():
-                return
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                frames.append(frame)
-        finally:
-            cap.release()
-
-        if side == "left":
-            self.left_frames = frames
-        else:
-            self.right_frames = frames
-
+        box = self._decode_box(side)
+        self._decoded_box[side] = box
+        self._set_decoder(side, acquire_decoder(path, box))
         self._update_slider_range()
         self._show_frames()
 
+    def _set_decoder(self, side: str, decoder: Optional[ClipDecoder]):
+        """Show decoder's clip on side (None clears it), keeping one
+        frame_decoded connection per decoder however many sides use it."""
+        old = self._decoders.pop(side, None)
+        if decoder is not None:
+            if decoder not in self._decoders.values() and decoder is not old:
+                decoder.frame_decoded.connect(self._on_frame_decoded)
+            self._decoders[side] = decoder
+        if old is not None:
+            if old is not decoder:
+                old.forget(self._player(side))
+                if old not in self._decoders.values():
+                    old.frame_decoded.disconnect(self._on_frame_decoded)
+            release_decoder(old)
+
+    def done(self, result: int):
+        self.play_timer.stop()
+        for side in list(self._decoders):
+            self._set_decoder(side, None)
+        super().done(result)
+
     def _adjust_offset(self, side: str, delta: int):
         if side == "left":
             self.left_offset += delta
@@ -286,21 +635,28 @@ class ComparisonWindow(QDialog):
         self._show_frames()
 
     def _update_slider_range(self):
-        max_len = max(len(self.left_frames), len(self.right_frames), 1)
-        self.scrub_slider.setMaximum(max_len - 1)
+        self._max_len = max((len(d) for d in self._decoders.values()), default=0) or 1
+        self.scrub_slider.setMaximum(self._max_len - 1)
 
     def _toggle_play(self):
         self.is_playing = self.play_btn.isChecked()
         if self.is_playing:
-            interval = int(33 / self.speed)
-            self.play_timer.start(interval)
+            self._restart_play_clock()
+            self.play_timer.start(self.PLAY_TICK_MS)
             self.play_btn.setText("Pause")
         else:
             self.play_timer.stop()
             self.play_btn.setText("Play")
 
+    def _restart_play_clock(self):
+        """Measure playback from the current position from now on."""
+        self._play_t0 = time.monotonic()
+        self._play_pos0 = self.position
+
     def _on_scrub(self, value: int):
         self.position = value
+        if self.is_playing:
+            self._restart_play_clock()
         self._show_frames()
 
     def _on_speed_changed(self, text: str):
@@ -311,24 +667,43 @@ class ComparisonWindow(QDialog):
         if self.speed <= 0:
             self.speed = 1.0
         if self.is_playing:
-            self.play_timer.setInterval(int(33 / self.speed))
+            self._restart_play_clock()
 
     def _tick(self):
-        max_len = max(len(self.left_frames), len(self.right_frames), 1)
-        self.position = (self.position + 1) % max_len
+        # Jump to the frame that should be showing now, so a late tick drops
+        # frames instead of slowing playback down
+        elapsed = int((time.monotonic() - self._play_t0) * self.speed * self.PLAYBACK_FPS)
+        target = (self._play_pos0 + elapsed) % self._max_len
+        if target == self.position:
+            return
+        self.position = target
         self.scrub_slider.blockSignals(True)
         self.scrub_slider.setValue(self.position)
         self.scrub_slider.blockSignals(False)
         self._show_frames()
 
     def _show_frames(self):
-        max_len = max(len(self.left_frames), len(self.right_frames), 1)
-        self.frame_label.setText(f"{self.position + 1} / {max_len}")
-
-        left_idx = self.position + self.left_offset
-        if 0 <= left_idx < len(self.left_frames):
-            self.left_player.display_frame(self.left_frames[left_idx])
-
-        right_idx = self.position + self.right_offset
-        if 0 <= right_idx < len(self.right_frames):
-            self.right_player.display_frame(self.right_frames[right_idx])
+        state = (self.position, self._max_len)
+        if state != self._frame_label_state:
+            self._frame_label_state = state
+            self.frame_label.setText(f"{self.position + 1} / {self._max_len}")
+
+        for side in self._decoders:
+            self._show_side(side)
+
+    def _show_side(self, side: str):
+        """Ask for side's frame at the current position and show it if it's
+        decoded; otherwise _on_frame_decoded shows it when it lands."""
+        decoder = self._decoders[side]
+        player = self._player(side)
+        index = self.position + (self.left_offset if side == "left" else self.right_offset)
+        decoder.request(player, index)
+        entry = decoder.frame(index)
+        if entry is not None:
+            player.display_frame(*entry)
+
+    def _on_frame_decoded(self, index: int):
+        for side in self._decoders:
+            offset = self.left_offset if side == "left" else self.right_offset
+            if self.position + offset == index:
+                self._show_side(side)
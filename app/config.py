@@ -5,16 +5,23 @@ Configuration and settings persistence for ReplaySwing.
 import json
 import logging
 import tempfile
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 SETTINGS_FILE = Path.home() / "GolfSwings" / "settings.json"
 TRAINING_DATA_DIR = Path.home() / "GolfSwings" / "training_data"
 LOG_DIR = Path.home() / "GolfSwings" / "logs"
+MODEL_DIR = Path.home() / "GolfSwings" / "models"
 
 
 @dataclass
@@ -27,29 +34,16 @@ class CameraPreset:
     rotation: int = 0  # 0, 90, 180, 270
     flip_h: bool = False
     flip_v: bool = False
+    network_resolution: str = ""  # e.g. "640x480" for DroidCam; empty = camera default
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "label": self.label,
-            "zoom": self.zoom,
-            "rotation": self.rotation,
-            "flip_h": self.flip_h,
-            "flip_v": self.flip_v,
-        }
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     @classmethod
     def from_dict(cls, data: dict) -> "CameraPreset":
-        return cls(
-            id=data.get("id", 0),
-            type=data.get("type", "usb"),
-            label=data.get("label", ""),
-            zoom=data.get("zoom", 1.0),
-            rotation=data.get("rotation", 0),
-            flip_h=data.get("flip_h", False),
-            flip_v=data.get("flip_v", False),
-        )
+        kwargs = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+        kwargs.setdefault("id", 0)
+        return cls(**kwargs)
 
 
 @dataclass
@@ -84,6 +78,9 @@ class AppConfig:
     cameras: List[CameraPreset] = field(default_factory=list)
     primary_camera: Any = 0  # int for USB, str for network URL
 
+    # USB camera index -> OpenCV backend that last opened it
+    usb_backend_cache: Dict[int, int] = field(default_factory=dict)
+
     # Person detection
     auto_ready_enabled: bool = False
 
@@ -132,51 +129,62 @@ class AppConfig:
                 return c
         return None
 
+    # Fields saved to settings.json. The rest (session folder, clip timing,
+    # fps, ...) start from their defaults each run.
+    PERSISTED_FIELDS = (
+        "base_dir", "cameras", "primary_camera", "audio_threshold",
+        "audio_device_index", "audio_device_name", "auto_ready_enabled",
+        "playback_speed", "pip_position", "pip_size", "window_geometry",
+        "drawing_overlays", "usb_backend_cache",
+    )
+
     def to_dict(self) -> dict:
-        return {
-            "base_dir": self.base_dir,
-            "cameras": [c.to_dict() for c in self.cameras],
-            "primary_camera": self.primary_camera,
-            "audio_threshold": self.audio_threshold,
-            "audio_device_index": self.audio_device_index,
-            "audio_device_name": self.audio_device_name,
-            "auto_ready_enabled": self.auto_ready_enabled,
-            "playback_speed": self.playback_speed,
-            "pip_position": list(self.pip_position),
-            "pip_size": list(self.pip_size),
-            "window_geometry": self.window_geometry,
-            "drawing_overlays": self.drawing_overlays,
-        }
+        data = {}
+        for name in self.PERSISTED_FIELDS:
+            value = getattr(self, name)
+            if name == "cameras":
+                value = [c.to_dict() for c in value]
+            elif isinstance(value, tuple):
+                value = list(value)
+            data[name] = value
+        return data
 
     def update_from_dict(self, data: dict):
         """Load settings from a dict (from JSON)."""
-        if "base_dir" in data:
-            self.base_dir = data["base_dir"] or ""
-        if "cameras" in data:
-            self.cameras = [CameraPreset.from_dict(c) for c in data["cameras"]]
-        if "primary_camera" in data:
-            self.primary_camera = data["primary_camera"]
-        if "audio_threshold" in data:
-            self.audio_threshold = float(data["audio_threshold"])
-        if "audio_device_index" in data:
-            self.audio_device_index = data["audio_device_index"]
-        if "audio_device_name" in data:
-            self.audio_device_name = data.get("audio_device_name", "")
-        if "auto_ready_enabled" in data:
-            self.auto_ready_enabled = bool(data["auto_ready_enabled"])
-        if "playback_speed" in data:
-            self.playback_speed = float(data["playback_speed"])
-        if "pip_position" in data:
-            self.pip_position = tuple(data["pip_position"])
-        if "pip_size" in data:
-            self.pip_size = tuple(data["pip_size"])
-        if "window_geometry" in data:
-            self.window_geometry = data["window_geometry"]
-        if "drawing_overlays" in data:
-            self.drawing_overlays = data["drawing_overlays"]
+        types = {f.name: f.type for f in fields(self)}
+        for name in self.PERSISTED_FIELDS:
+            if name in data:
+                setattr(self, name, _coerce(types[name], data[name]))
         self._validate()
 
 
+def _coerce(field_type, value):
+    """Convert a JSON value to the type of an AppConfig field."""
+    if field_type == List[CameraPreset]:
+        return [CameraPreset.from_dict(c) for c in value]
+    if field_type == Dict[int, int]:
+        # JSON object keys are always strings
+        return {int(k): int(v) for k, v in value.items()}
+    if field_type is str:
+        return value or ""
+    if field_type in (float, bool, tuple):
+        return field_type(value)
+    return value
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            pass  # e.g. numpy scalars; the stdlib encoder reports these properly
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 def load_settings(config: AppConfig):
     """Load settings from disk into config."""
     if SETTINGS_FILE.exists():
@@ -197,17 +205,29 @@ def load_settings(config: AppConfig):
             logger.warning("Failed to load settings: %s", e)
 
 
+# Last bytes written per settings path, so unchanged configs skip the write
+_last_saved: Dict[Path, bytes] = {}
+
+
 def save_settings(config: AppConfig):
-    """Save config to disk using atomic temp-file-then-rename."""
+    """Save config to disk using atomic temp-file-then-rename.
+
+    Nothing is written when the serialized config matches what this
+    process last wrote and the file is still there.
+    """
+    data = dumps_json(config.to_dict())
+    if _last_saved.get(SETTINGS_FILE) == data and SETTINGS_FILE.exists():
+        return
     SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
     try:
         fd, tmp_path = tempfile.mkstemp(
             dir=SETTINGS_FILE.parent, suffix=".tmp", prefix="settings_"
         )
         try:
-            with open(fd, "w") as f:
-                json.dump(config.to_dict(), f, indent=2)
+            with open(fd, "wb") as f:
+                f.write(data)
             Path(tmp_path).replace(SETTINGS_FILE)
+            _last_saved[SETTINGS_FILE] = data
         except BaseException:
             Path(tmp_path).unlink(missing_ok=True)
             raise
@@ -4,44 +4,193 @@ Recording manager and frame buffer for ReplaySwing.
 
 import json
 import logging
+import os
 import re
+import shutil
+import subprocess
+import sys
 import threading
 import time
 from pathlib import Path
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict
 
 import cv2
 import numpy as np
 
-from config import AppConfig
+from config import AppConfig, dumps_json
 
 logger = logging.getLogger(__name__)
 
+# ffmpeg on PATH lets clips be encoded as H.264 through one piped encoder
+# process; without it we fall back to OpenCV's mp4v writer.
+FFMPEG_PATH = shutil.which("ffmpeg")
+# The packaged app is windowed; keep ffmpeg from flashing a console per encode
+_FFMPEG_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+THUMBNAIL_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 1]
+
+_SHOT_NUMBER_RE = re.compile(r"^shot_(\d+)")
+_PRIMARY_SHOT_RE = re.compile(r"^shot_\d{4}\.mp4$")
+
+
+# Frames per pipe write when frames are adjacent slices of one block
+WRITE_CHUNK_FRAMES = 16
+
+
+def _raw_chunks(frames: List[tuple], chunk_frames: int = WRITE_CHUNK_FRAMES):
+    """Yield buffers covering the raw bytes of each frame, in order.
+
+    Runs of frames that are consecutive rows of one contiguous block, as
+    FrameBuffer.snapshot() returns, are merged into single buffers of up to
+    chunk_frames frames. Other frames are yielded one at a time.
+    """
+    block, start, end = None, 0, 0
+    for frame, _ in frames:
+        base = frame.base
+        if (
+            isinstance(base, np.ndarray)
+            and base.flags["C_CONTIGUOUS"]
+            and base.shape[1:] == frame.shape
+            and frame.flags["C_CONTIGUOUS"]
+        ):
+            idx, rem = divmod(frame.ctypes.data - base.ctypes.data, frame.nbytes)
+            if not rem:
+                if base is block and idx == end and end - start < chunk_frames:
+                    end += 1
+                    continue
+                if block is not None:
+                    yield block[start:end].data
+                block, start, end = base, idx, idx + 1
+                continue
+        if block is not None:
+            yield block[start:end].data
+            block = None
+        yield np.ascontiguousarray(frame).data
+    if block is not None:
+        yield block[start:end].data
+
+
+def _write_all(stream, data):
+    """Write data to an unbuffered stream, retrying short writes."""
+    view = memoryview(data).cast("B")
+    while view:
+        view = view[stream.write(view):]
+
 
 # ============================================================================
 # Frame Buffer Manager
 # ============================================================================
 
 class FrameBuffer:
-    """Manages circular buffer for pre-trigger frames."""
+    """Manages circular buffer for pre-trigger frames.
+
+    Frames are copied into a preallocated ring of fixed-shape slots, so the
+    steady state does no allocation. The ring is sized on the first frame and
+    reallocated only if the camera's frame shape changes.
+
+    There is no lock: one thread adds frames and one reads them.
+    ``_claimed``, ``_head`` and ``_tail`` are running frame counts, not slot
+    indices. The producer bumps ``_claimed`` before it overwrites a slot and
+    ``_head`` after the slot is filled. Each is a single atomic store under
+    the GIL. The reader drops any slots claimed while it was copying.
+    """
 
     def __init__(self, duration: float, fps: int):
-        self.max_frames = int(duration * fps)
-        self.buffer: deque = deque(maxlen=self.max_frames)
-        self._lock = threading.Lock()
+        self.max_frames = max(1, int(duration * fps))
+        self._ring: Optional[np.ndarray] = None
+        self._ts = np.empty(self.max_frames, np.float64)
+        self._claimed = 0
+        self._head = 0
+        self._tail = 0
 
     def add_frame(self, frame: np.ndarray, timestamp: float):
-        with self._lock:
-            self.buffer.append((frame.copy(), timestamp))
+        ring = self._ring
+        if ring is None or ring.shape[1:] != frame.shape or ring.dtype != frame.dtype:
+            ring = self._ring = np.empty((self.max_frames,) + frame.shape, frame.dtype)
+            self._tail = self._head
+        slot = self._head % self.max_frames
+        self._claimed = self._head + 1
+        np.copyto(ring[slot], frame)
+        self._ts[slot] = timestamp
+        self._head += 1
+
+    def snapshot(self) -> tuple:
+        """Return ``(frames, timestamps)`` arrays, oldest first.
+
+        ``frames`` is one freshly copied ``(N, H, W, C)`` block, so it stays
+        valid while the ring keeps being written. ``timestamps`` is a
+        matching float64 array.
+        """
+        ring = self._ring
+        head = self._head
+        tail = max(self._tail, head - self.max_frames)
+        if ring is None or head <= tail:
+            return np.empty((0, 0, 0, 3), np.uint8), np.empty(0, np.float64)
+        order = np.arange(tail, head) % self.max_frames
+        frames = ring[order]
+        stamps = self._ts[order]
+
+        # Frame k's slot is reused once frame k + max_frames is claimed
+        torn = self._claimed - self.max_frames - tail
+        if torn > 0:
+            frames, stamps = frames[torn:], stamps[torn:]
+        return frames, stamps
 
     def get_frames(self) -> List[tuple]:
-        with self._lock:
-            return list(self.buffer)
+        """Return buffered ``(frame, timestamp)`` pairs, oldest first."""
+        frames, stamps = self.snapshot()
+        return list(zip(frames, stamps.tolist()))
+
+    def view_frames(self) -> List[tuple]:
+        """Return buffered ``(frame, timestamp)`` pairs as views into the ring.
+
+        Nothing is copied, so the frames are only valid until the next
+        add_frame(); use it when adding is paused, e.g. while recording.
+        """
+        ring = self._ring
+        head = self._head
+        tail = max(self._tail, head - self.max_frames)
+        if ring is None or head <= tail:
+            return []
+        stamps = self._ts.tolist()
+        slots = [i % self.max_frames for i in range(tail, head)]
+        return [(ring[slot], stamps[slot]) for slot in slots]
 
     def clear(self):
-        with self._lock:
-            self.buffer.clear()
+        self._tail = self._head
+
+
+class FramePool:
+    """Preallocated frame slots for a post-trigger recording.
+
+    store() copies each frame into the next slot of one contiguous block and
+    returns that slot, so recording does no per-frame allocation and the
+    saved frames are adjacent rows that _raw_chunks() can write in bulk.
+    When every slot is taken, frames fall back to ordinary copies.
+
+    The block holds capacity full-size frames (about 6 MB each at 1080p),
+    so owners should create a pool per recording and drop it, along with
+    the returned views, once the clip is saved.
+    """
+
+    def __init__(self, duration: float, fps: int):
+        self.capacity = max(1, int(duration * fps))
+        self._block: Optional[np.ndarray] = None
+        self._next = 0
+
+    def store(self, frame: np.ndarray) -> np.ndarray:
+        block = self._block
+        if block is None or block.shape[1:] != frame.shape or block.dtype != frame.dtype:
+            # Views into an old block stay valid; they keep it alive
+            block = self._block = np.empty((self.capacity,) + frame.shape, frame.dtype)
+            self._next = 0
+        if self._next >= self.capacity:
+            return frame.copy()
+        slot = block[self._next]
+        self._next += 1
+        np.copyto(slot, frame)
+        return slot
 
 
 # ============================================================================
@@ -51,29 +200,34 @@ class FrameBuffer:
 class RecordingManager:
     """Manages the recording state and clip saving."""
 
+    SAVE_DEBOUNCE_SECONDS = 0.2
+
     def __init__(self, config: AppConfig):
         self.config = config
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._clips_dirty = False
         self.session_folder = Path(config.session_folder)
         self.session_folder.mkdir(parents=True, exist_ok=True)
 
-        self.shot_count = self._get_next_shot_number()
+        shot_files = self._list_shot_files()
+        self.shot_count = self._get_next_shot_number(shot_files)
         self.clips: List[Dict] = []
-        self._load_existing_clips()
-
-    def _get_next_shot_number(self) -> int:
-        existing = list(self.session_folder.glob("shot_*.mp4"))
-        if not existing:
-            return 1
-        numbers = []
-        for f in existing:
-            try:
-                num = int(f.stem.split("_")[1])
-                numbers.append(num)
-            except (IndexError, ValueError):
-                pass
-        return max(numbers, default=0) + 1
+        self._load_existing_clips(shot_files)
+
+    def _list_shot_files(self) -> List[os.DirEntry]:
+        """Directory entries for shot_*.mp4 in the session folder, by name."""
+        with os.scandir(self.session_folder) as it:
+            entries = [e for e in it if e.name.startswith("shot_") and e.name.endswith(".mp4")]
+        return sorted(entries, key=lambda e: e.name)
 
-    def _load_existing_clips(self):
+    def _get_next_shot_number(self, shot_files: Optional[List[os.DirEntry]] = None) -> int:
+        if shot_files is None:
+            shot_files = self._list_shot_files()
+        matches = (_SHOT_NUMBER_RE.match(f.name) for f in shot_files)
+        return max((int(m.group(1)) for m in matches if m), default=0) + 1
+
+    def _load_existing_clips(self, shot_files: Optional[List[os.DirEntry]] = None):
         clips_file = self.session_folder / "clips.json"
         if clips_file.exists():
             try:
@@ -82,26 +236,53 @@ class RecordingManager:
             except Exception:
                 self.clips = []
 
-        # Only match primary shot files (shot_NNNN.mp4), not per-camera files (shot_NNNN_camX.mp4)
-        primary_pattern = re.compile(r"^shot_\d{4}\.mp4$")
-        for video_file in sorted(self.session_folder.glob("shot_*.mp4")):
-            if not primary_pattern.match(video_file.name):
+        if shot_files is None:
+            shot_files = self._list_shot_files()
+        known = {c.get("file") for c in self.clips}
+        for video_file in shot_files:
+            # Only primary shot files (shot_NNNN.mp4), not per-camera files (shot_NNNN_camX.mp4)
+            if video_file.name in known or not _PRIMARY_SHOT_RE.match(video_file.name):
                 continue
-            if not any(c.get("file") == video_file.name for c in self.clips):
-                thumb_file = video_file.with_suffix(".jpg")
-                self.clips.append({
-                    "file": video_file.name,
-                    "thumbnail": thumb_file.name if thumb_file.exists() else None,
-                    "timestamp": video_file.stat().st_mtime,
-                    "cameras": 1,
-                })
+            thumb_name = video_file.name[:-len(".mp4")] + ".jpg"
+            self.clips.append({
+                "file": video_file.name,
+                "thumbnail": thumb_name if (self.session_folder / thumb_name).exists() else None,
+                "timestamp": video_file.stat(follow_symlinks=False).st_mtime,
+                "cameras": 1,
+            })
+            known.add(video_file.name)
 
     def _save_clips_metadata(self):
-        clips_file = self.session_folder / "clips.json"
-        temp_file = clips_file.with_suffix(".tmp")
-        with open(temp_file, "w") as f:
-            json.dump(self.clips, f, indent=2)
-        temp_file.replace(clips_file)
+        """Schedule a write of clips.json.
+
+        Writes are debounced so a burst of deletes or pin toggles costs one
+        serialization. The timer thread is non-daemon, so a pending write
+        still lands if the app exits; call flush() to write immediately.
+        """
+        with self._save_lock:
+            self._clips_dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+                self._save_timer.start()
+
+    def flush(self):
+        """Write clips.json now if there are unsaved changes."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._clips_dirty:
+                return
+            self._clips_dirty = False
+            clips_file = self.session_folder / "clips.json"
+            temp_file = clips_file.with_suffix(".tmp")
+            try:
+                temp_file.write_bytes(dumps_json(self.clips))
+                temp_file.replace(clips_file)
+            except (OSError, RuntimeError) as e:
+                # RuntimeError: clips mutated mid-serialization; a newer
+                # save is already pending or will be scheduled
+                logger.warning("Failed to save clips metadata: %s", e)
 
     def save_clip(self, frames_by_camera: Dict, primary_camera, camera_labels: Dict = None) -> Optional[Dict]:
         """Save a multi-camera clip."""
@@ -125,38 +306,32 @@ class RecordingManager:
             "camera_labels": camera_labels or {},
         }
 
-        for cam_id, frames in frames_by_camera.items():
-            if not frames:
-                continue
-
+        jobs = []
+        for cam_id, frames in active_cameras.items():
             if cam_id == effective_primary:
                 filename = f"{shot_name}.mp4"
             else:
                 filename = f"{shot_name}_cam{cam_id}.mp4"
-
-            filepath = self.session_folder / filename
             clip_info["camera_files"][str(cam_id)] = filename
+            jobs.append((self.session_folder / filename, frames))
 
-            first_frame = frames[0][0]
-            height, width = first_frame.shape[:2]
+        # Encoders release the GIL, so cameras encode concurrently while
+        # this thread writes the thumbnail.
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+            futures = [ex.submit(self._write_video, path, frames) for path, frames in jobs]
 
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(str(filepath), fourcc, self.config.fps, (width, height))
-            try:
-                for frame, _ in frames:
-                    out.write(frame)
-            finally:
-                out.release()
+            frames = active_cameras[effective_primary]
+            mid_idx = len(frames) // 3
+            thumb_frame = frames[mid_idx][0]
+            thumb_path = self.session_folder / f"{shot_name}.jpg"
 
-            if cam_id == effective_primary and frames:
-                mid_idx = len(frames) // 3
-                thumb_frame = frames[mid_idx][0]
-                thumb_path = self.session_folder / f"{shot_name}.jpg"
+            thumb_h, thumb_w = self.config.thumbnail_size[1], self.config.thumbnail_size[0]
+            thumb = cv2.resize(thumb_frame, (thumb_w, thumb_h), interpolation=cv2.INTER_AREA)
+            cv2.imwrite(str(thumb_path), thumb, THUMBNAIL_JPEG_PARAMS)
+            clip_info["thumbnail"] = f"{shot_name}.jpg"
 
-                thumb_h, thumb_w = self.config.thumbnail_size[1], self.config.thumbnail_size[0]
-                thumb = cv2.resize(thumb_frame, (thumb_w, thumb_h))
-                cv2.imwrite(str(thumb_path), thumb)
-                clip_info["thumbnail"] = f"{shot_name}.jpg"
+            for future in futures:
+                future.result()
 
         self.clips.append(clip_info)
         self._save_clips_metadata()
@@ -165,6 +340,51 @@ class RecordingManager:
         logger.info("Saved shot %s (%d cameras)", shot_name, len(frames_by_camera))
         return clip_info
 
+    def _write_video(self, filepath: Path, frames: List[tuple]):
+        """Encode (frame, timestamp) pairs to filepath."""
+        if FFMPEG_PATH:
+            try:
+                self._write_video_ffmpeg(filepath, frames)
+                return
+            except (OSError, subprocess.SubprocessError) as e:
+                logger.warning("ffmpeg encode failed for %s, using OpenCV: %s", filepath.name, e)
+
+        height, width = frames[0][0].shape[:2]
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        out = cv2.VideoWriter(str(filepath), fourcc, self.config.fps, (width, height))
+        write = out.write
+        try:
+            for frame, _ in frames:
+                write(frame)
+        finally:
+            out.release()
+
+    def _write_video_ffmpeg(self, filepath: Path, frames: List[tuple]):
+        """Pipe raw BGR frames into a single ffmpeg libx264 process."""
+        height, width = frames[0][0].shape[:2]
+        cmd = [
+            FFMPEG_PATH, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24",
+            "-s", f"{width}x{height}", "-r", str(self.config.fps),
+            "-i", "-",
+            # yuv420p needs even dimensions
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+            str(filepath),
+        ]
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0,
+                                creationflags=_FFMPEG_CREATIONFLAGS)
+        try:
+            for chunk in _raw_chunks(frames):
+                _write_all(proc.stdin, chunk)
+            _, err = proc.communicate(timeout=60)
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=err)
+
     def delete_clip(self, index: int) -> bool:
         """Delete a clip by index."""
         if 0 <= index < len(self.clips):
@@ -18,12 +18,16 @@ Features:
 
 import sys
 import os
+import difflib
+import html
 import logging
 import logging.handlers
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Tuple
 
 import cv2
 import numpy as np
@@ -34,13 +38,13 @@ from PyQt6.QtWidgets import (
     QGroupBox, QSpinBox, QDoubleSpinBox,
     QCheckBox, QMessageBox, QFileDialog, QMenu, QStatusBar,
     QSizePolicy, QDialog, QDialogButtonBox, QListWidget, QListWidgetItem,
-    QProgressBar, QTabWidget, QLineEdit, QToolBar,
+    QProgressBar, QTabWidget, QLineEdit, QToolBar, QButtonGroup,
 )
 from PyQt6.QtCore import (
     Qt, QTimer, QThread, pyqtSignal, QSize, QPoint, QRect,
 )
 from PyQt6.QtGui import (
-    QImage, QPixmap, QPainter, QColor, QFont, QPen,
+    QImage, QPixmap, QColor, QFont, QPen,
     QIcon, QAction, QPalette, QCursor, QShortcut, QKeySequence,
     QDesktopServices,
 )
@@ -53,14 +57,18 @@ from config import (
     SETTINGS_FILE, TRAINING_DATA_DIR, LOG_DIR,
 )
 from updater import UpdateChecker, UpdateBanner, _load_update_state, _save_update_state
-from audio_engine import AudioDetector, AudioClassifier, MicPreview, enumerate_audio_devices, find_virtual_mic, AUDIO_AVAILABLE
-from camera_engine import CameraCapture, PersonDetector, DroidCamScanner, test_droidcam_connection, test_network_camera, droidcam_url
-from recording import RecordingManager, FrameBuffer
+from audio_engine import (
+    AudioDetector, AudioClassifier, MicPreview, enumerate_audio_devices,
+    refresh_audio_devices, find_virtual_mic, AUDIO_AVAILABLE,
+)
+from camera_engine import CameraCapture, PersonDetector, DroidCamScanner, UsbCameraScanner, test_droidcam_connection, test_network_camera, droidcam_url
+from recording import RecordingManager, FrameBuffer, FramePool
 from drawing_overlay import DrawingOverlay, LineShape, CircleShape
 from comparison_view import ComparisonWindow
 from ui_components import (
     VideoPlayer, PiPWindow, ThumbnailWidget, ClipGallery,
     QTextEditLogHandler, LogPanel, composite_grid, SessionListWidget,
+    DisplayWorker,
 )
 
 
@@ -115,33 +123,37 @@ except ImportError:
     QR_AVAILABLE = False
 
 
+QR_BORDER = 2  # quiet-zone modules around the code
+
+
+@lru_cache(maxsize=16)
+def _qr_matrix(data: str) -> Tuple[Tuple[bool, ...], ...]:
+    """Encode data as a QR module matrix (True = dark), cached per string."""
+    qr = _qrcode_mod.QRCode(
+        version=None, error_correction=_qrcode_mod.constants.ERROR_CORRECT_M,
+        box_size=1, border=QR_BORDER,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return tuple(tuple(row) for row in qr.get_matrix())
+
+
 def _make_qr_pixmap(data: str, size: int = 180) -> Optional[QPixmap]:
     """Generate a QR code QPixmap. Returns None if qrcode lib unavailable."""
-    if not QR_AVAILABLE:
+    if not QR_AVAILABLE or not data or size <= 0:
         return None
     try:
-        qr = _qrcode_mod.QRCode(
-            version=None, error_correction=_qrcode_mod.constants.ERROR_CORRECT_M,
-            box_size=1, border=2,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        matrix = qr.get_matrix()
-        rows = len(matrix)
-        cols = len(matrix[0]) if rows else 0
-        # Render into QImage
-        scale = max(1, size // max(rows, cols, 1))
-        img_w, img_h = cols * scale, rows * scale
-        img = QImage(img_w, img_h, QImage.Format.Format_RGB888)
-        img.fill(QColor(255, 255, 255))
-        painter = QPainter(img)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(0, 0, 0))
-        for r, row in enumerate(matrix):
-            for c, cell in enumerate(row):
-                if cell:
-                    painter.drawRect(c * scale, r * scale, scale, scale)
-        painter.end()
+        matrix = _qr_matrix(data)
+        if not matrix or not matrix[0]:
+            return None
+        # True cells are dark: map to 0, the rest to white
+        bits = np.where(np.asarray(matrix, dtype=bool), 0, 255).astype(np.uint8)
+        rows, cols = bits.shape
+        scale = max(1, size // max(rows, cols))
+        big = np.ascontiguousarray(bits.repeat(scale, axis=0).repeat(scale, axis=1))
+        # fromImage() copies the pixels, so big only has to outlive this call
+        img = QImage(big.data, big.shape[1], big.shape[0], big.strides[0],
+                     QImage.Format.Format_Grayscale8)
         pixmap = QPixmap.fromImage(img).scaled(
             size, size, Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.FastTransformation,
@@ -356,6 +368,14 @@ _DIALOG_SS = """
         background-color: #252525; border: none; border-radius: 4px;
     }
     QProgressBar::chunk { background-color: #4a9eff; border-radius: 3px; }
+    QLabel#connStatus { color: #666; font-size: 12px; padding: 4px; }
+    QLabel#connStatus[state="pending"] { color: #f1c40f; }
+    QLabel#connStatus[state="ok"] { color: #2ecc71; font-weight: bold; }
+    QLabel#connStatus[state="err"] { color: #e74c3c; }
+    QLabel#clientStatus { color: #666; font-size: 11px; padding: 2px; }
+    QLabel#clientStatus[state="pending"] { color: #f1c40f; }
+    QLabel#clientStatus[state="ok"] { color: #2ecc71; }
+    QLabel#clientStatus[state="err"] { color: #e74c3c; }
 """
 
 _PRESET_BTN_SS = """
@@ -369,6 +389,85 @@ _PRESET_BTN_SS = """
 """
 
 
+_MAIN_WINDOW_SS = """
+    QMainWindow { background-color: #1c1c1c; }
+    QGroupBox {
+        color: #d4d4d4; font-weight: bold; font-size: 13px;
+        border: none;
+        margin-top: 12px; padding-top: 8px;
+    }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+    QLabel { color: #d4d4d4; font-size: 12px; }
+    QPushButton {
+        background-color: #333333; color: #d4d4d4;
+        border: 1px solid #3a3a3a; border-radius: 6px;
+        padding: 6px 14px; font-size: 12px;
+    }
+    QPushButton:hover { background-color: #4d4d4d; border-color: #4a4a4a; }
+    QPushButton:pressed { background-color: #252525; }
+    QPushButton:checked { background-color: #4a9eff; color: white; border-color: #4a9eff; }
+    QSlider::groove:horizontal { height: 4px; background-color: #2e2e2e; border-radius: 2px; }
+    QSlider::handle:horizontal {
+        width: 14px; height: 14px; margin: -5px 0;
+        background-color: #4a9eff; border-radius: 7px;
+    }
+    QSlider::sub-page:horizontal { background-color: #4a9eff; border-radius: 2px; }
+    QTabWidget::pane { border: none; border-top: 1px solid #2e2e2e; }
+    QTabBar::tab {
+        background-color: transparent; color: #9a9a9a; padding: 6px 14px;
+        border: none; border-bottom: 2px solid transparent;
+    }
+    QTabBar::tab:selected { color: #fff; border-bottom: 2px solid #4a9eff; }
+    QTabBar::tab:hover { color: #d4d4d4; }
+    QComboBox {
+        background-color: #252525; color: #d4d4d4;
+        border: 1px solid #3a3a3a; border-radius: 4px; padding: 4px 8px;
+    }
+    QComboBox:hover { border-color: #4a4a4a; }
+    QComboBox QAbstractItemView {
+        background-color: #252525; color: #d4d4d4;
+        border: 1px solid #3a3a3a; selection-background-color: rgba(74,158,255,0.2);
+    }
+    QPushButton#drawTool {
+        background-color: transparent; color: #9a9a9a;
+        border: 1px solid #2e2e2e; padding: 2px 10px; font-size: 11px;
+    }
+    QPushButton#drawTool:hover { border-color: #4a4a4a; color: #d4d4d4; }
+    QPushButton#drawTool:checked {
+        background-color: rgba(74,158,255,0.15); color: #4a9eff; border-color: #4a9eff;
+    }
+    QLabel#recordStatus {
+        background-color: transparent; padding: 4px 8px; font-size: 12px;
+        font-weight: normal; color: #9a9a9a;
+    }
+    QLabel#recordStatus[state="armed"] { color: #f0c040; }
+    QLabel#recordStatus[state="recording"] { font-weight: 600; color: #e84c3c; }
+    QLabel#recordStatus[state="captured"] { color: #34d17e; }
+    QLabel#personStatus { color: #666; font-size: 11px; padding: 2px 0; }
+    QLabel#personStatus[state="detected"] { color: #34d17e; }
+"""
+
+
+def _set_style_state(widget: QWidget, state: str):
+    """Switch a widget between the [state=...] variants in its stylesheet."""
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+# Dialog worker threads, held until they exit so that closing a dialog
+# mid-run can't destroy a running QThread.
+_background_threads: set = set()
+
+
+def _start_background_thread(thread: QThread):
+    _background_threads.add(thread)
+    thread.finished.connect(lambda t=thread: _background_threads.discard(t))
+    thread.start()
+
+
 class _ConnectionTestThread(QThread):
     """Background thread for testing network camera connections."""
 
@@ -387,6 +486,104 @@ class _ConnectionTestThread(QThread):
             self.result_ready.emit(False, f"Test error: {e}")
 
 
+class _AudioDeviceScanThread(QThread):
+    """Background thread for PortAudio device enumeration.
+
+    With refresh=True PortAudio is re-initialized first so hot-plugged
+    devices show up, which is slower still.
+    """
+
+    devices_found = pyqtSignal(list)  # enumerate_audio_devices() entries
+
+    def __init__(self, refresh: bool = False):
+        super().__init__()
+        self._refresh = refresh
+
+    def run(self):
+        try:
+            devices = refresh_audio_devices() if self._refresh else enumerate_audio_devices()
+        except Exception as e:
+            logger.warning("Audio device scan failed: %s", e)
+            devices = []
+        self.devices_found.emit(devices)
+
+
+class _ClipLoadThread(QThread):
+    """Background thread decoding a clip's camera files for playback.
+
+    Files are decoded in the order given and camera_loaded fires as each
+    one finishes, so playback can start on the first (primary) angle while
+    the others are still decoding.
+    """
+
+    camera_loaded = pyqtSignal(object, object)  # cam_id, list of BGR frames
+
+    def __init__(self, files: List[Tuple[str, Path]]):
+        super().__init__()
+        self._files = files
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        for cam_id, path in self._files:
+            frames = []
+            cap = cv2.VideoCapture(str(path))
+            try:
+                while not self._cancelled:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    frames.append(frame)
+            except Exception as e:
+                logger.error("Failed to load clip for playback: %s", e)
+            finally:
+                cap.release()
+            if self._cancelled:
+                return
+            if frames:
+                self.camera_loaded.emit(cam_id, frames)
+
+
+class _ClientDownloadThread(QThread):
+    """Background thread that streams a file download to disk."""
+
+    BLOCK_SIZE = 256 * 1024
+
+    progress = pyqtSignal(int)  # percent, 0-100
+    download_done = pyqtSignal(bool, str)  # success, error message
+
+    def __init__(self, url: str, path: Path):
+        super().__init__()
+        self._url = url
+        self._path = path
+
+    def run(self):
+        import urllib.request
+        try:
+            with urllib.request.urlopen(self._url, timeout=30) as resp, open(self._path, "wb") as f:
+                total = int(resp.headers.get("Content-Length") or 0)
+                done = 0
+                last_pct = -1
+                while True:
+                    chunk = resp.read(self.BLOCK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    # At most one signal per percent, however small the blocks
+                    pct = min(100, done * 100 // total) if total else last_pct
+                    if pct != last_pct:
+                        self.progress.emit(pct)
+                        last_pct = pct
+            if last_pct != 100:
+                self.progress.emit(100)
+            self.download_done.emit(True, "")
+        except Exception as e:
+            self.download_done.emit(False, str(e))
+
+
 class NetworkCameraDialog(QDialog):
     """Dialog for adding any network camera (DroidCam, IP Webcam, RTSP, MJPEG, etc.)."""
 
@@ -413,19 +610,19 @@ class NetworkCameraDialog(QDialog):
         preset_group = QGroupBox("Quick Setup (pick an app)")
         preset_group.setStyleSheet(
             "QGroupBox { color: #d4d4d4; font-weight: bold; border: none; "
-            "margin-top: 12px; padding-top: 16px; }"
+            "margin-top: 12px; padding-top: 16px; }" + _PRESET_BTN_SS
         )
         preset_layout = QVBoxLayout(preset_group)
         preset_layout.setSpacing(4)
 
-        self._preset_buttons = []
+        self._preset_group = QButtonGroup(self)
+        self._preset_group.setExclusive(True)
+        self._preset_group.idClicked.connect(self._on_preset_selected)
         for i, preset in enumerate(CAMERA_APP_PRESETS):
             btn = QPushButton(preset["name"])
             btn.setCheckable(True)
-            btn.setStyleSheet(_PRESET_BTN_SS)
-            btn.clicked.connect(lambda checked, idx=i: self._on_preset_selected(idx))
+            self._preset_group.addButton(btn, i)
             preset_layout.addWidget(btn)
-            self._preset_buttons.append(btn)
 
         layout.addWidget(preset_group)
 
@@ -472,16 +669,40 @@ class NetworkCameraDialog(QDialog):
         self.test_btn.clicked.connect(self._test_connection)
         conn_layout.addWidget(self.test_btn)
 
+        self.test_progress = QProgressBar()
+        self.test_progress.setRange(0, 0)  # indeterminate
+        self.test_progress.setVisible(False)
+        self.test_progress.setFixedHeight(8)
+        self.test_progress.setTextVisible(False)
+        conn_layout.addWidget(self.test_progress)
+
         # Status
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setWordWrap(True)
-        self.status_label.setStyleSheet("color: #666; font-size: 12px; padding: 4px;")
+        self.status_label.setObjectName("connStatus")
         conn_layout.addWidget(self.status_label)
 
         layout.addWidget(self.conn_frame)
 
-        # ---- DroidCam Desktop Client section (hidden by default) ----
+        # ---- DroidCam Desktop Client section (built on first use) ----
+        self.client_frame: Optional[QGroupBox] = None
+        self._main_layout = layout
+        self._client_frame_index = layout.count()
+
+        # Spacer
+        layout.addStretch()
+
+        # Done button
+        done_btn = QPushButton("Done")
+        done_btn.setStyleSheet(
+            "background-color: #333333; color: #d4d4d4; border: 1px solid #3a3a3a;"
+        )
+        done_btn.clicked.connect(self.accept)
+        layout.addWidget(done_btn)
+
+    def _build_client_frame(self):
+        """Create the DroidCam client installer section on first use."""
         self.client_frame = QGroupBox("DroidCam Desktop Client (iOS)")
         self.client_frame.setStyleSheet(
             "QGroupBox { color: #d4d4d4; font-weight: bold; border: none; "
@@ -509,7 +730,7 @@ class NetworkCameraDialog(QDialog):
 
         self.client_status_label = QLabel("")
         self.client_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.client_status_label.setStyleSheet("color: #666; font-size: 11px; padding: 2px;")
+        self.client_status_label.setObjectName("clientStatus")
         self.client_status_label.setWordWrap(True)
         client_layout.addWidget(self.client_status_label)
 
@@ -519,26 +740,10 @@ class NetworkCameraDialog(QDialog):
         self.client_progress.setTextVisible(False)
         client_layout.addWidget(self.client_progress)
 
-        self.client_frame.setVisible(False)
-        layout.addWidget(self.client_frame)
-
-        # Spacer
-        layout.addStretch()
-
-        # Done button
-        done_btn = QPushButton("Done")
-        done_btn.setStyleSheet(
-            "background-color: #333333; color: #d4d4d4; border: 1px solid #3a3a3a;"
-        )
-        done_btn.clicked.connect(self.accept)
-        layout.addWidget(done_btn)
+        self._main_layout.insertWidget(self._client_frame_index, self.client_frame)
 
     def _on_preset_selected(self, index: int):
         """Handle preset button click."""
-        # Update button checked states
-        for i, btn in enumerate(self._preset_buttons):
-            btn.setChecked(i == index)
-
         preset = CAMERA_APP_PRESETS[index]
         self._selected_preset = preset
 
@@ -555,7 +760,10 @@ class NetworkCameraDialog(QDialog):
         self.test_btn.setEnabled(has_template or is_custom)
 
         # Show/hide installer section
-        self.client_frame.setVisible(show_installer)
+        if show_installer and self.client_frame is None:
+            self._build_client_frame()
+        if self.client_frame is not None:
+            self.client_frame.setVisible(show_installer)
 
         # Hide connection section for installer-only presets
         self.conn_frame.setVisible(has_template or is_custom)
@@ -586,30 +794,31 @@ class NetworkCameraDialog(QDialog):
         url = self._build_url()
         if not url:
             self.status_label.setText("Please enter an IP address or URL.")
-            self.status_label.setStyleSheet("color: #e74c3c; font-size: 12px; padding: 4px;")
+            _set_style_state(self.status_label, "err")
             return
 
         self.test_btn.setEnabled(False)
         self.test_btn.setText("Testing...")
         self.status_label.setText(f"Testing {url}...")
-        self.status_label.setStyleSheet("color: #f1c40f; font-size: 12px; padding: 4px;")
+        _set_style_state(self.status_label, "pending")
+
+        self.test_progress.setVisible(True)
 
         self._test_url = url
-        self._test_thread = _ConnectionTestThread(url)
-        self._test_thread.result_ready.connect(self._on_test_result)
-        self._test_thread.start()
+        thread = _ConnectionTestThread(url)
+        thread.result_ready.connect(self._on_test_result)
+        _start_background_thread(thread)
 
     def _on_test_result(self, success: bool, message: str):
         """Handle test result from background thread."""
         url = self._test_url
+        self.test_progress.setVisible(False)
         self.test_btn.setEnabled(True)
         self.test_btn.setText("Test Connection")
 
         if success:
             self.status_label.setText(f"{message}")
-            self.status_label.setStyleSheet(
-                "color: #2ecc71; font-size: 12px; padding: 4px; font-weight: bold;"
-            )
+            _set_style_state(self.status_label, "ok")
             # Extract actual working URL if test_network_camera found an alternate
             actual_url = url
             if "(via " in message:
@@ -626,39 +835,36 @@ class NetworkCameraDialog(QDialog):
             logger.info("Network camera verified: %s", actual_url)
         else:
             self.status_label.setText(f"Failed: {message}")
-            self.status_label.setStyleSheet("color: #e74c3c; font-size: 12px; padding: 4px;")
+            _set_style_state(self.status_label, "err")
             logger.warning("Network camera test failed for %s: %s", url, message)
 
     def _download_and_install_client(self):
         """Download and launch the DroidCam Windows client installer."""
         import tempfile
-        import urllib.request
-        import subprocess
 
         self.install_client_btn.setEnabled(False)
         self.install_client_btn.setText("Downloading...")
         self.client_progress.setVisible(True)
         self.client_progress.setValue(0)
         self.client_status_label.setText("Downloading DroidCam Client...")
-        self.client_status_label.setStyleSheet("color: #f1c40f; font-size: 11px; padding: 2px;")
-        QApplication.processEvents()
+        _set_style_state(self.client_status_label, "pending")
 
-        download_dir = Path(tempfile.gettempdir())
-        installer_path = download_dir / DROIDCAM_CLIENT_FILENAME
+        self._installer_path = Path(tempfile.gettempdir()) / DROIDCAM_CLIENT_FILENAME
+        thread = _ClientDownloadThread(DROIDCAM_CLIENT_URL, self._installer_path)
+        thread.progress.connect(self.client_progress.setValue, Qt.ConnectionType.QueuedConnection)
+        thread.download_done.connect(self._on_client_downloaded)
+        _start_background_thread(thread)
 
-        try:
-            def _progress_hook(block_num, block_size, total_size):
-                if total_size > 0:
-                    pct = min(100, int(block_num * block_size * 100 / total_size))
-                    self.client_progress.setValue(pct)
-                    QApplication.processEvents()
+    def _on_client_downloaded(self, success: bool, error: str):
+        import subprocess
 
-            urllib.request.urlretrieve(DROIDCAM_CLIENT_URL, str(installer_path), _progress_hook)
+        installer_path = self._installer_path
+        try:
+            if not success:
+                raise RuntimeError(error)
 
-            self.client_progress.setValue(100)
             self.client_status_label.setText("Download complete. Launching installer...")
-            self.client_status_label.setStyleSheet("color: #2ecc71; font-size: 11px; padding: 2px;")
-            QApplication.processEvents()
+            _set_style_state(self.client_status_label, "ok")
 
             subprocess.Popen([str(installer_path)])
 
@@ -671,7 +877,7 @@ class NetworkCameraDialog(QDialog):
 
         except Exception as e:
             self.client_status_label.setText(f"Download failed: {e}")
-            self.client_status_label.setStyleSheet("color: #e74c3c; font-size: 11px; padding: 2px;")
+            _set_style_state(self.client_status_label, "err")
             logger.error("DroidCam client download failed: %s", e)
 
         finally:
@@ -723,6 +929,7 @@ class CameraSettingsDialog(QDialog):
 
         self._presets: List[CameraPreset] = [CameraPreset.from_dict(c.to_dict()) for c in config.cameras]
         self._current_edit_row = -1
+        self._row_keys: List[Tuple[str, str]] = []
 
         layout = QVBoxLayout(self)
 
@@ -742,10 +949,11 @@ class CameraSettingsDialog(QDialog):
 
         # Camera actions
         btn_row = QHBoxLayout()
-        scan_usb_btn = QPushButton("Detect USB Cameras")
-        scan_usb_btn.setToolTip("Scan for USB webcams and virtual cameras (DroidCam, EpocCam, Camo)")
-        scan_usb_btn.clicked.connect(self._detect_usb)
-        btn_row.addWidget(scan_usb_btn)
+        self.scan_usb_btn = QPushButton("Detect USB Cameras")
+        self.scan_usb_btn.setToolTip("Scan for USB webcams and virtual cameras (DroidCam, EpocCam, Camo)")
+        self.scan_usb_btn.clicked.connect(self._detect_usb)
+        btn_row.addWidget(self.scan_usb_btn)
+        self._usb_scanner: Optional[UsbCameraScanner] = None
 
         remove_btn = QPushButton("Remove")
         remove_btn.setStyleSheet("background-color: #e74c3c;")
@@ -753,44 +961,10 @@ class CameraSettingsDialog(QDialog):
         btn_row.addWidget(remove_btn)
         layout.addLayout(btn_row)
 
-        # Per-camera settings
-        settings_group = QGroupBox("Selected Camera Settings")
-        settings_group.setStyleSheet(
-            "QGroupBox { color: #d4d4d4; font-weight: bold; border: none; "
-            "margin-top: 12px; padding-top: 12px; }"
-        )
-        sg_layout = QVBoxLayout(settings_group)
-
-        label_row = QHBoxLayout()
-        label_row.addWidget(QLabel("Label:"))
-        self.label_input = QLineEdit()
-        label_row.addWidget(self.label_input)
-        sg_layout.addLayout(label_row)
-
-        zoom_row = QHBoxLayout()
-        zoom_row.addWidget(QLabel("Zoom:"))
-        self.zoom_spin = QDoubleSpinBox()
-        self.zoom_spin.setRange(1.0, 4.0)
-        self.zoom_spin.setSingleStep(0.1)
-        self.zoom_spin.setValue(1.0)
-        zoom_row.addWidget(self.zoom_spin)
-        sg_layout.addLayout(zoom_row)
-
-        rot_row = QHBoxLayout()
-        rot_row.addWidget(QLabel("Rotation:"))
-        self.rotation_combo = QComboBox()
-        self.rotation_combo.addItems(["0", "90", "180", "270"])
-        rot_row.addWidget(self.rotation_combo)
-        sg_layout.addLayout(rot_row)
-
-        flip_row = QHBoxLayout()
-        self.flip_h_check = QCheckBox("Flip Horizontal")
-        self.flip_v_check = QCheckBox("Flip Vertical")
-        flip_row.addWidget(self.flip_h_check)
-        flip_row.addWidget(self.flip_v_check)
-        sg_layout.addLayout(flip_row)
-
-        layout.addWidget(settings_group)
+        # Per-camera settings (built on first selection)
+        self.settings_group: Optional[QGroupBox] = None
+        self._main_layout = layout
+        self._settings_group_index = layout.count()
 
         # Primary camera
         primary_row = QHBoxLayout()
@@ -820,35 +994,110 @@ class CameraSettingsDialog(QDialog):
             self._presets.append(CameraPreset(id=url, type="network", label=desc))
             self._refresh_list()
 
+    @staticmethod
+    def _row_text(p: CameraPreset) -> Tuple[str, str]:
+        """Return (list row text, primary combo text) for a preset."""
+        label = p.label or f"Camera {p.id}"
+        type_str = "USB" if p.type == "usb" else "Network"
+        return f"[{type_str}] {label}", label
+
     def _refresh_list(self):
-        self.camera_list.clear()
-        self.primary_combo.clear()
-        for p in self._presets:
-            label = p.label or f"Camera {p.id}"
-            type_str = "USB" if p.type == "usb" else "Network"
-            self.camera_list.addItem(f"[{type_str}] {label}")
-            self.primary_combo.addItem(f"{label}", p.id)
+        # Diff against the rows already shown so a single add/remove only
+        # touches the affected rows instead of rebuilding both widgets
+        keys = [(p.type, str(p.id)) for p in self._presets]
+        matcher = difflib.SequenceMatcher(None, self._row_keys, keys, autojunk=False)
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            for i in range(i2 - 1, i1 - 1, -1):
+                self.camera_list.takeItem(i)
+                self.primary_combo.removeItem(i)
+            for offset, p in enumerate(self._presets[j1:j2]):
+                text, label = self._row_text(p)
+                self.camera_list.insertItem(i1 + offset, text)
+                self.primary_combo.insertItem(i1 + offset, label, p.id)
+        self._row_keys = keys
+
+        # Reused rows may still carry a stale label
+        for row, p in enumerate(self._presets):
+            text, label = self._row_text(p)
+            item = self.camera_list.item(row)
+            if item.text() != text:
+                item.setText(text)
+            if self.primary_combo.itemText(row) != label:
+                self.primary_combo.setItemText(row, label)
         # Restore saved primary camera selection
         for i in range(self.primary_combo.count()):
             if self.primary_combo.itemData(i) == self.config.primary_camera:
                 self.primary_combo.setCurrentIndex(i)
                 break
 
+    def _build_settings_group(self):
+        """Create the per-camera settings form the first time a camera is selected."""
+        self.settings_group = QGroupBox("Selected Camera Settings")
+        self.settings_group.setStyleSheet(
+            "QGroupBox { color: #d4d4d4; font-weight: bold; border: none; "
+            "margin-top: 12px; padding-top: 12px; }"
+        )
+        sg_layout = QVBoxLayout(self.settings_group)
+
+        label_row = QHBoxLayout()
+        label_row.addWidget(QLabel("Label:"))
+        self.label_input = QLineEdit()
+        label_row.addWidget(self.label_input)
+        sg_layout.addLayout(label_row)
+
+        zoom_row = QHBoxLayout()
+        zoom_row.addWidget(QLabel("Zoom:"))
+        self.zoom_spin = QDoubleSpinBox()
+        self.zoom_spin.setRange(1.0, 4.0)
+        self.zoom_spin.setSingleStep(0.1)
+        self.zoom_spin.setValue(1.0)
+        zoom_row.addWidget(self.zoom_spin)
+        sg_layout.addLayout(zoom_row)
+
+        rot_row = QHBoxLayout()
+        rot_row.addWidget(QLabel("Rotation:"))
+        self.rotation_combo = QComboBox()
+        self.rotation_combo.addItems(["0", "90", "180", "270"])
+        rot_row.addWidget(self.rotation_combo)
+        sg_layout.addLayout(rot_row)
+
+        flip_row = QHBoxLayout()
+        self.flip_h_check = QCheckBox("Flip Horizontal")
+        self.flip_v_check = QCheckBox("Flip Vertical")
+        flip_row.addWidget(self.flip_h_check)
+        flip_row.addWidget(self.flip_v_check)
+        sg_layout.addLayout(flip_row)
+
+        res_row = QHBoxLayout()
+        res_row.addWidget(QLabel("Stream size:"))
+        self.resolution_combo = QComboBox()
+        self.resolution_combo.addItem("Camera default", "")
+        for res in ("640x480", "1280x720", "1920x1080"):
+            self.resolution_combo.addItem(res, res)
+        self.resolution_combo.setToolTip("Resolution requested from DroidCam (network cameras only)")
+        res_row.addWidget(self.resolution_combo)
+        sg_layout.addLayout(res_row)
+
+        self._main_layout.insertWidget(self._settings_group_index, self.settings_group)
+
     def _save_row_settings(self, row: int):
         """Save current form values back to the preset at the given row."""
-        if 0 <= row < len(self._presets):
+        if self.settings_group is not None and 0 <= row < len(self._presets):
             p = self._presets[row]
             p.label = self.label_input.text()
             p.zoom = self.zoom_spin.value()
             p.rotation = int(self.rotation_combo.currentText())
             p.flip_h = self.flip_h_check.isChecked()
             p.flip_v = self.flip_v_check.isChecked()
+            if p.type == "network":
+                p.network_resolution = self.resolution_combo.currentData() or ""
             # Update list item and primary combo text to reflect label changes
-            label = p.label or f"Camera {p.id}"
-            type_str = "USB" if p.type == "usb" else "Network"
+            text, label = self._row_text(p)
             item = self.camera_list.item(row)
             if item:
-                item.setText(f"[{type_str}] {label}")
+                item.setText(text)
             if row < self.primary_combo.count():
                 self.primary_combo.setItemText(row, label)
 
@@ -857,6 +1106,8 @@ class CameraSettingsDialog(QDialog):
         if self._current_edit_row >= 0 and self._current_edit_row != row:
             self._save_row_settings(self._current_edit_row)
         if 0 <= row < len(self._presets):
+            if self.settings_group is None:
+                self._build_settings_group()
             self._current_edit_row = row
             p = self._presets[row]
             self.label_input.setText(p.label)
@@ -865,39 +1116,57 @@ class CameraSettingsDialog(QDialog):
             self.rotation_combo.setCurrentIndex(rot_idx)
             self.flip_h_check.setChecked(p.flip_h)
             self.flip_v_check.setChecked(p.flip_v)
+            res_idx = self.resolution_combo.findData(p.network_resolution)
+            self.resolution_combo.setCurrentIndex(max(0, res_idx))
+            self.resolution_combo.setEnabled(p.type == "network")
 
     def _apply_current_settings(self):
         self._save_row_settings(self.camera_list.currentRow())
 
     def _detect_usb(self):
+        if self._usb_scanner is not None and self._usb_scanner.isRunning():
+            return
         existing_usb_ids = {p.id for p in self._presets if p.type == "usb"}
-        for i in range(10):
-            if i in existing_usb_ids:
-                continue
-            found = False
-            if sys.platform == "win32":
-                backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY]
-            else:
-                backends = [cv2.CAP_ANY]
-            for backend in backends:
-                cap = cv2.VideoCapture(i, backend)
-                try:
-                    if cap.isOpened():
-                        ret, _ = cap.read()
-                        if ret:
-                            self._presets.append(CameraPreset(id=i, type="usb", label=f"USB Camera {i}"))
-                            found = True
-                            break
-                finally:
-                    cap.release()
-            # Already found, skip remaining backends
+        self.scan_usb_btn.setEnabled(False)
+        self.scan_usb_btn.setText("Detecting...")
+        self._usb_scanner = UsbCameraScanner(existing_usb_ids, self.config.usb_backend_cache, self)
+        self._usb_scanner.scan_complete.connect(self._on_usb_scan_complete)
+        self._usb_scanner.start()
+
+    def _on_usb_scan_complete(self, found: dict):
+        existing_usb_ids = {p.id for p in self._presets if p.type == "usb"}
+        for i in sorted(found):
+            if i not in existing_usb_ids:
+                self._presets.append(CameraPreset(id=i, type="usb", label=f"USB Camera {i}"))
+
+        # Remember which backend worked; forget indices that were probed and
+        # came up empty
+        cache = self.config.usb_backend_cache
+        for i in range(UsbCameraScanner.MAX_INDEX):
+            if i in found:
+                cache[i] = found[i]
+            elif i not in existing_usb_ids:
+                cache.pop(i, None)
+        save_settings(self.config)
+
+        self.scan_usb_btn.setEnabled(True)
+        self.scan_usb_btn.setText("Detect USB Cameras")
         self._refresh_list()
 
+    def done(self, result: int):
+        # Don't let the dialog's scanner thread be torn down mid-probe
+        if self._usb_scanner is not None and self._usb_scanner.isRunning():
+            self._usb_scanner.wait()
+        super().done(result)
+
     def _remove_camera(self):
         row = self.camera_list.currentRow()
         if 0 <= row < len(self._presets):
             self._presets.pop(row)
+            # The form holds the removed camera; don't save it onto a neighbour
+            self._current_edit_row = -1
             self._refresh_list()
+            self._on_selection_changed(self.camera_list.currentRow())
 
     def _apply_and_accept(self):
         self._apply_current_settings()
@@ -915,49 +1184,87 @@ class CameraSettingsDialog(QDialog):
 # ============================================================================
 
 class KeyboardHelpOverlay(QDialog):
+    """Shortcut reference; MainWindow keeps one instance and hides it on close."""
+
+    SHORTCUTS = (
+        ("Space", "Toggle play/pause"),
+        ("Left Arrow", "Step back one frame"),
+        ("Right Arrow", "Step forward one frame"),
+        ("A", "Toggle arm/disarm"),
+        ("T", "Manual trigger"),
+        ("[", "Decrease playback speed"),
+        ("]", "Increase playback speed"),
+        ("P", "Toggle PiP window"),
+        ("Delete", "Delete selected overlay shape"),
+        ("Escape", "Deselect / exit drawing mode"),
+        ("1", "Select tool"),
+        ("2", "Line tool"),
+        ("3", "Circle tool"),
+        ("?", "Show this help"),
+    )
+
+    # Rendered once: a single rich-text label replaces a widget per cell
+    SHORTCUTS_HTML = (
+        '<table cellspacing="4" cellpadding="4">'
+        + "".join(
+            '<tr><td width="120" style="background-color: #333333; color: #fff; '
+            'font-family: Consolas; font-weight: bold;">&nbsp;&nbsp;'
+            f'{html.escape(key)}&nbsp;&nbsp;</td><td>{html.escape(desc)}</td></tr>'
+            for key, desc in SHORTCUTS
+        )
+        + "</table>"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
+        # Non-modal and shown without taking focus, so the main window's
+        # shortcuts keep working while help is up
+        self.setWindowModality(Qt.WindowModality.NonModal)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, True)
         self.setWindowTitle("Keyboard Shortcuts")
-        self.setMinimumWidth(350)
+        self._sized = False
         self.setStyleSheet("""
             QDialog { background-color: #1c1c1c; }
             QLabel { color: #d4d4d4; font-size: 13px; }
+            QPushButton {
+                background-color: #4a9eff; color: white; border: none;
+                border-radius: 4px; padding: 8px;
+            }
         """)
         layout = QVBoxLayout(self)
-        shortcuts = [
-            ("Space", "Toggle play/pause"),
-            ("Left Arrow", "Step back one frame"),
-            ("Right Arrow", "Step forward one frame"),
-            ("A", "Toggle arm/disarm"),
-            ("T", "Manual trigger"),
-            ("[", "Decrease playback speed"),
-            ("]", "Increase playback speed"),
-            ("P", "Toggle PiP window"),
-            ("Delete", "Delete selected overlay shape"),
-            ("Escape", "Deselect / exit drawing mode"),
-            ("1", "Select tool"),
-            ("2", "Line tool"),
-            ("3", "Circle tool"),
-            ("?", "Show this help"),
-        ]
-        for key, desc in shortcuts:
-            row = QHBoxLayout()
-            key_label = QLabel(f"  {key}  ")
-            key_label.setStyleSheet(
-                "background-color: #333333; border-radius: 4px; padding: 4px 8px; "
-                "font-family: Consolas; font-weight: bold; color: #fff;"
-            )
-            key_label.setFixedWidth(120)
-            row.addWidget(key_label)
-            row.addWidget(QLabel(desc))
-            row.addStretch()
-            layout.addLayout(row)
+        # Build while hidden from paint and settle geometry in one pass
+        self.setUpdatesEnabled(False)
+        shortcuts_label = QLabel(self.SHORTCUTS_HTML)
+        shortcuts_label.setTextFormat(Qt.TextFormat.RichText)
+        shortcuts_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
+        layout.addWidget(shortcuts_label)
 
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet("background-color: #4a9eff; color: white; border: none; border-radius: 4px; padding: 8px;")
-        close_btn.clicked.connect(self.close)
+        # Never the default/focused button, or Space would close the overlay
+        close_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        close_btn.setAutoDefault(False)
+        close_btn.clicked.connect(self.hide)
         layout.addWidget(close_btn)
 
+        # Nothing here reacts to hover; keep move events from being
+        # generated or bubbled up while the overlay is open
+        for widget in (self, *self.findChildren(QWidget)):
+            widget.setMouseTracking(False)
+            widget.setTabletTracking(False)
+            if widget is not self:
+                widget.setAttribute(Qt.WidgetAttribute.WA_NoMousePropagation, True)
+
+        layout.activate()
+        self.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        # Take the minimum width from the laid-out content once, on first show
+        if not self._sized:
+            self.setMinimumWidth(max(350, self.sizeHint().width()))
+            self._sized = True
+        super().showEvent(event)
+
 
 # ============================================================================
 # Main Application Window
@@ -967,6 +1274,12 @@ class MainWindow(QMainWindow):
     """Main application window."""
 
     SPEED_OPTIONS = [0.25, 0.5, 0.75, 1.0, 1.5, 2.0]
+    SETTINGS_SAVE_INTERVAL = 1.0  # seconds between settings writes while values change
+    STATUS_REFRESH_MS = 500  # camera status bar coalesces fps updates this long
+    FPS_SMOOTHING = 0.5  # EMA weight of each new fps measurement
+    METER_REFRESH_MS = 33  # audio level bars repaint at most this often
+
+    person_state_changed = pyqtSignal(bool)  # emitted from the detection worker
 
     def __init__(self, log_handler: QTextEditLogHandler):
         super().__init__()
@@ -979,14 +1292,24 @@ class MainWindow(QMainWindow):
         # State
         self.camera_captures: Dict = {}
         self.frame_buffers: Dict = {}
-        self.camera_fps: Dict = {}  # cam_id -> latest measured FPS
+        self.frame_pools: Dict = {}  # post-trigger frame storage per camera, while recording
+        self.camera_fps: Dict = {}  # cam_id -> smoothed measured FPS
+        self._last_status_text = ""
+        # Display-only frame skipping; buffering and recording see every frame
+        self._display_pending: Dict = {}  # cam_id -> frames since the last live draw
+        self._display_skipped: Dict = {}  # cam_id -> frames never drawn, since last status
+        self._capture_skipped_seen: Dict = {}  # cam_id -> capture.dropped_frames last reported
+        self._live_drawn: Optional[tuple] = None  # what the last live draw showed, and at what size
+        self._live_frame: Optional[np.ndarray] = None  # the frame that draw queued
         self.audio_detector: Optional[AudioDetector] = None
         self.current_frames: Dict = {}
 
         self.is_armed = False
         self.is_recording = False
-        self.recording_start_time = 0
         self.recorded_frames: Dict = {}
+        # Frames the capture threads append while recording; merged into
+        # recorded_frames once their sinks are detached
+        self._post_trigger_frames: Dict = {}
         self.last_trigger_confidence = 0.0
         self.last_trigger_timestamp: Optional[int] = None
 
@@ -1001,20 +1324,30 @@ class MainWindow(QMainWindow):
         self.playback_camera_labels: Dict[str, str] = {}  # cam_id -> label
         self.playback_active_camera: Optional[str] = None  # current angle cam_id
         self.playback_multi_view = False  # True = grid view of all cameras
+        self._clip_loader: Optional[_ClipLoadThread] = None  # decoding the selected clip
 
         self.live_visible_cameras: set = set()  # cameras shown in live feed
         self.pip_window: Optional[PiPWindow] = None
+        self._help_overlay: Optional[KeyboardHelpOverlay] = None  # built on first "?"
+        # One detector and one worker for the whole app: at most one
+        # detection pass runs at a time, off the GUI thread.
         self.person_detector = PersonDetector()
+        self._detect_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="person-detect")
+        self._detect_future = None
+        self.person_state_changed.connect(self._on_person_state_changed)
         self.person_detected = False
         self._test_camera_server = None
+        # cam_id -> frame handler specialised to the current arm/record state
+        self._frame_handlers: Dict = {}
 
         self.log_handler = log_handler
 
-        # Debounce timer for save_settings (frequent changes like threshold slider)
+        # Rate limit for save_settings (frequent changes like threshold slider):
+        # write at once, then at most once per interval with the latest values
+        self._last_settings_save = 0.0
         self._save_debounce_timer = QTimer()
         self._save_debounce_timer.setSingleShot(True)
-        self._save_debounce_timer.setInterval(1000)
-        self._save_debounce_timer.timeout.connect(lambda: save_settings(self.config))
+        self._save_debounce_timer.timeout.connect(self._save_settings_now)
 
         self._setup_ui()
         self._setup_timers()
@@ -1042,46 +1375,7 @@ class MainWindow(QMainWindow):
             if len(g) == 4 and g[2] > 100 and g[3] > 100 and g[0] >= -100 and g[1] >= -100:
                 self.setGeometry(g[0], g[1], g[2], g[3])
 
-        self.setStyleSheet("""
-            QMainWindow { background-color: #1c1c1c; }
-            QGroupBox {
-                color: #d4d4d4; font-weight: bold; font-size: 13px;
-                border: none;
-                margin-top: 12px; padding-top: 8px;
-            }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QLabel { color: #d4d4d4; font-size: 12px; }
-            QPushButton {
-                background-color: #333333; color: #d4d4d4;
-                border: 1px solid #3a3a3a; border-radius: 6px;
-                padding: 6px 14px; font-size: 12px;
-            }
-            QPushButton:hover { background-color: #4d4d4d; border-color: #4a4a4a; }
-            QPushButton:pressed { background-color: #252525; }
-            QPushButton:checked { background-color: #4a9eff; color: white; border-color: #4a9eff; }
-            QSlider::groove:horizontal { height: 4px; background-color: #2e2e2e; border-radius: 2px; }
-            QSlider::handle:horizontal {
-                width: 14px; height: 14px; margin: -5px 0;
-                background-color: #4a9eff; border-radius: 7px;
-            }
-            QSlider::sub-page:horizontal { background-color: #4a9eff; border-radius: 2px; }
-            QTabWidget::pane { border: none; border-top: 1px solid #2e2e2e; }
-            QTabBar::tab {
-                background-color: transparent; color: #9a9a9a; padding: 6px 14px;
-                border: none; border-bottom: 2px solid transparent;
-            }
-            QTabBar::tab:selected { color: #fff; border-bottom: 2px solid #4a9eff; }
-            QTabBar::tab:hover { color: #d4d4d4; }
-            QComboBox {
-                background-color: #252525; color: #d4d4d4;
-                border: 1px solid #3a3a3a; border-radius: 4px; padding: 4px 8px;
-            }
-            QComboBox:hover { border-color: #4a4a4a; }
-            QComboBox QAbstractItemView {
-                background-color: #252525; color: #d4d4d4;
-                border: 1px solid #3a3a3a; selection-background-color: rgba(74,158,255,0.2);
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_SS)
 
         # Central widget
         central = QWidget()
@@ -1126,20 +1420,10 @@ class MainWindow(QMainWindow):
             btn.clicked.connect(lambda checked, c=color: self._set_drawing_color(c))
             self.color_btns.append(btn)
 
-        tool_btn_style = """
-            QPushButton {
-                background-color: transparent; color: #9a9a9a;
-                border: 1px solid #2e2e2e; padding: 2px 10px; font-size: 11px;
-            }
-            QPushButton:hover { border-color: #4a4a4a; color: #d4d4d4; }
-            QPushButton:checked {
-                background-color: rgba(74,158,255,0.15); color: #4a9eff; border-color: #4a9eff;
-            }
-        """
         self._tool_buttons = [self.select_tool_btn, self.line_tool_btn, self.circle_tool_btn]
         for btn in self._tool_buttons:
             btn.setFixedHeight(26)
-            btn.setStyleSheet(tool_btn_style)
+            btn.setObjectName("drawTool")
             drawing_toolbar.addWidget(btn)
 
         self.clear_draw_btn.setStyleSheet(
@@ -1186,7 +1470,19 @@ class MainWindow(QMainWindow):
         self.angle_bar_layout = QHBoxLayout(self.angle_bar)
         self.angle_bar_layout.setContentsMargins(4, 2, 4, 2)
         self.angle_bar_layout.setSpacing(4)
-        self.angle_bar.setStyleSheet("background-color: #252525; border-radius: 4px;")
+        # Buttons are inserted ahead of this trailing stretch
+        self.angle_bar_layout.addStretch()
+        # Angle buttons come and go with each clip; they are styled here once
+        self.angle_bar.setObjectName("angleBar")
+        self.angle_bar.setStyleSheet("""
+            QWidget#angleBar { background-color: #252525; border-radius: 4px; }
+            QPushButton {
+                background-color: #333333; color: #d4d4d4;
+                border: 1px solid #3a3a3a; border-radius: 4px; padding: 4px 12px; font-size: 12px;
+            }
+            QPushButton:hover { background-color: #4d4d4d; }
+            QPushButton:checked { background-color: #4a9eff; color: white; border-color: #4a9eff; }
+        """)
         self.angle_buttons: List[QPushButton] = []
         self.multi_view_btn: Optional[QPushButton] = None
         self.angle_bar.setVisible(False)
@@ -1220,6 +1516,14 @@ class MainWindow(QMainWindow):
         )
 
         self.live_btn = QPushButton("Live")
+        # Green while showing the live feed; see _update_live_btn_style
+        self.live_btn.setStyleSheet("""
+            QPushButton[state="active"] {
+                background-color: #34d17e; color: white; border: 1px solid #34d17e;
+                border-radius: 6px; padding: 6px 14px; font-size: 12px;
+            }
+            QPushButton[state="active"]:hover { background-color: #2aba6e; }
+        """)
         self.live_btn.clicked.connect(self._go_to_live)
         playback_layout.addWidget(self.live_btn)
         self._update_live_btn_style()
@@ -1294,6 +1598,17 @@ class MainWindow(QMainWindow):
         record_layout.addWidget(self.manual_trigger_btn)
 
         self.phone_btn = QPushButton("Connect Phone")
+        # Text colour follows the connection state; see _set_phone_btn_state
+        self.phone_btn.setStyleSheet("""
+            QPushButton {
+                color: #9a9a9a; border-color: #3a3a3a; background-color: #333333; border: 1px solid;
+                border-radius: 6px; padding: 6px 14px; font-size: 12px;
+            }
+            QPushButton:hover { background-color: #4d4d4d; }
+            QPushButton[state="connecting"] { color: #f0c040; }
+            QPushButton[state="connected"] { color: #34d17e; }
+            QPushButton[state="disconnected"] { color: #e84c3c; }
+        """)
         self.phone_btn.clicked.connect(self._on_phone_btn_clicked)
         record_layout.addWidget(self.phone_btn)
         self._set_phone_btn_state("idle")
@@ -1310,16 +1625,14 @@ class MainWindow(QMainWindow):
             QProgressBar { background-color: #252525; border: none; border-radius: 2px; }
             QProgressBar::chunk { background-color: #4a9eff; border-radius: 2px; }
         """)
+        self._pending_audio_level = 0
         record_layout.addWidget(self.audio_level)
 
         left_layout.addWidget(record_group)
 
         # Status
         self.status_label = QLabel("\u25cf  Ready - Arm to begin capturing")
-        self.status_label.setStyleSheet(
-            "QLabel { background-color: transparent; padding: 4px 8px; font-size: 12px; "
-            "font-weight: normal; color: #9a9a9a; }"
-        )
+        self.status_label.setObjectName("recordStatus")
         left_layout.addWidget(self.status_label)
 
         main_layout.addWidget(left_panel, stretch=2)
@@ -1363,7 +1676,7 @@ class MainWindow(QMainWindow):
         det_layout.addWidget(self.auto_ready_check)
 
         self.person_status_label = QLabel("Person: Not detected")
-        self.person_status_label.setStyleSheet("color: #666; font-size: 11px; padding: 2px 0;")
+        self.person_status_label.setObjectName("personStatus")
         det_layout.addWidget(self.person_status_label)
 
         det_layout.addWidget(QLabel("Audio Classifier:"))
@@ -1398,44 +1711,18 @@ class MainWindow(QMainWindow):
         audio_dev_row.addWidget(QLabel("Audio Device:"))
         self.audio_device_combo = QComboBox()
         self.audio_device_combo.addItem("Default", None)
-        virtual_mic_index = None
-        for dev in enumerate_audio_devices():
-            name = dev["name"][:30]
-            if dev.get("is_virtual"):
-                name += " (phone mic)"
-            self.audio_device_combo.addItem(name, dev["index"])
-            if dev.get("is_virtual") and virtual_mic_index is None:
-                virtual_mic_index = self.audio_device_combo.count() - 1
-        if self.config.audio_device_index is not None:
-            # Try matching by saved device name first (indices shift across reboots)
-            matched = False
-            if self.config.audio_device_name:
-                for i in range(self.audio_device_combo.count()):
-                    if self.config.audio_device_name in (self.audio_device_combo.itemText(i) or ""):
-                        self.audio_device_combo.setCurrentIndex(i)
-                        self.config.audio_device_index = self.audio_device_combo.itemData(i)
-                        matched = True
-                        break
-            # Fall back to saved index
-            if not matched:
-                for i in range(self.audio_device_combo.count()):
-                    if self.audio_device_combo.itemData(i) == self.config.audio_device_index:
-                        self.audio_device_combo.setCurrentIndex(i)
-                        break
-        elif virtual_mic_index is not None:
-            # Auto-select phone virtual mic when no device is configured
-            self.audio_device_combo.setCurrentIndex(virtual_mic_index)
-            self.config.audio_device_index = self.audio_device_combo.itemData(virtual_mic_index)
-            logger.info("Auto-selected virtual phone mic: %s",
-                        self.audio_device_combo.currentText())
+        # PortAudio enumeration can block for hundreds of ms; the list is
+        # filled from a worker once it is done (_on_audio_devices_found)
+        self.audio_device_combo.setEnabled(False)
         self.audio_device_combo.currentIndexChanged.connect(self._on_audio_device_changed)
         audio_dev_row.addWidget(self.audio_device_combo, stretch=1)
 
-        refresh_audio_btn = QPushButton("Refresh")
-        refresh_audio_btn.setToolTip("Rescan audio devices (use after connecting DroidCam or other virtual mic)")
-        refresh_audio_btn.setFixedWidth(70)
-        refresh_audio_btn.clicked.connect(self._refresh_audio_devices)
-        audio_dev_row.addWidget(refresh_audio_btn)
+        self.refresh_audio_btn = QPushButton("Refresh")
+        self.refresh_audio_btn.setToolTip("Rescan audio devices (use after connecting DroidCam or other virtual mic)")
+        self.refresh_audio_btn.setFixedWidth(70)
+        self.refresh_audio_btn.setEnabled(False)
+        self.refresh_audio_btn.clicked.connect(self._refresh_audio_devices)
+        audio_dev_row.addWidget(self.refresh_audio_btn)
 
         self.test_mic_btn = QPushButton("Test")
         self.test_mic_btn.setToolTip("Preview audio level from the selected mic (auto-starts on device change)")
@@ -1449,12 +1736,23 @@ class MainWindow(QMainWindow):
         self.mic_preview_bar.setMaximum(100)
         self.mic_preview_bar.setTextVisible(False)
         self.mic_preview_bar.setFixedHeight(12)
+        # Blue below threshold, yellow approaching it, red at/above it
+        self.mic_preview_bar.setStyleSheet("""
+            QProgressBar { background-color: #252525; border: none; border-radius: 4px; }
+            QProgressBar::chunk { background-color: #4fc3f7; border-radius: 4px; }
+            QProgressBar[state="near"]::chunk { background-color: #f0c040; }
+            QProgressBar[state="over"]::chunk { background-color: #e84c3c; }
+        """)
         self._mic_preview_level = 0
         self._update_mic_bar_style()
         audio_group_layout.addWidget(self.mic_preview_bar)
 
         self._mic_preview: Optional[MicPreview] = None
 
+        device_scan = _AudioDeviceScanThread()
+        device_scan.devices_found.connect(self._on_audio_devices_found)
+        _start_background_thread(device_scan)
+
         thr_row = QHBoxLayout()
         thr_row.addWidget(QLabel("Threshold:"))
         self.threshold_slider = QSlider(Qt.Orientation.Horizontal)
@@ -1542,18 +1840,56 @@ class MainWindow(QMainWindow):
         self.statusBar().setStyleSheet("color: #555;")
         self.statusBar().showMessage(f"Session: {self.config.session_folder}")
 
+    # ------------------------------------------------------------------
+    # Settings persistence
+    # ------------------------------------------------------------------
+
+    def _schedule_save_settings(self):
+        wait = self._last_settings_save + self.SETTINGS_SAVE_INTERVAL - time.monotonic()
+        if wait <= 0:
+            self._save_settings_now()
+        elif not self._save_debounce_timer.isActive():
+            # Not restarted by later changes: the trailing write happens at
+            # the end of the interval and picks up whatever changed since
+            self._save_debounce_timer.start(int(wait * 1000) + 1)
+
+    def _save_settings_now(self):
+        self._save_debounce_timer.stop()
+        self._last_settings_save = time.monotonic()
+        save_settings(self.config)
+
     # ------------------------------------------------------------------
     # Timers
     # ------------------------------------------------------------------
 
     def _setup_timers(self):
+        # Live frames are converted for the player on this worker
+        self._showing_live = False
+        self.display_worker = DisplayWorker(self)
+        self.display_worker.image_ready.connect(self._on_display_image)
+        self.display_worker.start()
+
         self.display_timer = QTimer()
         self.display_timer.timeout.connect(self._update_display)
         self.display_timer.start(33)
 
+        # Pending fps updates are folded into one status bar refresh
+        self._status_timer = QTimer()
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.STATUS_REFRESH_MS)
+        self._status_timer.timeout.connect(self._update_camera_status)
+
+        # Audio level signals only store the latest value; the bars are
+        # repainted from it at most once per METER_REFRESH_MS
+        self._meter_timer = QTimer()
+        self._meter_timer.setSingleShot(True)
+        self._meter_timer.setInterval(self.METER_REFRESH_MS)
+        self._meter_timer.timeout.connect(self._apply_audio_levels)
+
+        # Armed at trigger time to end the clip after post_trigger_seconds
         self.recording_timer = QTimer()
+        self.recording_timer.setSingleShot(True)
         self.recording_timer.timeout.connect(self._check_recording)
-        self.recording_timer.start(100)
 
         self.playback_timer = QTimer()
         self.playback_timer.timeout.connect(self._playback_tick)
@@ -1582,6 +1918,7 @@ class MainWindow(QMainWindow):
         for key, callback in shortcuts.items():
             sc = QShortcut(QKeySequence(key), self)
             sc.activated.connect(callback)
+        self._shortcut_callbacks = shortcuts
 
     def _toggle_playback_shortcut(self):
         self.play_btn.setChecked(not self.play_btn.isChecked())
@@ -1602,8 +1939,16 @@ class MainWindow(QMainWindow):
             self.speed_combo.setCurrentIndex(idx + 1)
 
     def _show_help(self):
-        dlg = KeyboardHelpOverlay(self)
-        dlg.exec()
+        if self._help_overlay is None:
+            self._help_overlay = KeyboardHelpOverlay(self)
+            # Mirror the shortcuts for when the user clicks into the overlay;
+            # Escape stays with the dialog and closes it
+            for key, callback in self._shortcut_callbacks.items():
+                if key != "Escape":
+                    sc = QShortcut(QKeySequence(key), self._help_overlay)
+                    sc.activated.connect(callback)
+        self._help_overlay.show()
+        self._help_overlay.raise_()
 
     # ------------------------------------------------------------------
     # Camera Management
@@ -1665,18 +2010,16 @@ class MainWindow(QMainWindow):
 
     def _set_phone_btn_state(self, state: str):
         """Update phone button appearance based on connection state."""
-        styles = {
-            "idle": ("color: #9a9a9a; border-color: #3a3a3a;", None),
-            "connecting": ("color: #f0c040; border-color: #f0c040;", "Connecting..."),
-            "connected": ("color: #34d17e; border-color: #34d17e;", "Phone Connected"),
-            "disconnected": ("color: #e84c3c; border-color: #e84c3c;", "Reconnect Phone"),
+        texts = {
+            "idle": None,
+            "connecting": "Connecting...",
+            "connected": "Phone Connected",
+            "disconnected": "Reconnect Phone",
         }
-        style, text = styles.get(state, styles["idle"])
-        self.phone_btn.setStyleSheet(
-            f"QPushButton {{ {style} background-color: #333333; border: 1px solid; "
-            f"border-radius: 6px; padding: 6px 14px; font-size: 12px; }}"
-            f"QPushButton:hover {{ background-color: #4d4d4d; }}"
-        )
+        if state not in texts:
+            state = "idle"
+        text = texts[state]
+        _set_style_state(self.phone_btn, state)
         if text:
             self.phone_btn.setText(text)
         else:
@@ -1742,6 +2085,8 @@ class MainWindow(QMainWindow):
         self.frame_buffers[cam_id] = FrameBuffer(
             self.config.pre_trigger_seconds, self.config.fps
         )
+        self._frame_handlers[cam_id] = self._make_frame_handler(cam_id)
+        capture.set_frame_sink(self._make_frame_sink(cam_id))
         logger.info("Started camera: %s (%s)", preset.label or cam_id, preset.type)
 
     def _stop_camera(self, cam_id):
@@ -1750,30 +2095,56 @@ class MainWindow(QMainWindow):
             del self.camera_captures[cam_id]
             if cam_id in self.frame_buffers:
                 del self.frame_buffers[cam_id]
+            self.frame_pools.pop(cam_id, None)
+            self._frame_handlers.pop(cam_id, None)
             # Clean up stale frame references
             self.current_frames.pop(cam_id, None)
             self.camera_fps.pop(cam_id, None)
+            for counts in (self._display_pending, self._display_skipped, self._capture_skipped_seen):
+                counts.pop(cam_id, None)
             self.live_visible_cameras.discard(cam_id)
             self._rebuild_camera_dropdown()
             self._sync_pip_cameras()
 
     def _on_fps_update(self, camera_id, fps: float):
+        prev = self.camera_fps.get(camera_id)
+        if prev is not None:
+            fps = prev + self.FPS_SMOOTHING * (fps - prev)
         self.camera_fps[camera_id] = fps
-        self._update_camera_status()
+        if not self._status_timer.isActive():
+            self._status_timer.start()
 
     def _update_camera_status(self):
+        self._status_timer.stop()
         parts = []
         for p in self.config.cameras:
             label = p.label or str(p.id)
             fps = self.camera_fps.get(p.id)
             has_frames = p.id in self.current_frames
-            if fps is not None and has_frames:
+            skipped = self._take_display_skips(p.id)
+            if fps is not None and has_frames and skipped:
+                parts.append(f"[OK] {label} ({fps:.0f} fps, {skipped} not shown)")
+            elif fps is not None and has_frames:
                 parts.append(f"[OK] {label} ({fps:.0f} fps)")
             elif has_frames:
                 parts.append(f"[OK] {label}")
             else:
                 parts.append(f"[--] {label}")
-        self.camera_status.setText(" | ".join(parts))
+        text = " | ".join(parts)
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self.camera_status.setText(text)
+
+    def _take_display_skips(self, cam_id) -> int:
+        """Frames of cam_id the display skipped since the last status
+        update, whether at the capture thread or within a display tick."""
+        skipped = self._display_skipped.pop(cam_id, 0)
+        capture = self.camera_captures.get(cam_id)
+        if capture is not None:
+            total = capture.dropped_frames
+            skipped += total - self._capture_skipped_seen.get(cam_id, 0)
+            self._capture_skipped_seen[cam_id] = total
+        return skipped
 
     def _toggle_test_camera(self):
         """Start/stop a mock MJPEG camera server for testing."""
@@ -1839,14 +2210,58 @@ class MainWindow(QMainWindow):
             # Auto-start mic preview so user can see levels immediately
             self._start_mic_preview()
 
+    def _on_audio_devices_found(self, devices: list):
+        """Fill the device combo from the startup scan and restore the saved choice."""
+        self.audio_device_combo.blockSignals(True)
+        virtual_mic_index = None
+        for dev in devices:
+            name = dev["name"][:30]
+            if dev.get("is_virtual"):
+                name += " (phone mic)"
+            self.audio_device_combo.addItem(name, dev["index"])
+            if dev.get("is_virtual") and virtual_mic_index is None:
+                virtual_mic_index = self.audio_device_combo.count() - 1
+        if self.config.audio_device_index is not None:
+            # Try matching by saved device name first (indices shift across reboots)
+            matched = False
+            if self.config.audio_device_name:
+                for i in range(self.audio_device_combo.count()):
+                    if self.config.audio_device_name in (self.audio_device_combo.itemText(i) or ""):
+                        self.audio_device_combo.setCurrentIndex(i)
+                        self.config.audio_device_index = self.audio_device_combo.itemData(i)
+                        matched = True
+                        break
+            # Fall back to saved index
+            if not matched:
+                for i in range(self.audio_device_combo.count()):
+                    if self.audio_device_combo.itemData(i) == self.config.audio_device_index:
+                        self.audio_device_combo.setCurrentIndex(i)
+                        break
+        elif virtual_mic_index is not None:
+            # Auto-select phone virtual mic when no device is configured
+            self.audio_device_combo.setCurrentIndex(virtual_mic_index)
+            self.config.audio_device_index = self.audio_device_combo.itemData(virtual_mic_index)
+            logger.info("Auto-selected virtual phone mic: %s",
+                        self.audio_device_combo.currentText())
+        self.audio_device_combo.blockSignals(False)
+        self.audio_device_combo.setEnabled(True)
+        self.refresh_audio_btn.setEnabled(True)
+
     def _refresh_audio_devices(self):
-        """Rescan audio devices and update the combo box."""
+        """Rescan audio devices on a worker; the combo updates when it finishes."""
+        self.refresh_audio_btn.setEnabled(False)
+        self.audio_device_combo.setEnabled(False)
+        device_scan = _AudioDeviceScanThread(refresh=True)
+        device_scan.devices_found.connect(self._on_audio_devices_refreshed)
+        _start_background_thread(device_scan)
+
+    def _on_audio_devices_refreshed(self, devices: list):
         current_idx = self.audio_device_combo.currentData()
         self.audio_device_combo.blockSignals(True)
         self.audio_device_combo.clear()
         self.audio_device_combo.addItem("Default", None)
         virtual_mic_index = None
-        for dev in enumerate_audio_devices():
+        for dev in devices:
             name = dev["name"][:30]
             if dev.get("is_virtual"):
                 name += " (phone mic)"
@@ -1868,6 +2283,8 @@ class MainWindow(QMainWindow):
             logger.info("Auto-selected virtual phone mic: %s",
                         self.audio_device_combo.currentText())
         self.audio_device_combo.blockSignals(False)
+        self.audio_device_combo.setEnabled(True)
+        self.refresh_audio_btn.setEnabled(True)
         logger.info("Audio devices refreshed, %d devices found",
                     self.audio_device_combo.count() - 1)
 
@@ -1898,8 +2315,8 @@ class MainWindow(QMainWindow):
 
     def _on_mic_preview_level(self, level: float):
         self._mic_preview_level = int(level * 100)
-        self.mic_preview_bar.setValue(self._mic_preview_level)
-        self._update_mic_bar_style()
+        if not self._meter_timer.isActive():
+            self._meter_timer.start()
 
     def _on_mic_preview_finished(self):
         self.test_mic_btn.setText("Test")
@@ -1913,59 +2330,134 @@ class MainWindow(QMainWindow):
         threshold_pct = int(self.config.audio_threshold * 100)
         level = self._mic_preview_level
         if level >= threshold_pct and level > 0:
-            color = "#e84c3c"  # red — above threshold
+            state = "over"
         elif level > threshold_pct * 0.5 and level > 0:
-            color = "#f0c040"  # yellow — approaching threshold
+            state = "near"
         else:
-            color = "#4fc3f7"  # blue — below threshold
-        self.mic_preview_bar.setStyleSheet(f"""
-            QProgressBar {{ background-color: #252525; border: none; border-radius: 4px; }}
-            QProgressBar::chunk {{ background-color: {color}; border-radius: 4px; }}
-        """)
+            state = ""
+        _set_style_state(self.mic_preview_bar, state)
 
     # ------------------------------------------------------------------
     # Frame Handling
     # ------------------------------------------------------------------
 
-    def _on_frame_ready(self, camera_id, frame: np.ndarray, timestamp: float):
-        is_new = camera_id not in self.current_frames
-        self.current_frames[camera_id] = frame.copy()
+    def _on_frame_ready(self, camera_id, slot: int, timestamp: float):
+        capture = self.camera_captures.get(camera_id)
+        if capture is None:
+            return
+        pending = self._display_pending.get(camera_id, 0) + 1
+        self._display_pending[camera_id] = pending
+        if pending > 1:
+            # The previous frame arrived within the same display tick and is
+            # superseded before it was drawn
+            self._display_skipped[camera_id] = self._display_skipped.get(camera_id, 0) + 1
+        try:
+            frame = capture.frame_at(slot)
+            handler = self._frame_handlers.get(camera_id)
+            if frame is not None and handler is not None:
+                handler(frame, timestamp)
+        finally:
+            # Lets the capture thread publish its next frame
+            capture.mark_frame_consumed()
 
-        if is_new:
-            # Camera just connected — add to visible set and refresh dropdown
-            self.live_visible_cameras.add(camera_id)
-            self._rebuild_camera_dropdown()
-            self._sync_pip_cameras()
+    def _rebuild_frame_handlers(self):
+        """Re-specialise every camera's frame handler and frame sink to the
+        current state.
 
-        if self.is_armed and camera_id in self.frame_buffers:
-            self.frame_buffers[camera_id].add_frame(frame, timestamp)
+        Armed, recording, primary camera and auto-ready change at human
+        speed while frames arrive at camera speed, so the branching is done
+        here once per state change instead of on every frame.
+        """
+        self._frame_handlers = {
+            cam_id: self._make_frame_handler(cam_id) for cam_id in self.camera_captures
+        }
+        for cam_id, capture in self.camera_captures.items():
+            capture.set_frame_sink(self._make_frame_sink(cam_id))
 
+    def _make_frame_sink(self, camera_id) -> Optional[Callable[[np.ndarray, float], None]]:
+        """Consumer of every frame from camera_id, run on its capture thread.
+
+        Buffering and recording happen there, so frames the display skips
+        still reach the pre-trigger ring and the clip.
+        """
         if self.is_recording:
-            if camera_id not in self.recorded_frames:
-                self.recorded_frames[camera_id] = []
-            self.recorded_frames[camera_id].append((frame.copy(), timestamp))
+            clip = self._post_trigger_frames.setdefault(camera_id, [])
+            pool = self.frame_pools.get(camera_id)
+            store = pool.store if pool is not None else np.copy
+            return lambda frame, timestamp: clip.append((store(frame), timestamp))
+        buffer = self.frame_buffers.get(camera_id)
+        if self.is_armed and buffer is not None:
+            return buffer.add_frame
+        return None
 
-        # Person detection on primary camera
+    def _make_frame_handler(self, camera_id) -> Callable[[np.ndarray, float], None]:
+        current = self.current_frames
+
+        if camera_id not in current:
+            def first_frame(frame, timestamp):
+                # Camera just connected — add to visible set and refresh dropdown
+                current[camera_id] = frame
+                self.live_visible_cameras.add(camera_id)
+                self._rebuild_camera_dropdown()
+                self._sync_pip_cameras()
+                handler = self._make_frame_handler(camera_id)
+                self._frame_handlers[camera_id] = handler
+                handler(frame, timestamp)
+            return first_frame
+
+        # The ring slot stays valid until the camera wraps around; the live
+        # display copies before drawing on it. Buffering and recording are
+        # done by the capture thread's frame sink, not here.
+        steps = []
         if camera_id == self.config.primary_camera and self.config.auto_ready_enabled:
-            try:
-                state_change = self.person_detector.check(frame)
-                if state_change is not None:
-                    self._on_person_state_changed(state_change)
-            except Exception as e:
-                logger.debug("Person detection error: %s", e)
+            steps.append(self._maybe_detect_person)
+
+        if not steps:
+            def handler(frame, timestamp):
+                current[camera_id] = frame
+        elif len(steps) == 1:
+            step = steps[0]
+
+            def handler(frame, timestamp):
+                current[camera_id] = frame
+                step(frame, timestamp)
+        else:
+            def handler(frame, timestamp):
+                current[camera_id] = frame
+                for step in steps:
+                    step(frame, timestamp)
+        return handler
+
+    def _maybe_detect_person(self, frame: np.ndarray, timestamp: float):
+        """Person detection on the primary camera, at most one pass in flight."""
+        if (self.person_detector.due()
+                and (self._detect_future is None or self._detect_future.done())):
+            # Downscaling here also detaches the frame from the ring slot
+            self._detect_future = self._detect_executor.submit(
+                self._run_person_detection, self.person_detector.downscale(frame)
+            )
+
+    def _run_person_detection(self, frame: np.ndarray):
+        """Runs on the detection worker; reports state changes by signal."""
+        try:
+            state_change = self.person_detector.check(frame)
+            if state_change is not None:
+                self.person_state_changed.emit(state_change)
+        except Exception as e:
+            logger.debug("Person detection error: %s", e)
 
     def _on_person_state_changed(self, present: bool):
         self.person_detected = present
         if present:
             self.person_status_label.setText("Person: DETECTED")
-            self.person_status_label.setStyleSheet("color: #34d17e; font-size: 11px; padding: 2px 0;")
+            _set_style_state(self.person_status_label, "detected")
             logger.info("Person detected - auto-arming")
             if not self.is_armed:
                 self.arm_btn.setChecked(True)
                 self._toggle_armed()
         else:
             self.person_status_label.setText("Person: Not detected")
-            self.person_status_label.setStyleSheet("color: #666; font-size: 11px; padding: 2px 0;")
+            _set_style_state(self.person_status_label, "")
             logger.info("Person left - auto-disarming")
             if self.is_armed and not self.is_recording:
                 self.arm_btn.setChecked(False)
@@ -1986,7 +2478,15 @@ class MainWindow(QMainWindow):
             self._start_recording()
 
     def _on_audio_level(self, level: float):
-        self.audio_level.setValue(int(level * 100))
+        self._pending_audio_level = int(level * 100)
+        if not self._meter_timer.isActive():
+            self._meter_timer.start()
+
+    def _apply_audio_levels(self):
+        # setValue() repaints at once, but is a no-op for an unchanged value
+        self.audio_level.setValue(self._pending_audio_level)
+        self.mic_preview_bar.setValue(self._mic_preview_level)
+        self._update_mic_bar_style()
 
     # ------------------------------------------------------------------
     # Recording
@@ -1997,12 +2497,22 @@ class MainWindow(QMainWindow):
             return
 
         self.is_recording = True
-        self.recording_start_time = time.time()
         self.recorded_frames = {}
+        # Pools only live from trigger to save; np.empty reserves the slots
+        # and pages are committed as frames land. One spare second absorbs
+        # cameras running slightly above nominal fps.
+        pool_seconds = self.config.post_trigger_seconds + 1
+        self.frame_pools = {
+            cam_id: FramePool(pool_seconds, self.config.fps) for cam_id in self.camera_captures
+        }
 
-        # Grab pre-trigger buffers from all cameras that have frames
+        # Switch the capture threads' sinks to the clip first: once that
+        # returns the pre-trigger rings get no new frames until the clip is
+        # saved, so their frames can be taken as views.
+        self._post_trigger_frames = {}
+        self._rebuild_frame_handlers()
         for cam_id, buffer in self.frame_buffers.items():
-            frames = buffer.get_frames()
+            frames = buffer.view_frames()
             if frames:
                 self.recorded_frames[cam_id] = frames
             else:
@@ -2012,20 +2522,25 @@ class MainWindow(QMainWindow):
                 logger.debug("Camera %s has no pre-trigger frames", cam_id)
 
         self.status_label.setText("\u25cf  Recording...")
-        self.status_label.setStyleSheet(
-            "QLabel { background-color: transparent; padding: 4px 8px; font-size: 12px; "
-            "font-weight: 600; color: #e84c3c; }"
-        )
+        _set_style_state(self.status_label, "recording")
+        self.recording_timer.start(int(self.config.post_trigger_seconds * 1000))
         logger.info("Recording started (%d cameras)", len(self.recorded_frames))
 
     def _check_recording(self):
         if self.is_recording:
-            elapsed = time.time() - self.recording_start_time
-            if elapsed >= self.config.post_trigger_seconds:
-                self._stop_recording()
+            self._stop_recording()
 
     def _stop_recording(self):
         self.is_recording = False
+        self.recording_timer.stop()
+        # Detach every sink: the post-trigger lists stop growing and the
+        # pre-trigger rings, whose frames are in the clip, stay untouched
+        # until they are cleared below
+        for capture in self.camera_captures.values():
+            capture.set_frame_sink(None)
+        for cam_id, frames in self._post_trigger_frames.items():
+            self.recorded_frames.setdefault(cam_id, []).extend(frames)
+        self._post_trigger_frames = {}
 
         # Build camera labels from config
         camera_labels = {}
@@ -2036,6 +2551,9 @@ class MainWindow(QMainWindow):
         clip_info = self.recording_manager.save_clip(
             self.recorded_frames, self.config.primary_camera, camera_labels
         )
+        # The clip is encoded; release its frames and the pool slots holding them
+        self.recorded_frames = {}
+        self.frame_pools = {}
 
         if clip_info:
             if self.last_trigger_timestamp:
@@ -2050,13 +2568,11 @@ class MainWindow(QMainWindow):
             self._load_clip_for_playback(len(visible) - 1)
 
         self.status_label.setText("\u25cf  Shot captured! Waiting for next shot...")
-        self.status_label.setStyleSheet(
-            "QLabel { background-color: transparent; padding: 4px 8px; font-size: 12px; "
-            "font-weight: normal; color: #34d17e; }"
-        )
+        _set_style_state(self.status_label, "captured")
 
         for buffer in self.frame_buffers.values():
             buffer.clear()
+        self._rebuild_frame_handlers()
 
         logger.info("Recording stopped, clip saved")
 
@@ -2087,8 +2603,14 @@ class MainWindow(QMainWindow):
                 cv2.circle(out, center, radius, bgr, t, cv2.LINE_AA)
         return out
 
+    def _on_display_image(self, key, image: QImage):
+        # Drop live images that finish after playback took over the player
+        if key == "live" and self._showing_live:
+            self.video_player.display_image(image)
+
     def _update_display(self):
         has_playback = self.playback_frames or (self.playback_multi_view and self.playback_all_frames)
+        self._showing_live = not has_playback
 
         if self.is_playing and has_playback:
             # Animated playback
@@ -2107,26 +2629,27 @@ class MainWindow(QMainWindow):
                     self.pip_window.display_frame(self._render_drawings_on_frame(frame))
 
         else:
-            # Live feed — show one camera at a time
-            visible_cams = {cid: f.copy() for cid, f in self.current_frames.items()
-                           if cid in self.live_visible_cameras}
+            # Live feed — show one camera at a time. These are the capture
+            # threads' ring slots: read them freely, copy before drawing.
+            visible_cams = {cid: f for cid, f in self.current_frames.items()
+                            if cid in self.live_visible_cameras}
 
             if visible_cams:
-                frame = next(iter(visible_cams.values()))
-                if self.is_recording:
-                    cv2.circle(frame, (50, 50), 20, (0, 0, 255), -1)
-                    cv2.putText(frame, "REC", (80, 60),
-                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-                elif self.is_armed:
-                    cv2.circle(frame, (50, 50), 20, (0, 255, 255), -1)
-                    cv2.putText(frame, "ARMED", (80, 60),
-                                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                self.video_player.display_frame(frame)
+                cid, frame = next(iter(visible_cams.items()))
+                size = self.video_player.size()
+                drawn = (cid, self.is_recording, self.is_armed, size.width(), size.height())
+                # Redraw only for a new frame or a changed overlay/size; ticks
+                # with nothing new skip the copy, overlay and conversion
+                if self._display_pending.get(cid, 0) or drawn != self._live_drawn:
+                    self._live_drawn = drawn
+                    self._live_frame = self._draw_live_frame(frame)
+                visible_cams[cid] = self._live_frame
             elif self.camera_captures:
                 placeholder = np.zeros((720, 1280, 3), dtype=np.uint8)
                 cv2.putText(placeholder, "Waiting for camera...", (400, 360),
                             cv2.FONT_HERSHEY_SIMPLEX, 1.2, (74, 158, 255), 2)
                 self.video_player.display_frame(placeholder)
+                self._live_drawn = None
 
             # Update PiP with per-camera frames (with drawings burned in)
             if self.pip_window and self.pip_window.isVisible() and visible_cams:
@@ -2135,11 +2658,31 @@ class MainWindow(QMainWindow):
                         self._render_drawings_on_frame(f), camera_id=str(cid)
                     )
 
+        if not self._showing_live:
+            self._live_drawn = None
+        self._display_pending.clear()
+
         # Keep drawing overlay sized to video player
         self.drawing_overlay.setGeometry(self.video_player.geometry())
         vr = self.video_player.video_rect
         self.drawing_overlay.set_video_rect(*vr)
 
+    def _draw_live_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Queue a live ring-slot frame for display, with the armed/recording
+        badge drawn on a copy, and return what was queued."""
+        if self.is_recording or self.is_armed:
+            frame = frame.copy()
+        if self.is_recording:
+            cv2.circle(frame, (50, 50), 20, (0, 0, 255), -1)
+            cv2.putText(frame, "REC", (80, 60),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        elif self.is_armed:
+            cv2.circle(frame, (50, 50), 20, (0, 255, 255), -1)
+            cv2.putText(frame, "ARMED", (80, 60),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
+        self.display_worker.submit("live", frame, self.video_player.size())
+        return frame
+
     # ------------------------------------------------------------------
     # Playback
     # ------------------------------------------------------------------
@@ -2163,13 +2706,16 @@ class MainWindow(QMainWindow):
             self.playback_slider.blockSignals(False)
             self.frame_label.setText(f"{self.playback_position + 1} / {len(self.playback_frames)}")
 
+    def _playback_interval(self) -> int:
+        """Playback timer interval in ms for the current speed (~30 fps at 1x)."""
+        return max(8, int(33 / self.playback_speed))
+
     def _toggle_playback(self):
         has_frames = self.playback_frames or (self.playback_multi_view and self.playback_all_frames)
         if self.play_btn.isChecked():
             if has_frames:
                 self.is_playing = True
-                interval = max(8, int(33 / self.playback_speed))
-                self.playback_timer.start(interval)
+                self.playback_timer.start(self._playback_interval())
                 self.play_btn.setText("Pause")
         else:
             self.is_playing = False
@@ -2192,10 +2738,9 @@ class MainWindow(QMainWindow):
     def _on_speed_changed(self, index: int):
         self.playback_speed = self.speed_combo.currentData() or 1.0
         self.config.playback_speed = self.playback_speed
-        self._save_debounce_timer.start()
+        self._schedule_save_settings()
         if self.is_playing:
-            interval = max(8, int(33 / self.playback_speed))
-            self.playback_timer.setInterval(interval)
+            self.playback_timer.setInterval(self._playback_interval())
 
     def _step_back(self):
         if not self.playback_frames:
@@ -2260,69 +2805,61 @@ class MainWindow(QMainWindow):
         self.play_btn.setChecked(False)
         self.play_btn.setText("Play")
 
-        # Load all camera angles
+        # Load all camera angles; they arrive in _on_clip_camera_loaded
+        self._cancel_clip_load()
         self.playback_all_frames.clear()
         self.playback_camera_labels = clip.get("camera_labels", {})
         self.playback_multi_view = False
+        self.playback_active_camera = None
+        self.playback_frames = []
+        self._build_angle_buttons(clip)
 
-        try:
-            camera_files = clip.get("camera_files", {})
-            primary_cam_id = None
-
-            if camera_files:
-                for cam_id, filename in camera_files.items():
-                    path = Path(self.recording_manager.session_folder) / filename
-                    if not path.exists():
-                        continue
-                    frames = []
-                    cap = cv2.VideoCapture(str(path))
-                    try:
-                        while True:
-                            ret, frame = cap.read()
-                            if not ret:
-                                break
-                            frames.append(frame)
-                    finally:
-                        cap.release()
-                    if frames:
-                        self.playback_all_frames[cam_id] = frames
-
-                    # Identify the primary camera id (the one whose filename matches clip["file"])
-                    if filename == clip["file"]:
-                        primary_cam_id = cam_id
-            else:
-                # Single camera clip - load from primary file
-                frames = []
-                cap = cv2.VideoCapture(str(clip_path))
-                try:
-                    while True:
-                        ret, frame = cap.read()
-                        if not ret:
-                            break
-                        frames.append(frame)
-                finally:
-                    cap.release()
-                if frames:
-                    self.playback_all_frames["primary"] = frames
-                    primary_cam_id = "primary"
-        except Exception as e:
-            logger.error("Failed to load clip for playback: %s", e)
-            self._clear_playback()
-            return
+        camera_files = clip.get("camera_files", {})
+        if camera_files:
+            folder = Path(self.recording_manager.session_folder)
+            files = [(cam_id, folder / filename) for cam_id, filename in camera_files.items()
+                     if (folder / filename).exists()]
+            # The primary angle (the one whose filename matches clip["file"])
+            # is decoded first so playback can start on it
+            files.sort(key=lambda f: camera_files[f[0]] != clip["file"])
+        else:
+            # Single camera clip - load from primary file
+            files = [("primary", clip_path)]
 
-        # Set active camera to primary
-        self.playback_active_camera = primary_cam_id or (list(self.playback_all_frames.keys())[0] if self.playback_all_frames else None)
+        self.frame_label.setText("Loading...")
+        loader = _ClipLoadThread(files)
+        loader.camera_loaded.connect(
+            lambda cam_id, frames, l=loader: self._on_clip_camera_loaded(l, index, clip, cam_id, frames)
+        )
+        loader.finished.connect(lambda l=loader: self._on_clip_load_finished(l))
+        self._clip_loader = loader
+        _start_background_thread(loader)
+
+    def _on_clip_camera_loaded(self, loader: "_ClipLoadThread", index: int, clip: dict,
+                               cam_id, frames: List[np.ndarray]):
+        if loader is not self._clip_loader:
+            return  # superseded by another clip or by going live
+
+        # Keep angles in the clip's camera order whatever order they land in
+        self.playback_all_frames[cam_id] = frames
+        order = list(clip.get("camera_files", {})) or ["primary"]
+        self.playback_all_frames = {
+            c: self.playback_all_frames[c] for c in order if c in self.playback_all_frames
+        }
 
-        # Set playback_frames to active camera for compatibility
-        if self.playback_active_camera and self.playback_active_camera in self.playback_all_frames:
-            self.playback_frames = self.playback_all_frames[self.playback_active_camera]
-        else:
-            self.playback_frames = []
+        # The first angle to land is the primary one when it exists
+        first = self.playback_active_camera is None
+        if first:
+            self.playback_active_camera = cam_id
+            self.playback_frames = frames
 
-        # Build angle buttons
         self._build_angle_buttons(clip)
+        if self.playback_multi_view and self.multi_view_btn:
+            # Rebuilt button; re-apply the grid with the new angle
+            self.multi_view_btn.setChecked(True)
+            self._toggle_multi_view()
 
-        if self.playback_frames:
+        if first:
             self.playback_position = 0
             self.playback_slider.setMaximum(len(self.playback_frames) - 1)
             self.playback_slider.setValue(0)
@@ -2333,6 +2870,20 @@ class MainWindow(QMainWindow):
             self._toggle_playback()
             self._update_live_btn_style()
 
+    def _on_clip_load_finished(self, loader: "_ClipLoadThread"):
+        if loader is not self._clip_loader:
+            return
+        self._clip_loader = None
+        if not self.playback_all_frames:
+            self.frame_label.setText("0 / 0")
+
+    def _cancel_clip_load(self):
+        if self._clip_loader is not None:
+            self._clip_loader.cancel()
+            self._clip_loader = None
+            if not self.playback_frames:
+                self.frame_label.setText("0 / 0")
+
     # ------------------------------------------------------------------
     # Multi-Angle Playback
     # ------------------------------------------------------------------
@@ -2356,25 +2907,15 @@ class MainWindow(QMainWindow):
 
         self.angle_bar.setVisible(True)
 
-        btn_style = """
-            QPushButton {
-                background-color: #333333; color: #d4d4d4;
-                border: 1px solid #3a3a3a; border-radius: 4px; padding: 4px 12px; font-size: 12px;
-            }
-            QPushButton:hover { background-color: #4d4d4d; }
-            QPushButton:checked { background-color: #4a9eff; color: white; border-color: #4a9eff; }
-        """
-
         # Store cam_id on each button via property for reliable lookup
         labels = clip_info.get("camera_labels", {})
         for cam_id in self.playback_all_frames:
             label = labels.get(cam_id, f"Camera {cam_id}")
             btn = QPushButton(label)
             btn.setCheckable(True)
-            btn.setStyleSheet(btn_style)
             btn.setProperty("cam_id", cam_id)
             btn.clicked.connect(lambda checked, cid=cam_id: self._on_angle_selected(cid))
-            self.angle_bar_layout.addWidget(btn)
+            self.angle_bar_layout.insertWidget(self.angle_bar_layout.count() - 1, btn)
             self.angle_buttons.append(btn)
 
             # Check the active camera button
@@ -2384,11 +2925,8 @@ class MainWindow(QMainWindow):
         # Multi-view button
         self.multi_view_btn = QPushButton("Multi")
         self.multi_view_btn.setCheckable(True)
-        self.multi_view_btn.setStyleSheet(btn_style)
         self.multi_view_btn.clicked.connect(self._toggle_multi_view)
-        self.angle_bar_layout.addWidget(self.multi_view_btn)
-
-        self.angle_bar_layout.addStretch()
+        self.angle_bar_layout.insertWidget(self.angle_bar_layout.count() - 1, self.multi_view_btn)
 
     def _on_angle_selected(self, cam_id: str):
         """Switch active camera angle."""
@@ -2491,25 +3029,20 @@ class MainWindow(QMainWindow):
 
     def _toggle_armed(self):
         self.is_armed = self.arm_btn.isChecked()
+        self._rebuild_frame_handlers()
 
         if self.is_armed:
             self._stop_mic_preview()
             self._start_audio()
             self.arm_btn.setText("Armed")
             self.status_label.setText("\u25cf  Armed - Waiting for shot...")
-            self.status_label.setStyleSheet(
-                "QLabel { background-color: transparent; padding: 4px 8px; font-size: 12px; "
-                "font-weight: normal; color: #f0c040; }"
-            )
+            _set_style_state(self.status_label, "armed")
             logger.info("System armed")
         else:
             self._stop_audio()
             self.arm_btn.setText("Arm")
             self.status_label.setText("\u25cf  Ready - Arm to begin capturing")
-            self.status_label.setStyleSheet(
-                "QLabel { background-color: transparent; padding: 4px 8px; font-size: 12px; "
-                "font-weight: normal; color: #9a9a9a; }"
-            )
+            _set_style_state(self.status_label, "")
             logger.info("System disarmed")
 
     def _manual_trigger(self):
@@ -2527,7 +3060,7 @@ class MainWindow(QMainWindow):
 
         if self.audio_detector:
             self.audio_detector.set_threshold(threshold)
-        self._save_debounce_timer.start()
+        self._schedule_save_settings()
 
     # ------------------------------------------------------------------
     # Drawing Tools
@@ -2563,7 +3096,7 @@ class MainWindow(QMainWindow):
 
     def _on_shapes_changed(self):
         self.config.drawing_overlays = self.drawing_overlay.save_shapes()
-        self._save_debounce_timer.start()
+        self._schedule_save_settings()
 
     # ------------------------------------------------------------------
     # Gallery
@@ -2613,6 +3146,7 @@ class MainWindow(QMainWindow):
         self.gallery.refresh(visible, Path(self.recording_manager.session_folder))
 
     def _clear_playback(self):
+        self._cancel_clip_load()
         self.playback_frames = []
         self.playback_all_frames.clear()
         self.playback_camera_labels.clear()
@@ -2634,16 +3168,8 @@ class MainWindow(QMainWindow):
     def _update_live_btn_style(self):
         """Green when showing live feed, default when a clip is loaded."""
         has_playback = self.playback_frames or (self.playback_multi_view and self.playback_all_frames)
-        if not has_playback:
-            # Active — showing live feed
-            self.live_btn.setStyleSheet(
-                "QPushButton { background-color: #34d17e; color: white; border: 1px solid #34d17e; "
-                "border-radius: 6px; padding: 6px 14px; font-size: 12px; }"
-                "QPushButton:hover { background-color: #2aba6e; }"
-            )
-        else:
-            # Inactive — a clip is loaded
-            self.live_btn.setStyleSheet("")
+        # Active while showing the live feed, inactive while a clip is loaded
+        _set_style_state(self.live_btn, "" if has_playback else "active")
 
     def _rebuild_camera_dropdown(self):
         """Rebuild the camera dropdown menu — single-select camera switcher."""
@@ -2697,6 +3223,7 @@ class MainWindow(QMainWindow):
         """Set a new primary camera, save config, and rebuild dropdown."""
         self.config.primary_camera = camera_id
         save_settings(self.config)
+        self._rebuild_frame_handlers()
         self._rebuild_camera_dropdown()
 
     def _on_camera_visibility_toggled(self, cam_id, checked: bool):
@@ -2735,7 +3262,8 @@ class MainWindow(QMainWindow):
 
     def _on_auto_ready_toggled(self, checked: bool):
         self.config.auto_ready_enabled = checked
-        self._save_debounce_timer.start()
+        self._rebuild_frame_handlers()
+        self._schedule_save_settings()
         logger.info("Auto-ready (person detection): %s", "enabled" if checked else "disabled")
 
     def _retrain_classifier(self):
@@ -2787,6 +3315,7 @@ class MainWindow(QMainWindow):
             self.config.cameras = new_presets
             self.config.primary_camera = primary
             save_settings(self.config)
+            self._rebuild_frame_handlers()
             # Show the active camera if it still exists, otherwise show primary
             if not (self.live_visible_cameras & new_ids):
                 self.live_visible_cameras = {primary}
@@ -2816,6 +3345,7 @@ class MainWindow(QMainWindow):
         base_dir.mkdir(parents=True, exist_ok=True)
         session_name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.config.session_folder = str(base_dir / session_name)
+        self.recording_manager.flush()
         self.recording_manager = RecordingManager(self.config)
 
         self.gallery.refresh([], Path(self.recording_manager.session_folder))
@@ -2835,6 +3365,7 @@ class MainWindow(QMainWindow):
         if session_path == self.config.session_folder:
             return
         self.config.session_folder = session_path
+        self.recording_manager.flush()
         self.recording_manager = RecordingManager(self.config)
         visible = self.recording_manager.get_visible_clips()
         self.gallery.refresh(visible, Path(self.recording_manager.session_folder))
@@ -2926,11 +3457,18 @@ class MainWindow(QMainWindow):
         self.display_timer.stop()
         self.recording_timer.stop()
         self.playback_timer.stop()
+        self.display_worker.stop()
+        loader = self._clip_loader
+        self._cancel_clip_load()
+        if loader is not None:
+            loader.wait(2000)
 
         for capture in list(self.camera_captures.values()):
             capture.stop()
 
         self._stop_audio()
+        self._detect_executor.shutdown(wait=False, cancel_futures=True)
+        self.recording_manager.flush()
 
         if self.pip_window:
             self.pip_window.close()
@@ -26,7 +26,7 @@ class TestAudioFeatureExtractor:
     def test_extract_silence(self):
         """Extracting features from an all-zeros array should yield rms ~0 and peak ~0."""
         silence = np.zeros(44100, dtype=np.float64)
-        features = self.extractor.extract(silence)
+        features = AudioFeatureExtractor.as_dict(self.extractor.extract(silence))
         assert features["rms"] == pytest.approx(0.0, abs=1e-10)
         assert features["peak"] == pytest.approx(0.0, abs=1e-10)
 
@@ -34,7 +34,7 @@ class TestAudioFeatureExtractor:
         """A 1 kHz sine wave should have spectral centroid near 1000 Hz and rms > 0."""
         t = np.arange(44100) / 44100.0
         sine = np.sin(2 * np.pi * 1000 * t)
-        features = self.extractor.extract(sine)
+        features = AudioFeatureExtractor.as_dict(self.extractor.extract(sine))
         assert features["rms"] > 0
         # Spectral centroid should be close to 1000 Hz (allow some FFT bin error)
         assert features["spectral_centroid"] == pytest.approx(1000.0, abs=50.0)
@@ -44,7 +44,7 @@ class TestAudioFeatureExtractor:
         and a fast (low) rise_time."""
         impulse = np.zeros(4096, dtype=np.float64)
         impulse[2048] = 1.0
-        features = self.extractor.extract(impulse)
+        features = AudioFeatureExtractor.as_dict(self.extractor.extract(impulse))
         # Crest factor = peak / rms; for a single spike in 4096 samples this is very large
         assert features["crest_factor"] > 10.0
         # Rise time should be very small (spike goes from 0 to peak instantly)
@@ -52,21 +52,37 @@ class TestAudioFeatureExtractor:
 
     def test_extract_empty(self):
         """An empty array should return all features as 0.0."""
-        features = self.extractor.extract(np.array([], dtype=np.float64))
+        features = AudioFeatureExtractor.as_dict(self.extractor.extract(np.array([], dtype=np.float64)))
         for key, value in features.items():
             assert value == 0.0, f"Expected 0.0 for '{key}', got {value}"
 
     def test_extract_returns_all_keys(self):
-        """Extract should return exactly the 12 documented feature keys."""
+        """Extract should return a 12-element vector covering the documented feature keys."""
         expected_keys = {
             "rms", "peak", "crest_factor", "zcr",
             "spectral_centroid", "spectral_rolloff",
             "energy_0_500", "energy_500_2k", "energy_2k_6k", "energy_6k_plus",
             "impact_ratio", "rise_time",
         }
-        features = self.extractor.extract(np.zeros(1024, dtype=np.float64))
+        vector = self.extractor.extract(np.zeros(1024, dtype=np.float64))
+        assert vector.shape == (12,)
+        assert vector.dtype == np.float32
+        features = AudioFeatureExtractor.as_dict(vector)
         assert set(features.keys()) == expected_keys
 
+    def test_extract_time_then_spectral_matches_extract(self):
+        """extract_time + extract_spectral should reproduce extract(), and
+        extract_time alone should leave the spectral slots at zero."""
+        t = np.arange(4096) / 44100.0
+        sine = np.sin(2 * np.pi * 1000 * t)
+
+        partial = self.extractor.extract_time(sine)
+        assert partial[audio_engine.IDX_RMS] > 0
+        assert partial[audio_engine.IDX_CENTROID] == 0.0
+
+        self.extractor.extract_spectral(sine, partial)
+        np.testing.assert_array_equal(partial, self.extractor.extract(sine))
+
 
 # ---------------------------------------------------------------------------
 # AudioClassifier tests
@@ -107,9 +123,16 @@ class TestAudioClassifier:
         }
 
         classifier = AudioClassifier()
-        confidence = classifier._classify_heuristic(impact_features)
+        confidence = classifier._classify_heuristic(AudioFeatureExtractor.from_dict(impact_features))
         assert confidence > 0.5
 
+    def test_from_dict_missing_rise_time_means_no_attack(self):
+        """A dict without rise_time must not be credited with a fast rise."""
+        features = AudioFeatureExtractor.from_dict({"rms": 0.1})
+        as_dict = AudioFeatureExtractor.as_dict(features)
+        assert as_dict["rise_time"] == 9999
+        assert as_dict["crest_factor"] == 0
+
     def test_classifier_retrain_insufficient_data(self, tmp_path, monkeypatch):
         """retrain() should return False when the training directory has < 10 samples."""
         monkeypatch.setattr(audio_engine, "TRAINING_DATA_DIR", tmp_path)
@@ -5,7 +5,8 @@ import numpy as np
 import pytest
 
 from config import CameraPreset
-from camera_engine import CameraCapture, droidcam_url, PersonDetector
+from camera_engine import CameraCapture, droidcam_url, PersonDetector, with_stream_resolution, _hysteresis
+from camera_engine import _backend_memo, _opencv_backends, _remember_backend
 from camera_engine import test_network_camera as _test_network_camera
 
 
@@ -139,3 +140,163 @@ def test_test_network_camera_failure():
     assert success is False
     assert isinstance(message, str)
     assert len(message) > 0
+
+
+# ---------------------------------------------------------------------------
+# 9. PersonDetector falls back to HOG when no SSD model is installed
+# ---------------------------------------------------------------------------
+
+def test_person_detector_falls_back_to_hog(tmp_path):
+    """Without model files in model_dir the HOG detector should be used."""
+    detector = PersonDetector(model_dir=tmp_path)
+    assert detector.backend == "hog"
+    assert detector.check(np.zeros((480, 640, 3), dtype=np.uint8)) is None
+
+
+# ---------------------------------------------------------------------------
+# 10. DroidCam stream resolution is requested via a WxH query
+# ---------------------------------------------------------------------------
+
+def test_droidcam_stream_resolution():
+    """A resolution adds ?WxH to bare DroidCam URLs and leaves others alone."""
+    assert droidcam_url("10.0.0.5", 640, 480) == "http://10.0.0.5:4747/mjpegfeed?640x480"
+    assert with_stream_resolution("http://10.0.0.5:4747/video", "640x480") == \
+        "http://10.0.0.5:4747/video?640x480"
+    assert with_stream_resolution("http://10.0.0.5:4747/video", "") == "http://10.0.0.5:4747/video"
+    assert with_stream_resolution("rtsp://10.0.0.5/live", "640x480") == "rtsp://10.0.0.5/live"
+
+
+# ---------------------------------------------------------------------------
+# 11. Presence hysteresis needs consecutive hits/misses to flip state
+# ---------------------------------------------------------------------------
+
+def test_presence_hysteresis():
+    """Three detections confirm presence; six misses confirm departure."""
+    cp, ca, present = 0, 0, False
+    changes = []
+    for detected in [True, True, False, True, True, True] + [False] * 6:
+        cp, ca, present, changed = _hysteresis(detected, cp, ca, present, 3, 6)
+        if changed:
+            changes.append(present)
+    assert changes == [True, False]
+    assert present is False
+
+
+# ---------------------------------------------------------------------------
+# 12. A remembered backend is forgotten once the URL fails to open
+# ---------------------------------------------------------------------------
+
+def test_failed_open_forgets_backend():
+    """A stale "mjpeg" entry must not keep the OpenCV backends skipped."""
+    url = "rtsp://127.0.0.1:1/none"
+    _remember_backend(url, "mjpeg")
+    assert _opencv_backends(url) == []
+    ok, _ = _test_network_camera(url)
+    assert not ok
+    assert url not in _backend_memo
+    assert len(_opencv_backends(url)) == 2
+
+
+# ---------------------------------------------------------------------------
+# 13. A frame's transforms come from one snapshot of the settings
+# ---------------------------------------------------------------------------
+
+def test_apply_transforms_uses_frame_snapshot():
+    """A setting changed after the snapshot is left for the next frame, so a
+    frame decoded into the ring slot is never warped onto itself."""
+    cap = CameraCapture(camera_id=0, fps=30, preset=CameraPreset(id=0))
+    cap._use_opencl = False
+    transforms = cap._transform_state()
+    slot = cap._slot_buffer((48, 64, 3))
+    slot[:] = 7
+    cap.set_zoom(2.0)
+    result = cap._apply_transforms(slot, into_ring=True, transforms=transforms)
+    assert result is slot
+    assert (result == 7).all()
+    assert not cap._is_identity(cap._transform_state())
+
+
+# ---------------------------------------------------------------------------
+# 14. Frames the display skips still reach the frame sink
+# ---------------------------------------------------------------------------
+
+class _StubCap:
+    def __init__(self, frame):
+        self.frame = frame
+
+    def retrieve(self, image=None):
+        return True, self.frame.copy()
+
+
+def test_display_skip_still_feeds_sink():
+    """A busy display skips frame_ready, never the buffer/recording sink."""
+    cap = CameraCapture(camera_id=0, fps=30, preset=CameraPreset(id=0))
+    cap.cap = _StubCap(np.zeros((8, 8, 3), np.uint8))
+    sunk, announced = [], []
+    cap.frame_ready.connect(lambda cam, slot, ts: announced.append(ts))
+    cap.set_frame_sink(lambda frame, ts: sunk.append((frame.copy(), ts)))
+
+    cap._process_grabbed(1.0)  # display free: announced and sunk
+    cap._process_grabbed(2.0)  # display busy: sunk only
+    cap._process_grabbed(3.0)
+    assert [ts for _, ts in sunk] == [1.0, 2.0, 3.0]
+    assert announced == [1.0]
+    assert cap.dropped_frames == 2
+
+    cap.mark_frame_consumed()
+    cap.set_frame_sink(None)
+    cap._process_grabbed(4.0)
+    assert announced == [1.0, 4.0]
+    assert len(sunk) == 3
+
+
+# ---------------------------------------------------------------------------
+# 15. A lone HOG window is not a person; overlapping windows are
+# ---------------------------------------------------------------------------
+
+class _StubHog:
+    """Returns the given window corners for the first pyramid level only."""
+
+    def __init__(self, corners):
+        self.corners = [corners]
+
+    def detect(self, img, **kwargs):
+        corners = self.corners.pop() if self.corners else []
+        return np.array(corners, np.int32).reshape(-1, 2), None
+
+
+def test_person_detector_groups_hog_hits(tmp_path):
+    """Hits go through groupRectangles before counting as a person."""
+    detector = PersonDetector(model_dir=tmp_path)
+    frame = np.zeros((240, 320, 3), np.uint8)
+
+    detector.hog = _StubHog([(100, 50)])
+    assert detector._detect(frame) is False
+
+    detector.hog = _StubHog([(100, 50), (104, 54)])
+    assert detector._detect(frame) is True
+
+
+# ---------------------------------------------------------------------------
+# 16. Connects and reconnects open the same resolution-qualified URL
+# ---------------------------------------------------------------------------
+
+def test_reconnect_keeps_stream_resolution(monkeypatch):
+    """_reconnect_loop reopens the URL run() opened, query included."""
+    import camera_engine
+
+    monkeypatch.setattr(camera_engine.time, "sleep", lambda s: None)
+    preset = CameraPreset(id="http://10.0.0.5:4747/video", type="network",
+                          network_resolution="640x480")
+    cap = CameraCapture(camera_id=preset.id, fps=30, preset=preset)
+    opened = []
+
+    class _Opened:
+        def isOpened(self):
+            return True
+
+    cap._open_network_camera = lambda url: opened.append(url) or _Opened()
+    cap.running = True
+    cap._reconnect_loop()
+    assert opened == ["http://10.0.0.5:4747/video?640x480"]
+    assert cap._stream_url() == opened[0]
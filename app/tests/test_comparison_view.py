@@ -42,3 +42,90 @@ def test_offset_calculation():
     offset = -3
     frame_index = position + offset
     assert frame_index == 7
+
+
+# ---------------------------------------------------------------------------
+# 3. ClipFrameSource decodes any frame on demand, in or out of order
+# ---------------------------------------------------------------------------
+
+def _write_clip(path, count, size=(64, 48)):
+    """Write a clip whose frame i is a flat grey of level (i * 8) % 256."""
+    import cv2
+    import numpy as np
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 30, size)
+    for i in range(count):
+        writer.write(np.full((size[1], size[0], 3), (i * 8) % 256, np.uint8))
+    writer.release()
+
+
+def test_clip_frame_source_random_access(tmp_path):
+    """Sequential steps, skips ahead and seeks back all land on the right frame."""
+    import numpy as np
+    from comparison_view import ClipFrameSource
+
+    path = tmp_path / "clip.mp4"
+    _write_clip(path, 30)
+    source = ClipFrameSource(path)
+    assert len(source) == 30
+    assert source.size == (64, 48)
+
+    dst = np.empty((48, 64, 3), np.uint8)
+    for i in [0, 1, 2, 10, 29, 5, 3]:
+        assert source.read(i, dst)
+        assert abs(int(dst[24, 32, 0]) - i * 8) <= 4
+    assert not source.read(30, dst)
+    assert not source.read(-1, dst)
+
+    assert source.set_fit((32, 32))
+    assert source.size == (32, 24)
+    assert source.read(0, np.empty((24, 32, 3), np.uint8))
+    source.release()
+
+    assert len(ClipFrameSource(tmp_path / "missing.mp4")) == 0
+
+
+# ---------------------------------------------------------------------------
+# 4. ClipDecoder is shared per file and decodes requested frames off-thread
+# ---------------------------------------------------------------------------
+
+def _wait_for_frame(decoder, index, timeout=5.0):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        entry = decoder.frame(index)
+        if entry is not None:
+            return entry
+        time.sleep(0.01)
+    return None
+
+
+def test_clip_decoder_shared_and_bounded(tmp_path):
+    """Both viewers get one decoder; its pool never exceeds POOL_SIZE frames."""
+    from comparison_view import ClipDecoder, acquire_decoder, release_decoder, _DECODERS
+
+    path = tmp_path / "clip.mp4"
+    _write_clip(path, ClipDecoder.POOL_SIZE + 20)
+    left = acquire_decoder(path, (32, 32))
+    right = acquire_decoder(path, (32, 32))
+    assert left is right and left.users == 2
+    try:
+        for i in range(0, len(left), 3):
+            left.request("left", i)
+            serial, rgb, image = _wait_for_frame(left, i)
+            assert rgb.shape == (24, 32, 3)
+            assert (image.width(), image.height()) == (32, 24)
+            assert abs(int(rgb[12, 16, 0]) - (i * 8) % 256) <= 4
+        assert len(left._entries) <= ClipDecoder.POOL_SIZE
+
+        right.request("right", 1)
+        assert _wait_for_frame(right, 1) is not None
+        # Read-ahead fills in the frames after a wanted one
+        assert _wait_for_frame(right, 1 + ClipDecoder.READ_AHEAD) is not None
+    finally:
+        release_decoder(left)
+        assert _DECODERS.get(path) is right
+        release_decoder(right)
+    assert path not in _DECODERS
+    assert right.isFinished()
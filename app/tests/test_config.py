@@ -94,6 +94,7 @@ def test_camera_preset_round_trip():
         rotation=90,
         flip_h=True,
         flip_v=False,
+        network_resolution="640x480",
     )
     d = preset.to_dict()
     restored = CameraPreset.from_dict(d)
@@ -105,6 +106,7 @@ def test_camera_preset_round_trip():
     assert restored.rotation == preset.rotation
     assert restored.flip_h == preset.flip_h
     assert restored.flip_v == preset.flip_v
+    assert restored.network_resolution == preset.network_resolution
 
 
 # ---------------------------------------------------------------------------
@@ -199,3 +201,64 @@ def test_primary_camera_accepts_string():
 
     assert cfg.primary_camera == "rtsp://192.168.1.100:554/stream"
     assert isinstance(cfg.primary_camera, str)
+
+
+# ---------------------------------------------------------------------------
+# 11. usb_backend_cache survives JSON's string-only keys
+# ---------------------------------------------------------------------------
+
+def test_usb_backend_cache_round_trip():
+    """Integer index -> backend entries come back as ints after JSON."""
+    cfg = AppConfig()
+    cfg.usb_backend_cache = {0: 700, 3: 1400}
+
+    data = json.loads(json.dumps(cfg.to_dict()))
+    restored = AppConfig()
+    restored.update_from_dict(data)
+
+    assert restored.usb_backend_cache == {0: 700, 3: 1400}
+
+
+# ---------------------------------------------------------------------------
+# 12. dumps_json matches the stdlib encoding
+# ---------------------------------------------------------------------------
+
+def test_dumps_json_round_trip(monkeypatch):
+    """dumps_json output parses back to the same data with or without orjson."""
+    import numpy as np
+
+    data = {"file": "shot_0001.mp4", "camera_files": {"0": "a.mp4"}, "size": (160, 90),
+            "trigger_timestamp": np.float64(12.5)}
+    expected = {"file": "shot_0001.mp4", "camera_files": {"0": "a.mp4"},
+                "size": [160, 90], "trigger_timestamp": 12.5}
+
+    out = config_module.dumps_json(data)
+    assert isinstance(out, bytes)
+    assert json.loads(out) == expected
+
+    monkeypatch.setattr(config_module, "ORJSON_AVAILABLE", False)
+    assert json.loads(config_module.dumps_json(data)) == expected
+
+
+# ---------------------------------------------------------------------------
+# 13. save_settings skips rewriting an unchanged config
+# ---------------------------------------------------------------------------
+
+def test_save_settings_skips_unchanged(tmp_path, monkeypatch):
+    """A second save of the same config leaves the file alone."""
+    settings_file = tmp_path / "settings.json"
+    monkeypatch.setattr(config_module, "SETTINGS_FILE", settings_file)
+
+    cfg = AppConfig()
+    save_settings(cfg)
+    settings_file.write_text("{}")  # marker: survives only if no rewrite
+    save_settings(cfg)
+    assert settings_file.read_text() == "{}"
+
+    cfg.audio_threshold = 0.5
+    save_settings(cfg)
+    assert json.loads(settings_file.read_text())["audio_threshold"] == 0.5
+
+    settings_file.unlink()
+    save_settings(cfg)
+    assert settings_file.exists()
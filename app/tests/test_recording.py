@@ -72,6 +72,125 @@ def test_frame_buffer_clear():
     assert buf.get_frames() == []
 
 
+def test_frame_buffer_snapshot_arrays():
+    """snapshot returns a frame block and a parallel float64 timestamp array."""
+    from recording import FrameBuffer
+
+    buf = FrameBuffer(duration=1.0, fps=4)
+    assert len(buf.snapshot()[1]) == 0
+
+    for i in range(6):
+        buf.add_frame(np.full((10, 12, 3), i, dtype=np.uint8), 50.0 + i)
+
+    frames, stamps = buf.snapshot()
+
+    assert frames.shape == (4, 10, 12, 3)
+    assert stamps.dtype == np.float64
+    np.testing.assert_array_equal(stamps, [52.0, 53.0, 54.0, 55.0])
+    np.testing.assert_array_equal(frames[:, 0, 0, 0], [2, 3, 4, 5])
+
+
+def test_frame_buffer_frames_survive_overwrite():
+    """Frames returned by get_frames are not clobbered by later writes."""
+    from recording import FrameBuffer
+
+    buf = FrameBuffer(duration=1.0, fps=3)
+
+    for i in range(3):
+        buf.add_frame(np.full((8, 8, 3), i, dtype=np.uint8), float(i))
+
+    snapshot = buf.get_frames()
+    for i in range(3, 6):
+        buf.add_frame(np.full((8, 8, 3), i, dtype=np.uint8), float(i))
+
+    assert [int(f[0, 0, 0]) for f, _ in snapshot] == [0, 1, 2]
+
+
+def test_frame_buffer_shape_change_resets():
+    """A new frame shape reallocates the ring and drops older frames."""
+    from recording import FrameBuffer
+
+    buf = FrameBuffer(duration=1.0, fps=4)
+    buf.add_frame(np.zeros((10, 10, 3), dtype=np.uint8), 0.0)
+    buf.add_frame(np.ones((20, 30, 3), dtype=np.uint8), 1.0)
+
+    result = buf.get_frames()
+
+    assert len(result) == 1
+    assert result[0][0].shape == (20, 30, 3)
+    assert result[0][1] == 1.0
+
+
+def test_frame_buffer_concurrent_reader_sees_consistent_frames():
+    """Snapshots taken while another thread writes never contain torn slots."""
+    import threading
+
+    from recording import FrameBuffer
+
+    buf = FrameBuffer(duration=1.0, fps=8)
+    done = threading.Event()
+
+    def produce():
+        for i in range(2000):
+            buf.add_frame(np.full((32, 32, 3), i % 256, dtype=np.uint8), float(i))
+        done.set()
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    while not done.is_set():
+        snapshot = buf.get_frames()
+        stamps = [ts for _, ts in snapshot]
+        assert stamps == sorted(stamps)
+        for frame, ts in snapshot:
+            assert (frame == int(ts) % 256).all()
+    producer.join()
+
+
+def test_raw_chunks_merges_snapshot_frames():
+    """Adjacent snapshot frames are written as larger buffers, bytes unchanged."""
+    from recording import FrameBuffer, _raw_chunks
+
+    buf = FrameBuffer(duration=1.0, fps=10)
+    for i in range(12):
+        buf.add_frame(np.full((4, 6, 3), i, dtype=np.uint8), float(i))
+    frames = buf.get_frames() + [(np.full((4, 6, 3), 99, dtype=np.uint8), 12.0)]
+
+    chunks = list(_raw_chunks(frames, chunk_frames=4))
+
+    assert len(chunks) == 4  # 4 + 4 + 2 snapshot frames, then the loose frame
+    expected = b"".join(frame.tobytes() for frame, _ in frames)
+    assert b"".join(bytes(c) for c in chunks) == expected
+
+
+def test_frame_buffer_view_frames_share_ring():
+    """view_frames() returns the buffered frames in order without copying."""
+    from recording import FrameBuffer, _raw_chunks
+
+    buf = FrameBuffer(duration=1.0, fps=5)
+    for i in range(7):
+        buf.add_frame(np.full((4, 6, 3), i, dtype=np.uint8), float(i))
+
+    frames = buf.view_frames()
+    assert [ts for _, ts in frames] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert all(frame.base is buf._ring for frame, _ in frames)
+    assert [int(frame[0, 0, 0]) for frame, _ in frames] == [2, 3, 4, 5, 6]
+    assert len(list(_raw_chunks(frames))) == 2  # wraps once around the ring
+
+
+def test_frame_pool_slots_and_fallback():
+    """Stored frames share one block until the pool is full, then are copies."""
+    from recording import FramePool, _raw_chunks
+
+    pool = FramePool(duration=1.0, fps=3)
+    stored = [pool.store(np.full((4, 6, 3), i, dtype=np.uint8)) for i in range(4)]
+
+    assert all(f.base is stored[0].base for f in stored[:3])
+    assert stored[3].base is None  # overflow falls back to a plain copy
+    for i, frame in enumerate(stored):
+        assert (frame == i).all()
+    assert len(list(_raw_chunks([(f, 0.0) for f in stored]))) == 2
+
+
 # ============================================================================
 # RecordingManager tests
 # ============================================================================
@@ -180,6 +299,26 @@ def test_get_visible_clips(recording_manager, sample_frames_with_timestamps):
     assert visible[0]["file"] == "shot_0002.mp4"
 
 
+def test_clips_metadata_save_is_debounced(recording_manager, sample_frames_with_timestamps):
+    """Metadata writes are coalesced until the debounce timer or flush()."""
+    recording_manager.SAVE_DEBOUNCE_SECONDS = 60
+    clips_file = Path(recording_manager.session_folder) / "clips.json"
+
+    recording_manager.save_clip({0: sample_frames_with_timestamps}, primary_camera=0)
+    recording_manager.toggle_pin(0)
+    recording_manager.toggle_pin(0)
+    recording_manager.toggle_pin(0)
+
+    assert not clips_file.exists()
+
+    recording_manager.flush()
+
+    saved = json.loads(clips_file.read_text())
+    assert len(saved) == 1
+    assert saved[0]["pinned"] is True
+    assert not clips_file.with_suffix(".tmp").exists()
+
+
 def test_orphan_file_recovery(app_config):
     """_load_existing_clips only picks up primary shot files, not _camX files.
 
@@ -1,5 +1,7 @@
 """Tests for version parsing and comparison."""
 
+import pytest
+
 from version import parse_version, is_newer
 
 
@@ -19,6 +21,16 @@ def test_parse_short_version():
     assert parse_version("1.0") == ((1, 0, 0), "")
 
 
+def test_parse_four_part_version():
+    assert parse_version("1.2.3.4") == ((1, 2, 3), "")
+    assert parse_version("v1.2.3.4-rc1") == ((1, 2, 3), "rc1")
+
+
+def test_parse_invalid_raises():
+    with pytest.raises(ValueError):
+        parse_version("latest")
+
+
 def test_newer_major():
     assert is_newer("2.0.0", "1.0.0") is True
 
@@ -3,6 +3,7 @@ Reusable UI components for ReplaySwing.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -14,7 +15,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QGridLayout, QScrollArea, QMenu, QTextEdit,
     QListWidget, QListWidgetItem,
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QSize, QThread, pyqtSignal
 from PyQt6.QtGui import (
     QImage, QPixmap, QCursor, QColor, QPainter, QPen, QTextCursor, QIcon,
 )
@@ -216,6 +217,87 @@ class SessionListWidget(QWidget):
 # Video Player Widget
 # ============================================================================
 
+def frame_to_rgb(frame: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert a BGR/BGRA/gray frame to packed RGB.
+
+    Writes into dst when it has the right shape, so a caller that keeps the
+    returned array and passes it back converts every frame into one buffer.
+    """
+    h, w = frame.shape[:2]
+    if dst is None or dst.shape != (h, w, 3):
+        dst = np.empty((h, w, 3), np.uint8)
+    if frame.ndim == 2:
+        code = cv2.COLOR_GRAY2RGB
+    elif frame.shape[2] == 4:
+        code = cv2.COLOR_BGRA2RGB
+    else:
+        code = cv2.COLOR_BGR2RGB
+    return cv2.cvtColor(frame, code, dst=dst)
+
+
+def rgb_to_qimage(rgb_frame: np.ndarray, size: QSize) -> QImage:
+    """Scale a packed RGB frame to fit size; the result owns its pixels."""
+    h, w, ch = rgb_frame.shape
+    q_img = QImage(rgb_frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
+    scaled = q_img.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+    # An unscaled result still shares rgb_frame's memory; detach it
+    return q_img.copy() if scaled.size() == q_img.size() else scaled
+
+
+def frame_to_qimage(frame: np.ndarray, size: QSize) -> QImage:
+    """Convert a BGR/BGRA/gray frame to an RGB QImage scaled to fit size."""
+    return rgb_to_qimage(frame_to_rgb(frame), size)
+
+
+class DisplayWorker(QThread):
+    """Converts frames to display-ready QImages off the GUI thread.
+
+    Each key has a one-frame mailbox: submit() replaces whatever is still
+    waiting, so a slow conversion drops stale frames instead of queueing
+    them. Images are delivered through image_ready on the GUI thread.
+    """
+
+    image_ready = pyqtSignal(object, QImage)  # key, image
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: Dict = {}  # key -> (frame, size)
+        self._rgb_bufs: Dict = {}  # key -> RGB buffer, only touched by run()
+        self._cond = threading.Condition()
+        self._running = True
+
+    def submit(self, key, frame: np.ndarray, size: QSize):
+        with self._cond:
+            self._pending[key] = (frame, QSize(size))
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                jobs, self._pending = self._pending, {}
+            for key, (frame, size) in jobs.items():
+                try:
+                    rgb = frame_to_rgb(frame, self._rgb_bufs.get(key))
+                    self._rgb_bufs[key] = rgb
+                    self.image_ready.emit(key, rgb_to_qimage(rgb, size))
+                except Exception as e:
+                    logger.debug("Display conversion failed for %s: %s", key, e)
+
+
 class VideoPlayer(QLabel):
     """Widget for displaying video frames with overlay support."""
 
@@ -237,25 +319,10 @@ class VideoPlayer(QLabel):
             return
 
         self._last_frame = frame
+        self.display_image(frame_to_qimage(frame, self.size()))
 
-        # Handle non-3-channel frames
-        if frame.ndim == 2:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
-        elif frame.shape[2] == 4:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
-        else:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        h, w, ch = rgb_frame.shape
-        bytes_per_line = ch * w
-
-        q_img = QImage(rgb_frame.tobytes(), w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        scaled = q_img.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-
+    def display_image(self, scaled: QImage):
+        """Show an image already converted and scaled by frame_to_qimage()."""
         # Calculate video rect position (centered)
         sx = (self.width() - scaled.width()) // 2
         sy = (self.height() - scaled.height()) // 2
@@ -381,6 +448,7 @@ class PiPWindow(QWidget):
         self._resize_edge = None  # which edge(s) are being dragged
         self._resize_origin = None  # starting geometry for resize
         self._video_panels: Dict[str, QLabel] = {}  # cam_id -> QLabel
+        self._rgb_bufs: Dict = {}  # cam_id -> reused RGB conversion buffer
         self._visible_cameras: List[str] = []
         self._pip_zoom = 1.0  # scroll wheel zoom (1.0 = fit, >1 = crop center)
 
@@ -409,6 +477,7 @@ class PiPWindow(QWidget):
         for cid in list(self._video_panels.keys()):
             if cid not in new_ids:
                 panel = self._video_panels.pop(cid)
+                self._rgb_bufs.pop(cid, None)
                 self._panels_layout.removeWidget(panel)
                 panel.deleteLater()
 
@@ -458,15 +527,14 @@ class PiPWindow(QWidget):
         # Apply PiP zoom crop
         frame = self._apply_zoom_crop(frame)
 
-        if frame.ndim == 2:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2RGB)
-        elif frame.shape[2] == 4:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2RGB)
-        else:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # QImage wraps the buffer without copying; every pixmap below is
+        # made before this returns, so the buffer can be reused next frame
+        key = str(camera_id) if camera_id else None
+        rgb_frame = frame_to_rgb(frame, self._rgb_bufs.get(key))
+        self._rgb_bufs[key] = rgb_frame
         h, w, ch = rgb_frame.shape
         bytes_per_line = ch * w
-        q_img = QImage(rgb_frame.tobytes(), w, h, bytes_per_line, QImage.Format.Format_RGB888)
+        q_img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
 
         if camera_id and str(camera_id) in self._video_panels:
             panel = self._video_panels[str(camera_id)]
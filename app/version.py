@@ -1,24 +1,26 @@
 """Version info for ReplaySwing."""
 
+import re
+
 __version__ = "0.3.0-beta"
 
 
+_VERSION_RE = re.compile(r"^v?(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:\.\d+)*(?:-(.+))?$")
+
+
 def parse_version(v: str):
     """Parse 'vX.Y.Z-suffix' into ((X, Y, Z), suffix).
 
-    Strips leading 'v', splits on '-' for suffix.
+    Leading 'v' is optional, minor/patch default to 0 and components past
+    the patch number (e.g. '1.2.3.4') are ignored.
     Returns ((major, minor, patch), suffix_or_empty_string).
+    Raises ValueError for strings that aren't version-shaped.
     """
-    v = v.lstrip("v")
-    if "-" in v:
-        num_part, suffix = v.split("-", 1)
-    else:
-        num_part, suffix = v, ""
-    parts = tuple(int(x) for x in num_part.split("."))
-    # Pad to 3 elements
-    while len(parts) < 3:
-        parts = parts + (0,)
-    return parts[:3], suffix
+    m = _VERSION_RE.match(v)
+    if m is None:
+        raise ValueError(f"Invalid version string: {v!r}")
+    major, minor, patch, suffix = m.groups()
+    return (int(major), int(minor or 0), int(patch or 0)), suffix or ""
 
 
 def is_newer(remote: str, local: str) -> bool: